@@ -0,0 +1,98 @@
+"""
+Single-row commit latency with SQLite's default settings versus tkc.SQLITE_PRAGMAS.
+
+Each profile runs in its own interpreter against a fresh temporary database so the
+two DataManagers never share a connection. Run from the repository root:
+
+    python -m benchmarks.commit_latency --rows 500
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+import tracker_config as tkc
+
+PROFILES: Dict[str, dict] = {
+    'default': {},
+    'tuned': tkc.SQLITE_PRAGMAS,
+}
+
+
+def latency_summary(latencies_ms: List[float]) -> Dict[str, float]:
+    """
+    Summarises a list of latencies.
+
+    Args:
+        latencies_ms (List[float]): Latencies in milliseconds.
+
+    Returns:
+        Dict[str, float]: Mean and p50/p95/p99 in milliseconds.
+    """
+    cuts = statistics.quantiles(latencies_ms, n=100) if len(latencies_ms) > 1 else latencies_ms * 99
+    return {
+        'mean_ms': statistics.fmean(latencies_ms),
+        'p50_ms': cuts[49],
+        'p95_ms': cuts[94],
+        'p99_ms': cuts[98],
+    }
+
+
+def measure(profile: str, rows: int) -> Dict[str, float]:
+    """
+    Times one autocommitted insert_into_beck_table call per row.
+
+    Args:
+        profile (str): The key of the profile in PROFILES.
+        rows (int): The number of rows to commit.
+
+    Returns:
+        Dict[str, float]: The latency summary.
+    """
+    from PyQt6.QtCore import QCoreApplication
+    from database.connections import connections
+    from database.database_manager import DataManager
+
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv[:1])
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'bench.db')
+        manager = DataManager(path, pragmas=PROFILES[profile])
+        latencies: List[float] = []
+        for _ in range(rows):
+            started = time.perf_counter()
+            manager.insert_into_beck_table('2024-01-01', '10:00:00', *([1] * 13))
+            latencies.append((time.perf_counter() - started) * 1000.0)
+        manager.close()
+        del manager
+        connections.release(path)
+    return latency_summary(latencies)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=500)
+    parser.add_argument('--profile', choices=sorted(PROFILES))
+    args = parser.parse_args()
+
+    if args.profile:
+        print(json.dumps(measure(args.profile, args.rows)))
+        return
+
+    results = {}
+    for profile in PROFILES:
+        output = subprocess.run(
+            [sys.executable, '-m', 'benchmarks.commit_latency',
+             '--rows', str(args.rows), '--profile', profile],
+            check=True, capture_output=True, text=True).stdout
+        results[profile] = json.loads(output.strip().splitlines()[-1])
+    results['speedup_p50'] = results['default']['p50_ms'] / max(results['tuned']['p50_ms'], 1e-9)
+    print(json.dumps({'benchmark': 'commit_latency', 'rows': args.rows, 'results': results}, indent=2))
+
+
+if __name__ == '__main__':
+    main()
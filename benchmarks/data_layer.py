@@ -0,0 +1,179 @@
+"""
+Data-layer benchmarks: DataManager, the table model, deletes, export and import at several table sizes.
+
+Every size gets a fresh temporary database filled with synthetic Beck exams ten
+minutes apart. Per size it measures the batch insert that seeds the table, single
+autocommitted inserts, the table model's select() and a jump to the middle row of
+the table (past the fetched pages), delete_selected_rows over a selection and
+restoring those rows, purging them again through compaction, and export and
+import rates. Run from the repository root:
+
+    python -m benchmarks.data_layer --sizes 1000 100000 1000000 > data_layer.json
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+from typing import Dict, Iterator, List
+
+from benchmarks.commit_latency import latency_summary
+
+FIRST_EXAM: int = 1577836800  # 2020-01-01 00:00:00 UTC
+EXAM_SPACING: int = 600
+
+
+def beck_rows(count: int, start: int = 0, seed: int = 7) -> Iterator[tuple]:
+    """
+    Generates synthetic beck_table rows with distinct, increasing timestamps.
+
+    Args:
+        count (int): The number of rows.
+        start (int): The position of the first row in the sequence.
+        seed (int): The random seed for the item scores.
+
+    Yields:
+        tuple: A row in BECK_COLUMNS order.
+    """
+    scores = random.Random(seed)
+    for position in range(start, start + count):
+        moment = time.gmtime(FIRST_EXAM + position * EXAM_SPACING)
+        items = [scores.randint(0, 3) for _ in range(12)]
+        yield (time.strftime('%Y-%m-%d', moment), time.strftime('%H:%M:%S', moment), *items, sum(items))
+
+
+def _rate(rows: int, seconds: float) -> float:
+    return rows / seconds if seconds > 0 else float(rows)
+
+
+def measure(size: int, directory: str, samples: int, delete_rows: int) -> Dict[str, object]:
+    """
+    Runs every data-layer measurement against one fresh database of `size` rows.
+
+    Args:
+        size (int): The number of rows seeded.
+        directory (str): Where the temporary databases go.
+        samples (int): The number of single inserts timed.
+        delete_rows (int): The number of rows selected and deleted.
+
+    Returns:
+        Dict[str, object]: The measurements of this size.
+    """
+    from PyQt6.QtCore import QItemSelectionModel, QModelIndex
+    from PyQt6.QtWidgets import QTableView
+    from database.connections import connections
+    from database.database_manager import DataManager
+    from database.database_utility.delete_records import delete_selected_rows
+    from database.database_utility.paged_table_model import PagedTableModel
+    from database.export_worker import iter_row_chunks
+    from database.exporter import export_rows
+    from database.importer import Importer
+    from database.schema import TABLE_COLUMNS
+
+    results: Dict[str, object] = {'rows': size}
+    manager = DataManager(os.path.join(directory, f'bench_{size}.db'))
+
+    seeded = manager.insert_many_beck(beck_rows(size))
+    results['batch_insert'] = {'rows': seeded.rows, 'seconds': seeded.seconds,
+                               'rows_per_second': seeded.rows_per_second}
+
+    latencies: List[float] = []
+    for row in beck_rows(samples, start=size):
+        started = time.perf_counter()
+        manager.insert_into_beck_table(*row)
+        latencies.append((time.perf_counter() - started) * 1000.0)
+    results['single_insert'] = latency_summary(latencies)
+
+    model = PagedTableModel('beck_table', manager.db)
+    started = time.perf_counter()
+    model.select()
+    selected = time.perf_counter()
+    # rowCount() only covers the pages fetched so far; the middle of the table is
+    # reached through the model's keyset page lookup, as a jump scroll would.
+    middle = model.total_rows() // 2
+    if model.row_id(middle) is None:
+        raise RuntimeError(f"row {middle} of {model.total_rows()} could not be read")
+    results['model'] = {'select_ms': (selected - started) * 1000.0,
+                        'middle_row': middle,
+                        'middle_page_ms': (time.perf_counter() - selected) * 1000.0}
+
+    manager.notifier.rowsDeleted.connect(model.apply_deleted)
+    view = QTableView()
+    view.setModel(model)
+    selection = view.selectionModel()
+    # Only fetched rows can be selected; page in enough of them first.
+    while model.rowCount() < delete_rows and model.canFetchMore(QModelIndex()):
+        model.fetchMore(QModelIndex())
+    for row in range(min(delete_rows, model.rowCount())):
+        selection.select(model.index(row, 0),
+                         QItemSelectionModel.SelectionFlag.Select | QItemSelectionModel.SelectionFlag.Rows)
+    window = SimpleNamespace(view=view, model=model)
+    deleted_ids = [model.row_id(index.row()) for index in selection.selectedRows()]
+    started = time.perf_counter()
+    delete_selected_rows(window, 'view', 'model', manager.delete_rows)
+    seconds = time.perf_counter() - started
+    results['delete_selected'] = {'rows': len(deleted_ids), 'ms': seconds * 1000.0,
+                                  'rows_per_second': _rate(len(deleted_ids), seconds)}
+
+    started = time.perf_counter()
+    manager.restore_rows('beck_table', deleted_ids)
+    seconds = time.perf_counter() - started
+    results['restore_deleted'] = {'rows': len(deleted_ids), 'ms': seconds * 1000.0,
+                                  'rows_per_second': _rate(len(deleted_ids), seconds)}
+
+    # Tombstone the selection again and purge it: the chunked hard DELETE of compaction.
+    manager.delete_rows('beck_table', deleted_ids)
+    started = time.perf_counter()
+    purged = manager.compact(retention_days=-1)
+    seconds = time.perf_counter() - started
+    results['compact'] = {'rows': purged, 'ms': seconds * 1000.0,
+                          'rows_per_second': _rate(purged or 0, seconds)}
+
+    export_path = os.path.join(directory, f'bench_{size}.csv')
+    started = time.perf_counter()
+    written = export_rows(export_path, ('id',) + TABLE_COLUMNS['beck_table'],
+                          iter_row_chunks(manager.db, 'beck_table'))
+    seconds = time.perf_counter() - started
+    results['export_csv'] = {'rows': written, 'seconds': seconds, 'rows_per_second': _rate(written, seconds),
+                             'bytes': os.path.getsize(export_path)}
+
+    target = DataManager(os.path.join(directory, f'import_{size}.db'))
+    imported = Importer(target).run(export_path, 'beck_table')
+    results['import_csv'] = {'rows': imported.inserted, 'seconds': imported.seconds,
+                             'rows_per_second': _rate(imported.read, imported.seconds)}
+
+    view.setModel(None)
+    del window, view, selection, model
+    manager.close()
+    target.close()
+    del manager, target
+    connections.release(os.path.join(directory, f'bench_{size}.db'))
+    connections.release(os.path.join(directory, f'import_{size}.db'))
+    os.remove(export_path)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 100000, 1000000])
+    parser.add_argument('--samples', type=int, default=200, help="single inserts timed per size")
+    parser.add_argument('--delete-rows', type=int, default=100, help="rows selected and deleted per size")
+    args = parser.parse_args()
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+    from PyQt6.QtWidgets import QApplication
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for size in args.sizes:
+            results.append(measure(size, directory, args.samples, args.delete_rows))
+    print(json.dumps({'benchmark': 'data_layer', 'python': sys.version.split()[0],
+                      'results': results}, indent=2))
+
+
+if __name__ == '__main__':
+    main()
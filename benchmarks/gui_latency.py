@@ -0,0 +1,136 @@
+"""
+Interactive latency of MainWindow under the offscreen platform: sliders, page switches, commit and delete.
+
+The window runs against a database in a temporary home directory, optionally
+seeded with synthetic exams. Every scripted event is timed from the call until
+the event loop has nothing left to do for it; commits and deletes go through the
+background writer, so they are timed until the table model shows the change. Run
+from the repository root:
+
+    python -m benchmarks.gui_latency --rows 100000 --rounds 20
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List
+
+from benchmarks.commit_latency import latency_summary
+from benchmarks.data_layer import beck_rows
+
+BECK_SLIDERS = ('sadness', 'outlook', 'guilt', 'solitude', 'sexdrive', 'hygiene', 'decisiveness',
+                'effort', 'interest', 'pessimism', 'victimhood', 'sleep')
+ALTMAN_SLIDERS = ('altmans_sleep', 'altmans_speech', 'altmans_activity', 'altmans_cheer', 'altmans_confidence')
+PAGE_SWITCHES = ('switch_to_page0', 'switch_to_page1', 'switch_to_page2', 'switch_to_page4')
+
+
+def wait_until(app, condition: Callable[[], bool], timeout: float = 10.0) -> bool:
+    """
+    Processes events until a condition holds.
+
+    Args:
+        app (QApplication): The running application.
+        condition (Callable[[], bool]): Checked after every round of events.
+        timeout (float): Seconds before giving up.
+
+    Returns:
+        bool: Whether the condition was met in time.
+    """
+    deadline = time.perf_counter() + timeout
+    while not condition():
+        if time.perf_counter() > deadline:
+            return False
+        app.processEvents()
+    return True
+
+
+def run(rows: int, rounds: int) -> Dict[str, Dict[str, float]]:
+    """
+    Builds MainWindow over a database of `rows` exams and scripts `rounds` of every interaction.
+
+    Args:
+        rows (int): The number of Beck exams seeded before the window opens.
+        rounds (int): The number of repetitions of every interaction.
+
+    Returns:
+        Dict[str, Dict[str, float]]: Latency summaries per interaction.
+    """
+    from PyQt6.QtWidgets import QApplication
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    if rows:
+        from database.database_manager import DataManager, target_db_path
+
+        seeder = DataManager(target_db_path)
+        seeder.insert_many_beck(beck_rows(rows))
+        seeder.close()
+        del seeder
+
+    from ui.main_window import MainWindow
+
+    started = time.perf_counter()
+    window = MainWindow()
+    window.show()
+    app.processEvents()
+    latencies: Dict[str, List[float]] = {'startup': [(time.perf_counter() - started) * 1000.0]}
+
+    def timed(name: str, action: Callable[[], None], done: Callable[[], bool] = lambda: True) -> None:
+        began = time.perf_counter()
+        action()
+        app.processEvents()
+        if not wait_until(app, done):
+            raise RuntimeError(f"{name} did not complete")
+        latencies.setdefault(name, []).append((time.perf_counter() - began) * 1000.0)
+
+    for _ in range(rounds):
+        for name in PAGE_SWITCHES:
+            timed(f'page:{name}', getattr(window, name))
+
+        window.switch_to_page0()
+        for name in BECK_SLIDERS:
+            slider = getattr(window, name)
+            for value in list(range(slider.minimum(), slider.maximum() + 1)) + [0]:
+                timed('slider:beck', lambda: slider.setValue(value))
+        window.switch_to_page1()
+        for name in ALTMAN_SLIDERS:
+            slider = getattr(window, name)
+            for value in list(range(slider.minimum(), slider.maximum() + 1)) + [0]:
+                timed('slider:altman', lambda: slider.setValue(value))
+
+        window.switch_to_page4()
+        app.processEvents()
+        model = window.becks_model
+        before = model.total_rows()
+        window.switch_to_page0()
+        timed('commit:beck', window.actionCommit.trigger, lambda: model.total_rows() == before + 1)
+
+        window.switch_to_page4()
+        window.beck_tableview.selectRow(0)
+        before = model.total_rows()
+        timed('delete:beck', window.actionDelete.trigger, lambda: model.total_rows() == before - 1)
+
+    window.close()
+    app.processEvents()
+    return {name: latency_summary(values) for name, values in latencies.items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=0, help="Beck exams seeded before the window opens")
+    parser.add_argument('--rounds', type=int, default=20)
+    args = parser.parse_args()
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+    with tempfile.TemporaryDirectory() as home:
+        # The app keeps its database, log and settings under the home directory.
+        os.environ['HOME'] = home
+        os.environ['XDG_CONFIG_HOME'] = os.path.join(home, '.config')
+        results = run(args.rows, args.rounds)
+    print(json.dumps({'benchmark': 'gui_latency', 'rows': args.rows, 'rounds': args.rounds,
+                      'results': results}, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+"""
+Window construction and style recomputation with one shared style sheet versus per-slider sheets.
+
+The per-slider layout is rebuilt from ui/main_ui/styles/app.qss: the window gets the
+sheet without the accent rules, as gui.py used to set it, and every accented slider
+gets its own copy of its accent rules with the property selector removed. Both
+layouts run in the same offscreen QApplication, alternating window by window. Run from the
+repository root:
+
+    python -m benchmarks.stylesheet_loading --runs 30
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from typing import Dict, List
+
+from benchmarks.commit_latency import latency_summary
+
+ACCENT_RULE = re.compile(r'QSlider\[accent="([\w-]+)"\]')
+
+
+def split_stylesheet(text: str) -> Dict[str, str]:
+    """
+    Splits the shared sheet into the window part and one legacy sheet per accent.
+
+    Args:
+        text (str): The shared style sheet.
+
+    Returns:
+        Dict[str, str]: '' maps to the window part; every accent to its rules with a bare QSlider selector.
+    """
+    sheets: Dict[str, str] = {'': ''}
+    for line in text.splitlines(keepends=True):
+        match = ACCENT_RULE.match(line)
+        if match:
+            sheets[match.group(1)] = sheets.get(match.group(1), '') + ACCENT_RULE.sub('QSlider', line, count=1)
+        else:
+            sheets[''] += line
+    return sheets
+
+
+def measure(runs: int) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """
+    Builds, shows and re-polishes the main window UI `runs` times in each layout, alternating.
+
+    Args:
+        runs (int): The number of windows built per layout.
+
+    Returns:
+        Dict[str, Dict[str, Dict[str, float]]]: Per layout ('shared', 'per_slider'), latency
+        summaries for 'setup', 'first_show' and 'restyle'.
+    """
+    from PyQt6.QtWidgets import QApplication, QMainWindow, QSlider, QWidget
+    from ui.main_ui.gui import Ui_MainWindow
+    from ui.main_ui.res import stylesheet
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    shared = stylesheet()
+    sheets = split_stylesheet(shared)
+    timings: Dict[str, Dict[str, List[float]]] = {
+        layout: {'setup': [], 'first_show': [], 'restyle': []} for layout in ('shared', 'per_slider')}
+
+    def build(layout: str) -> None:
+        window = QMainWindow()
+
+        def setup() -> None:
+            if layout == 'shared':
+                window.setStyleSheet(shared)
+                Ui_MainWindow().setupUi(window)
+                return
+            window.setStyleSheet(sheets[''])
+            Ui_MainWindow().setupUi(window)
+            for slider in window.findChildren(QSlider):
+                accent = slider.property('accent')
+                if accent:
+                    slider.setStyleSheet(sheets[accent])
+
+        def show() -> None:
+            window.show()
+            app.processEvents()
+
+        def restyle() -> None:
+            style = window.style()
+            for widget in [window] + window.findChildren(QWidget):
+                style.unpolish(widget)
+                style.polish(widget)
+
+        for key, action in (('setup', setup), ('first_show', show), ('restyle', restyle)):
+            started = time.perf_counter()
+            action()
+            timings[layout][key].append((time.perf_counter() - started) * 1000.0)
+        window.close()
+        window.deleteLater()
+        app.processEvents()
+
+    for _ in range(runs):
+        for layout in timings:
+            build(layout)
+    return {layout: {key: latency_summary(values) for key, values in phases.items()}
+            for layout, phases in timings.items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=30)
+    args = parser.parse_args()
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+    results = measure(args.runs)
+    results['speedup_p50'] = {key: results['per_slider'][key]['p50_ms'] / max(results['shared'][key]['p50_ms'], 1e-9)
+                              for key in results['shared']}
+    print(json.dumps({'benchmark': 'stylesheet_loading', 'runs': args.runs, 'results': results}, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -67,6 +67,5 @@ def reset_altman_scribes(main_window_instance, widget_names):
         getattr(main_window_instance, widget_names['altmans_cheer']).setValue(0)
         getattr(main_window_instance, widget_names['altmans_confidence']).setValue(0)
         getattr(main_window_instance, widget_names['altmans_summary']).setValue(0)
-        getattr(main_window_instance, widget_names['model']).select()
     except Exception as e:
         logger.error(f"Error resetting pain levels form: {e}")
@@ -0,0 +1,341 @@
+import math
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+from PyQt6.QtSql import QSqlDatabase, QSqlQuery
+
+from database.connections import connections, target_db_path
+from database.rollups import ROLLUP_TABLES, metric_columns, rollup_columns
+from database.schema import EDIT_COUNTS_TABLE, LIVE_VIEWS, SUMMARY_COLUMNS, TIMESTAMP_COLUMNS
+from logger_setup import logger
+
+SECONDS_PER_DAY: int = 86400
+
+
+def rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Computes a trailing rolling mean with a cumulative sum.
+
+    The first window - 1 positions average over the values seen so far.
+
+    Args:
+        values (np.ndarray): A 1-D array of scores.
+        window (int): The number of observations per window.
+
+    Returns:
+        np.ndarray: The rolling means, the same length as values.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if window < 1:
+        raise ValueError("window must be at least 1")
+    sums = np.cumsum(values)
+    sums[window:] = sums[window:] - sums[:-window]
+    counts = np.minimum(np.arange(1, values.size + 1), window)
+    return sums / counts
+
+
+def ewma(values: np.ndarray, alpha: float) -> np.ndarray:
+    """
+    Computes an exponentially weighted moving average without a Python loop per value.
+
+    Each output is sum(w_k * x_k) / sum(w_k) with w_k = (1 - alpha) ** (t - k). Within a
+    block the weights are rescaled so both sums become cumulative sums; blocks are sized
+    so the rescaled weights cannot overflow, and each block carries the previous block's
+    decayed sums forward.
+
+    Args:
+        values (np.ndarray): A 1-D array of scores, oldest first.
+        alpha (float): The smoothing factor, 0 < alpha <= 1.
+
+    Returns:
+        np.ndarray: The weighted averages, the same length as values.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if not 0.0 < alpha <= 1.0:
+        raise ValueError("alpha must be in (0, 1]")
+    if alpha == 1.0 or values.size == 0:
+        return values.copy()
+    decay = 1.0 - alpha
+    block = max(1, int(600.0 / -math.log(decay)))
+    result = np.empty_like(values)
+    numerator = denominator = 0.0
+    for start in range(0, values.size, block):
+        chunk = values[start:start + block]
+        steps = np.arange(chunk.size)
+        growth = decay ** -steps
+        falloff = decay ** steps
+        carry = decay ** (steps + 1)
+        numerators = np.cumsum(chunk * growth) * falloff + numerator * carry
+        denominators = np.cumsum(growth) * falloff + denominator * carry
+        result[start:start + chunk.size] = numerators / denominators
+        numerator, denominator = numerators[-1], denominators[-1]
+    return result
+
+
+def daily_means(timestamps: np.ndarray, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Averages scores per calendar day (UTC, matching the rollup buckets).
+
+    Args:
+        timestamps (np.ndarray): Epoch seconds, one per score.
+        values (np.ndarray): The scores.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The day numbers (days since the epoch) and the mean score of each day.
+    """
+    days, positions = np.unique(timestamps // SECONDS_PER_DAY, return_inverse=True)
+    sums = np.bincount(positions, weights=values, minlength=days.size)
+    counts = np.bincount(positions, minlength=days.size)
+    return days, sums / counts
+
+
+class ExamAnalytics:
+    """
+    Vectorized statistics over the exam history, loaded column-wise into NumPy arrays.
+
+    Each table is read with one bulk SELECT and the arrays, along with every statistic
+    derived from them, are cached against the table version. The version changes with
+    every insert, delete and edit, including date and time edits that reorder the
+    history, so repeated calls are free until the table changes.
+
+    Attributes:
+        db_name (str): The database the history is read from, through the calling
+            thread's read-only reader.
+    """
+
+    def __init__(self, db_name: str = target_db_path) -> None:
+        self.db_name: str = db_name
+        self._cache: Dict[str, Tuple[tuple, Dict[str, np.ndarray], Dict[Any, Any]]] = {}
+
+    @property
+    def db(self) -> QSqlDatabase:
+        """
+        Returns the calling thread's reader of the database, reopening it if the pool closed it.
+
+        Returns:
+            QSqlDatabase: The read-only connection.
+        """
+        return connections.reader(self.db_name)
+
+    def table_version(self, table: str) -> tuple:
+        """
+        Returns a cheap fingerprint of a table's contents.
+
+        The newest id catches inserts; the row count and score totals come from the
+        monthly rollup (a few hundred rows at most) and catch deletions; the
+        trigger-maintained edit count catches every update, including date and time
+        edits that change none of the others.
+
+        Args:
+            table (str): The exam table.
+
+        Returns:
+            tuple: The fingerprint.
+        """
+        totals = ', '.join(f"total({column})" for column in rollup_columns(table)
+                           if column.endswith('_sum'))
+        query = QSqlQuery(self.db)
+        query.setForwardOnly(True)
+        sql = (f"SELECT (SELECT max(id) FROM {table}), "
+               f"(SELECT edits FROM {EDIT_COUNTS_TABLE} WHERE name = '{table}'), total(n), {totals} "
+               f"FROM {ROLLUP_TABLES[table]} WHERE period = 'month'")
+        if not query.exec(sql) or not query.next():
+            logger.error(f"Error reading table version: {table} - {query.lastError().text()}")
+            return ()
+        version = tuple(query.value(i) for i in range(query.record().count()))
+        query.finish()
+        return version
+
+    def columns(self, table: str) -> Dict[str, np.ndarray]:
+        """
+        Returns the table as one array per column, oldest exam first.
+
+        Keys are 'id', 'timestamp' and every item and summary column. Rows without a
+        parseable date and time, and soft-deleted rows, are left out.
+
+        Args:
+            table (str): The exam table.
+
+        Returns:
+            Dict[str, np.ndarray]: The column arrays.
+        """
+        return self._entry(table)[1]
+
+    def _entry(self, table: str) -> Tuple[tuple, Dict[str, np.ndarray], Dict[Any, Any]]:
+        version = self.table_version(table)
+        entry = self._cache.get(table)
+        if entry is None or entry[0] != version:
+            entry = (version, self._load(table), {})
+            self._cache[table] = entry
+        return entry
+
+    def _load(self, table: str) -> Dict[str, np.ndarray]:
+        """
+        Reads a table with one SELECT that returns every column as a single comma-joined value.
+
+        Shipping one value per column instead of one per cell keeps the per-row cost
+        inside SQLite; NumPy then parses each column in one call.
+        """
+        timestamp = TIMESTAMP_COLUMNS[table]
+        metrics = metric_columns(table)
+        aggregates = ', '.join(["group_concat(id)", f"group_concat({timestamp})"]
+                               + [f"group_concat(coalesce({column}, 'nan'))" for column in metrics])
+        sql = (f"SELECT count(*), {aggregates} FROM "
+               f"(SELECT id, {timestamp}, {', '.join(metrics)} FROM {LIVE_VIEWS[table]} "
+               f"WHERE {timestamp} IS NOT NULL ORDER BY {timestamp}, id)")
+        query = QSqlQuery(self.db)
+        query.setForwardOnly(True)
+        if not query.exec(sql) or not query.next():
+            logger.error(f"Error loading analytics columns: {table} - {query.lastError().text()}")
+            values = [0] + [None] * (len(metrics) + 2)
+        else:
+            values = [query.value(i) for i in range(len(metrics) + 3)]
+        query.finish()
+
+        def parse(text: Any, dtype: type) -> np.ndarray:
+            if not values[0] or text is None:
+                return np.empty(0, dtype=dtype)
+            return np.array(str(text).split(','), dtype=dtype)
+
+        arrays = {'id': parse(values[1], np.int64), 'timestamp': parse(values[2], np.int64)}
+        for position, column in enumerate(metrics):
+            arrays[column] = parse(values[position + 3], np.float64)
+        return arrays
+
+    def _cached(self, table: str, key: Any, compute: Callable[[Dict[str, np.ndarray]], Any]) -> Any:
+        _, arrays, results = self._entry(table)
+        if key not in results:
+            results[key] = compute(arrays)
+        return results[key]
+
+    def rolling_mean(self, table: str, column: Optional[str] = None, window: int = 7) -> np.ndarray:
+        """
+        Returns the rolling mean of a column over the last `window` exams.
+
+        Args:
+            table (str): The exam table.
+            column (Optional[str]): The column; the table's summary if omitted.
+            window (int): The number of exams per window.
+
+        Returns:
+            np.ndarray: The rolling means, one per exam.
+        """
+        column = column or SUMMARY_COLUMNS[table]
+        return self._cached(table, ('rolling_mean', column, window),
+                            lambda arrays: rolling_mean(arrays[column], window))
+
+    def trend(self, table: str, column: Optional[str] = None, alpha: float = 0.2) -> np.ndarray:
+        """
+        Returns the exponentially weighted trend of a column.
+
+        Args:
+            table (str): The exam table.
+            column (Optional[str]): The column; the table's summary if omitted.
+            alpha (float): The smoothing factor.
+
+        Returns:
+            np.ndarray: The weighted averages, one per exam.
+        """
+        column = column or SUMMARY_COLUMNS[table]
+        return self._cached(table, ('trend', column, alpha),
+                            lambda arrays: ewma(arrays[column], alpha))
+
+    def item_correlations(self, table: str) -> Tuple[Tuple[str, ...], np.ndarray]:
+        """
+        Returns the Pearson correlation matrix of a table's items.
+
+        Items that never vary have no defined correlation and show as NaN.
+
+        Args:
+            table (str): The exam table.
+
+        Returns:
+            Tuple[Tuple[str, ...], np.ndarray]: The item names and the square matrix in the same order.
+        """
+        items = metric_columns(table)[:-1]
+
+        def compute(arrays: Dict[str, np.ndarray]) -> np.ndarray:
+            if arrays['id'].size < 2:
+                return np.full((len(items), len(items)), np.nan)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                return np.corrcoef(np.vstack([arrays[item] for item in items]))
+
+        return items, self._cached(table, 'item_correlations', compute)
+
+    def overview(self, table: str, window: int = 7, alpha: float = 0.2) -> Dict[str, Any]:
+        """
+        Returns the headline statistics of a table: where the summary score stands and which items move together.
+
+        Args:
+            table (str): The exam table.
+            window (int): The number of exams of the rolling mean.
+            alpha (float): The smoothing factor of the trend.
+
+        Returns:
+            Dict[str, Any]: 'exams', and the latest summary, its 'rolling_mean' and its
+                'trend' (None without exams); 'items' is the most strongly correlated pair
+                of items as (item, item, r), None if no pair has a defined correlation.
+        """
+        summary = SUMMARY_COLUMNS[table]
+        exams = int(self.columns(table)['id'].size)
+        if not exams:
+            return {'exams': 0, 'latest': None, 'rolling_mean': None, 'trend': None, 'items': None}
+        items, matrix = self.item_correlations(table)
+        rows, columns = np.triu_indices(len(items), k=1)
+        pairs = matrix[rows, columns]
+        strongest = None
+        if not np.isnan(pairs).all():
+            best = int(np.nanargmax(np.abs(pairs)))
+            strongest = (items[rows[best]], items[columns[best]], float(pairs[best]))
+        return {
+            'exams': exams,
+            'latest': float(self.columns(table)[summary][-1]),
+            'rolling_mean': float(self.rolling_mean(table, summary, window)[-1]),
+            'trend': float(self.trend(table, summary, alpha)[-1]),
+            'items': strongest,
+        }
+
+    def cross_correlation(self, max_lag: int = 7) -> Dict[int, float]:
+        """
+        Correlates daily Beck and Altman summaries at day lags from -max_lag to max_lag.
+
+        Both histories are reduced to daily means and laid on a common day axis; a
+        positive lag pairs each Beck day with the Altman score that many days later.
+
+        Args:
+            max_lag (int): The largest lag in days, in both directions.
+
+        Returns:
+            Dict[int, float]: The Pearson correlation per lag; NaN where fewer than three days overlap.
+        """
+        key = ('cross_correlation', max_lag)
+        beck_entry = self._entry('beck_table')
+        altman_entry = self._entry('altman_table')
+        cached = beck_entry[2].get((key, altman_entry[0]))
+        if cached is not None:
+            return cached
+
+        beck_days, beck_means = daily_means(beck_entry[1]['timestamp'],
+                                            beck_entry[1][SUMMARY_COLUMNS['beck_table']])
+        altman_days, altman_means = daily_means(altman_entry[1]['timestamp'],
+                                                altman_entry[1][SUMMARY_COLUMNS['altman_table']])
+        result: Dict[int, float] = {}
+        if beck_days.size and altman_days.size:
+            first = min(beck_days[0], altman_days[0])
+            span = int(max(beck_days[-1], altman_days[-1]) - first) + 1
+            beck_axis = np.full(span, np.nan)
+            altman_axis = np.full(span, np.nan)
+            beck_axis[beck_days - first] = beck_means
+            altman_axis[altman_days - first] = altman_means
+        for lag in range(-max_lag, max_lag + 1):
+            result[lag] = float('nan')
+            if not (beck_days.size and altman_days.size) or abs(lag) >= span:
+                continue
+            left = beck_axis[max(0, -lag):span - max(0, lag)]
+            right = altman_axis[max(0, lag):span - max(0, -lag)]
+            both = ~(np.isnan(left) | np.isnan(right))
+            if both.sum() >= 3:
+                with np.errstate(invalid='ignore', divide='ignore'):
+                    result[lag] = float(np.corrcoef(left[both], right[both])[0, 1])
+        beck_entry[2][(key, altman_entry[0])] = result
+        return result
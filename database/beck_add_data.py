@@ -84,6 +84,5 @@ def reset_beck_exam(main_window_instance, widget_names):
         getattr(main_window_instance, widget_names['victimhood']).setValue(0)
         getattr(main_window_instance, widget_names['sleep']).setValue(0)
         getattr(main_window_instance, widget_names['beck_summary']).setValue(0)
-        getattr(main_window_instance, widget_names['model']).select()
     except Exception as e:
         logger.error(f"Error resetting pain levels form: {e}")
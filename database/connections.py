@@ -0,0 +1,193 @@
+import os
+import threading
+import urllib.parse
+from collections import OrderedDict
+from typing import Dict, List, Mapping, Optional, Set, Union
+
+from PyQt6.QtCore import QThread, Qt
+from PyQt6.QtSql import QSqlDatabase, QSqlQuery
+
+import tracker_config as tkc
+from logger_setup import logger
+
+target_db_path = os.path.join(os.path.expanduser('~'), tkc.DB_NAME)  # Database Name
+
+DRIVER: str = 'QSQLITE'
+CONNECTION_PREFIX: str = 'beck_altman'
+READ_ONLY_OPTIONS: str = 'QSQLITE_OPEN_URI;QSQLITE_OPEN_READONLY'
+
+
+def apply_connection_profile(db: QSqlDatabase, pragmas: Mapping[str, Union[str, int]]) -> None:
+    """
+    Applies PRAGMA settings to an open connection.
+
+    Args:
+        db (QSqlDatabase): The connection.
+        pragmas (Mapping[str, Union[str, int]]): PRAGMA names and the values to set.
+
+    Returns:
+        None
+    """
+    query = QSqlQuery(db)
+    for name, value in pragmas.items():
+        if not query.exec(f"PRAGMA {name} = {value}"):
+            logger.error(f"Error applying PRAGMA {name}: {query.lastError().text()}")
+    query.finish()
+
+
+class ConnectionManager:
+    """
+    Hands out named QSqlDatabase connections, one per thread and database file.
+
+    Qt only lets a connection be used from the thread that created it, so every
+    caller asks for "this thread's connection to this file" instead of picking a
+    connection name. Connections are opened lazily on first use, get the connection
+    profile (tkc.SQLITE_PRAGMAS) once, and are closed and removed when their QThread
+    finishes. The GUI thread's connections live until release() is called at exit;
+    plain Python threads that use Qt SQL must call release() themselves.
+
+    Each thread keeps at most pool_size database files open. Opening another file
+    closes the connections to the one requested least recently, so switching between
+    many patient shards never accumulates open files; holders of a connection should
+    ask for it again rather than keep it across a switch.
+
+    Besides its read-write connection, every thread can have a read-only reader
+    (reader()) opened through a mode=ro URI. Readers are what the table models and
+    analytics read through: under WAL a reader works from its own snapshot, so long
+    history reads and commits never wait for each other, and a reader cannot write
+    by accident.
+
+    Attributes:
+        prefix (str): The prefix of every connection name.
+        pool_size (int): The number of database files a thread keeps open.
+    """
+
+    def __init__(self, prefix: str = CONNECTION_PREFIX, pool_size: int = tkc.CONNECTION_POOL_SIZE) -> None:
+        self.prefix: str = prefix
+        self.pool_size: int = max(1, pool_size)
+        self._lock = threading.Lock()
+        # thread ident -> database path -> connection names, least recently requested path first
+        self._names: Dict[int, "OrderedDict[str, Set[str]]"] = {}
+        self._hooked: Set[int] = set()
+
+    def connection_name(self, db_name: str, read_only: bool = False) -> str:
+        """
+        Returns the name of the calling thread's connection to a database file.
+
+        Args:
+            db_name (str): The path to the SQLite database file.
+            read_only (bool): Whether it is the thread's reader.
+
+        Returns:
+            str: The connection name.
+        """
+        name = f"{self.prefix}:{threading.get_ident()}:{os.path.abspath(db_name)}"
+        return f"{name}:ro" if read_only else name
+
+    def connection(self,
+                   db_name: str = target_db_path,
+                   pragmas: Optional[Mapping[str, Union[str, int]]] = None,
+                   read_only: bool = False) -> QSqlDatabase:
+        """
+        Returns the calling thread's connection to a database file, opening it on first use.
+
+        Args:
+            db_name (str): The path to the SQLite database file.
+            pragmas (Optional[Mapping[str, Union[str, int]]]): The connection profile;
+                tkc.SQLITE_PRAGMAS (tkc.SQLITE_READER_PRAGMAS for a reader) if omitted when
+                the connection is opened. Passed for an existing connection, the profile
+                is applied to it again.
+            read_only (bool): Whether to return the thread's read-only reader instead.
+
+        Returns:
+            QSqlDatabase: The open connection, owned by the calling thread.
+        """
+        name = self.connection_name(db_name, read_only)
+        path = os.path.abspath(db_name)
+        if QSqlDatabase.contains(name):
+            with self._lock:
+                files = self._names.get(threading.get_ident())
+                if files is not None and path in files:
+                    files.move_to_end(path)
+            db = QSqlDatabase.database(name)
+            if pragmas is not None:
+                apply_connection_profile(db, pragmas)
+            return db
+
+        db = QSqlDatabase.addDatabase(DRIVER, name)
+        if read_only:
+            db.setDatabaseName(f"file:{urllib.parse.quote(path)}?mode=ro")
+            db.setConnectOptions(READ_ONLY_OPTIONS)
+            profile = tkc.SQLITE_READER_PRAGMAS
+        else:
+            db.setDatabaseName(db_name)
+            profile = tkc.SQLITE_PRAGMAS
+        if not db.open():
+            logger.error(f"Error: Unable to open database {db_name}: {db.lastError().text()}")
+        apply_connection_profile(db, profile if pragmas is None else pragmas)
+        ident = threading.get_ident()
+        worker = threading.current_thread() is not threading.main_thread()
+        with self._lock:
+            files = self._names.setdefault(ident, OrderedDict())
+            files.setdefault(path, set()).add(name)
+            files.move_to_end(path)
+            evicted: List[str] = list(files)[:-self.pool_size]
+            hooked = ident in self._hooked or not worker
+            self._hooked.add(ident)
+        for stale in evicted:
+            self.release(stale)
+        if not hooked:
+            # finished is emitted from the thread itself, so a direct connection
+            # closes the connections on the thread that owns them. The main thread
+            # never emits it; its connections are released explicitly at exit.
+            QThread.currentThread().finished.connect(self._thread_finished, Qt.ConnectionType.DirectConnection)
+        return db
+
+    def reader(self, db_name: str = target_db_path) -> QSqlDatabase:
+        """
+        Returns the calling thread's read-only connection to a database file, opening it on first use.
+
+        The file must already exist; readers never create or migrate it.
+
+        Args:
+            db_name (str): The path to the SQLite database file.
+
+        Returns:
+            QSqlDatabase: The open read-only connection, owned by the calling thread.
+        """
+        return self.connection(db_name, read_only=True)
+
+    def release(self, db_name: Optional[str] = None) -> None:
+        """
+        Closes and removes the calling thread's connections.
+
+        Queries prepared on a connection must be finished and dropped first, or Qt
+        warns that the connection is still in use.
+
+        Args:
+            db_name (Optional[str]): Only the connections (read-write and reader) to this
+                file; every connection of the thread if omitted.
+
+        Returns:
+            None
+        """
+        ident = threading.get_ident()
+        with self._lock:
+            files = self._names.get(ident, OrderedDict())
+            paths = list(files) if db_name is None else [os.path.abspath(db_name)]
+            released = [name for path in paths for name in files.pop(path, ())]
+            if not files:
+                self._names.pop(ident, None)
+        for name in released:
+            db = QSqlDatabase.database(name, False)
+            db.close()
+            db = None
+            QSqlDatabase.removeDatabase(name)
+
+    def _thread_finished(self) -> None:
+        self.release()
+        with self._lock:
+            self._hooked.discard(threading.get_ident())
+
+
+connections = ConnectionManager()
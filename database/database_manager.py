@@ -1,13 +1,37 @@
 import tracker_config as tkc
+from PyQt6.QtCore import QObject, pyqtSignal
 from PyQt6.QtSql import QSqlDatabase, QSqlQuery
 import os
 import shutil
-from typing import List, Union
+import time
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Union
 from logger_setup import logger
+from database.connections import apply_connection_profile, connections, target_db_path
+from database.migrations import pending_migrations
+from database.rollups import PERIODS, metric_columns, refresh_rollup_sql, select_rollup_sql
+from database.schema import (SQL_VARIABLE_CHUNK, TABLE_COLUMNS, BatchInsertResult, count_sql, insert_sql,
+                             purge_tombstones_sql, restore_in_sql, select_by_id_sql, select_range_sql,
+                             soft_delete_in_sql, timestamps_in_sql)
 
 user_dir = os.path.expanduser('~')
 db_path = os.path.join(os.getcwd(), tkc.DB_NAME)  # Database Name
-target_db_path = os.path.join(user_dir, tkc.DB_NAME)  # Database Name
+
+
+def padded_chunk(chunk: Sequence) -> list:
+    """
+    Pads a short IN-list chunk to SQL_VARIABLE_CHUNK values by repeating its first value.
+
+    Every chunk then binds the same number of values, so a single cached statement
+    serves all of them instead of one per tail length. A repeated value matches the
+    same rows again, which IN ignores.
+
+    Args:
+        chunk (Sequence): At most SQL_VARIABLE_CHUNK values, at least one.
+
+    Returns:
+        list: The values, exactly SQL_VARIABLE_CHUNK long.
+    """
+    return list(chunk) + [chunk[0]] * (SQL_VARIABLE_CHUNK - len(chunk))
 
 
 def initialize_database() -> None:
@@ -16,7 +40,8 @@ def initialize_database() -> None:
 
     If the target database file doesn't exist, it checks if the source database file exists.
     If the source database file exists, it copies it to the target location.
-    If the source database file doesn't exist, it creates a new database file using the 'QSQLITE' driver.
+    If the source database file doesn't exist, it creates a new database file by opening
+    the calling thread's connection to it.
 
     Returns:
         None
@@ -29,49 +54,200 @@ def initialize_database() -> None:
             if os.path.exists(db_path):
                 shutil.copy(db_path, target_db_path)
             else:
-                db: QSqlDatabase = QSqlDatabase.addDatabase('QSQLITE')
-                db.setDatabaseName(target_db_path)
-                if not db.open():
+                db: QSqlDatabase = connections.connection(target_db_path)
+                if not db.isOpen():
                     logger.error("Error: Unable to create database")
-                db.close()
     except Exception as e:
         logger.error("Error: Unable to create database", str(e))
 
 
+class DataNotifier(QObject):
+    """
+    Row-level change notifications emitted by DataManager after a successful write.
+
+    Signals:
+        rowsInserted (str, int): The table and the id of a newly inserted row.
+        rowsDeleted (str, list): The table and the ids of the deleted rows.
+        tableReset (str): The table changed in bulk and should be re-read.
+    """
+    rowsInserted = pyqtSignal(str, int)
+    rowsDeleted = pyqtSignal(str, list)
+    tableReset = pyqtSignal(str)
+
+
 class DataManager:
     
     def __init__(self,
-                 db_name: str = target_db_path) -> None:
+                 db_name: str = target_db_path,
+                 notifier: Optional[DataNotifier] = None,
+                 pragmas: Optional[Mapping[str, Union[str, int]]] = None) -> None:
         """
-        Initializes the DataManager object and opens the database connection.
+        Initializes the DataManager object on the calling thread's connection to the database.
+
+        The connection comes from the connection manager, which opens it with the
+        connection profile on first use and closes it when the thread exits. Every
+        DataManager, model and worker on one thread shares that thread's connection.
 
         Args:
             db_name (str): The path to the SQLite database file.
+            notifier (Optional[DataNotifier]): Where change notifications are emitted;
+                a new DataNotifier is created if omitted.
+            pragmas (Optional[Mapping[str, Union[str, int]]]): The connection profile;
+                tkc.SQLITE_PRAGMAS if omitted, an empty mapping keeps SQLite's defaults.
 
         Raises:
             Exception: If there is an error opening the database.
 
         """
+        self.notifier: DataNotifier = notifier if notifier is not None else DataNotifier()
         try:
-            self.db: QSqlDatabase = QSqlDatabase.addDatabase('QSQLITE')
-            self.db.setDatabaseName(db_name)
-            
-            if not self.db.open():
+            self.db: QSqlDatabase = connections.connection(db_name, pragmas)
+            if not self.db.isOpen():
                 logger.error("Error: Unable to open database")
             logger.info("DB INITIALIZING")
-            self.query: QSqlQuery = QSqlQuery()
+            self.query: QSqlQuery = QSqlQuery(self.db)
+            self.statements: Dict[str, QSqlQuery] = {}
             self.setup_tables()
         except Exception as e:
             logger.error(f"Error: Unable to open database {e}", exc_info=True)
     
+    def apply_connection_profile(self, pragmas: Mapping[str, Union[str, int]]) -> None:
+        """
+        Applies PRAGMA settings to the open connection.
+
+        Args:
+            pragmas (Mapping[str, Union[str, int]]): PRAGMA names and the values to set.
+
+        Returns:
+            None
+        """
+        apply_connection_profile(self.db, pragmas)
+
+    def checkpoint(self) -> None:
+        """
+        Folds the write-ahead log back into the database file and refreshes planner statistics.
+
+        Meant to be called when the app goes idle or closes, so the -wal file does not
+        keep growing between sessions and PRAGMA optimize can run ANALYZE where it helps.
+
+        Returns:
+            None
+        """
+        query = QSqlQuery(self.db)
+        if not query.exec(f"PRAGMA wal_checkpoint({tkc.SQLITE_CHECKPOINT_MODE})"):
+            logger.error(f"Error checkpointing WAL: {query.lastError().text()}")
+        if not query.exec("PRAGMA optimize"):
+            logger.error(f"Error optimizing database: {query.lastError().text()}")
+        query.finish()
+
+    def close(self) -> None:
+        """
+        Releases the cached statements.
+
+        The connection itself is shared by everything on this thread and stays open
+        until the thread exits or connections.release() is called.
+
+        Returns:
+            None
+        """
+        for query in self.statements.values():
+            query.finish()
+        self.statements.clear()
+        self.query.finish()
+
     def setup_tables(self) -> None:
         """
         Sets up the necessary tables in the database.
 
-        This method calls the setup_beck_table() and setup_altman_table() methods to create the required tables in the database.
+        This method calls the setup_beck_table() and setup_altman_table() methods to create the required tables in the database,
+        brings the schema up to date with run_migrations(), then prepares the statements used by the insert, select and
+        delete paths.
         """
         self.setup_beck_table()
         self.setup_altman_table()
+        self.run_migrations()
+        self.prepare_statements()
+
+    def schema_version(self) -> int:
+        """
+        Reads the schema version recorded in PRAGMA user_version.
+
+        Returns:
+            int: The schema version, 0 for a database that was never migrated.
+        """
+        query = QSqlQuery(self.db)
+        if query.exec("PRAGMA user_version") and query.next():
+            return int(query.value(0))
+        logger.error(f"Error reading schema version: {query.lastError().text()}")
+        return 0
+
+    def run_migrations(self) -> None:
+        """
+        Applies every pending migration, each in its own transaction.
+
+        A migration's statements and the user_version bump commit together, so a
+        failed step leaves the database at the previous version and later steps are
+        not attempted.
+
+        Returns:
+            None
+        """
+        for migration in pending_migrations(self.schema_version()):
+            if not self.db.transaction():
+                logger.error(f"Error starting migration {migration.version}: {self.db.lastError().text()}")
+                return
+            query = QSqlQuery(self.db)
+            for sql in migration.statements + (f"PRAGMA user_version = {migration.version}",):
+                if not query.exec(sql):
+                    logger.error(f"Error applying migration {migration.version} "
+                                 f"({migration.description}): {query.lastError().text()}")
+                    self.db.rollback()
+                    return
+            if not self.db.commit():
+                logger.error(f"Error committing migration {migration.version}: {self.db.lastError().text()}")
+                self.db.rollback()
+                return
+            logger.info(f"Applied migration {migration.version}: {migration.description}")
+
+    def prepare_statements(self) -> None:
+        """
+        Compiles every statement used on the hot paths once and caches it.
+
+        The cache is per DataManager, and therefore per connection, since a QSqlQuery
+        is bound to the connection it was prepared on.
+
+        Returns:
+            None
+        """
+        for table in TABLE_COLUMNS:
+            for sql in (insert_sql(table), count_sql(table), select_by_id_sql(table),
+                        select_range_sql(table), select_rollup_sql(table),
+                        soft_delete_in_sql(table, SQL_VARIABLE_CHUNK)) + refresh_rollup_sql(table):
+                try:
+                    self.statement(sql)
+                except RuntimeError as e:
+                    logger.error(f"Error preparing statement: {table} - {e}")
+
+    def statement(self, sql: str) -> QSqlQuery:
+        """
+        Returns the cached prepared query for a statement, preparing it on first use.
+
+        Args:
+            sql (str): The SQL statement.
+
+        Returns:
+            QSqlQuery: A prepared query on this connection.
+
+        Raises:
+            RuntimeError: If the statement cannot be prepared.
+        """
+        query = self.statements.get(sql)
+        if query is None:
+            query = QSqlQuery(self.db)
+            if not query.prepare(sql):
+                raise RuntimeError(query.lastError().text())
+            self.statements[sql] = query
+        return query
         
     def setup_altman_table(self) -> None:
         """
@@ -117,7 +293,7 @@ class DataManager:
                                  altmans_cheer: int,
                                  altmans_confidence: int,
                                  altmans_summary: int
-                                 ) -> None:
+                                 ) -> Optional[int]:
         """
         Inserts data into the altman_table.
 
@@ -132,40 +308,16 @@ class DataManager:
             altmans_summary (int): the summary of all things and all things summary'd
 
         Returns:
-            None
+            Optional[int]: The id of the new row, or None if the insert failed.
 
         Raises:
-            ValueError: If the number of bind values does not match the number of placeholders in the SQL query.
             Exception: If there is an error during data insertion.
 
         """
-        sql: str = f"""INSERT INTO altman_table(
-            altman_date,
-            altman_time,
-            altmans_sleep,
-            altmans_speech,
-            altmans_activity,
-            altmans_cheer,
-            altmans_confidence,
-            altmans_summary
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"""
         bind_values: List[Union[str, int]] = [altman_date, altman_time, altmans_sleep,
                                               altmans_speech, altmans_activity, altmans_cheer,
                                               altmans_confidence, altmans_summary]
-        try:
-            self.query.prepare(sql)
-            for value in bind_values:
-                self.query.addBindValue(value)
-            if sql.count('?') != len(bind_values):
-                raise ValueError(f"""Mismatch: altman_table Expected {sql.count('?')}
-                        bind values, got {len(bind_values)}.""")
-            if not self.query.exec():
-                logger.error(
-                    f"Error inserting data: altman_table - {self.query.lastError().text()}")
-        except ValueError as e:
-            logger.error(f"ValueError altman_table: {e}")
-        except Exception as e:
-            logger.error(f"Error during data insertion: altman_table {e}", exc_info=True)
+        return self._insert_row('altman_table', bind_values)
             
     def setup_beck_table(self) -> None:
         """
@@ -230,7 +382,7 @@ class DataManager:
                                victimhood: int,
                                sleep: int,
                                beck_summary: int
-                               ) -> None:
+                               ) -> Optional[int]:
         """
         Inserts data into the beck_table.
 
@@ -252,29 +404,11 @@ class DataManager:
             beck_summary (int): The summary of the Beck entry.
 
         Returns:
-            None
+            Optional[int]: The id of the new row, or None if the insert failed.
 
         Raises:
-            ValueError: If the number of bind values does not match the number of placeholders in the SQL query.
             Exception: If there is an error during data insertion.
         """
-        sql: str = f"""INSERT INTO beck_table(
-                        beck_date,
-                        beck_time,
-                        sadness,
-                        outlook,
-                        guilt,
-                        solitude,
-                        sexdrive,
-                        hygiene,
-                        decisiveness,
-                        effort,
-                        interest,
-                        pessimism,
-                        victimhood,
-                        sleep,
-                        beck_summary) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
-
         bind_values: List[Union[str, int]] = [beck_date, beck_time, sadness, outlook,
                                               guilt,
                                               solitude,
@@ -285,20 +419,471 @@ class DataManager:
                                               interest,
                                               pessimism,
                                               victimhood, sleep, beck_summary]
+        return self._insert_row('beck_table', bind_values)
+
+    def _insert_row(self,
+                    table: str,
+                    bind_values: List[Union[str, int]]) -> Optional[int]:
+        """
+        Executes the cached INSERT statement for a table with one row of values
+        and announces the new id through the notifier.
+
+        Args:
+            table (str): The table to write to.
+            bind_values (List[Union[str, int]]): The values in column order.
+
+        Returns:
+            Optional[int]: The id of the new row, or None if the insert failed.
+        """
         try:
-            self.query.prepare(sql)
-            for value in bind_values:
-                self.query.addBindValue(value)
-            if sql.count('?') != len(bind_values):
-                raise ValueError(f"""Mismatch: beck_table Expected {sql.count('?')}
+            if len(TABLE_COLUMNS[table]) != len(bind_values):
+                raise ValueError(f"""Mismatch: {table} Expected {len(TABLE_COLUMNS[table])}
                     bind values, got {len(bind_values)}.""")
-            if not self.query.exec():
+            query = self.statement(insert_sql(table))
+            for value in bind_values:
+                query.addBindValue(value)
+            if not query.exec():
                 logger.error(
-                    f"Error inserting data: beck_table - {self.query.lastError().text()}")
+                    f"Error inserting data: {table} - {query.lastError().text()}")
+                return None
+            row_id = int(query.lastInsertId())
+            self.notifier.rowsInserted.emit(table, row_id)
+            return row_id
         except ValueError as e:
-            logger.error(f"ValueError beck_table: {e}")
+            logger.error(f"ValueError {table}: {e}")
+        except Exception as e:
+            logger.error(f"Error during data insertion: {table} {e}", exc_info=True)
+        return None
+
+    def count_rows(self, table: str) -> int:
+        """
+        Counts the live rows of a table with the cached COUNT statement.
+
+        Args:
+            table (str): The table to count.
+
+        Returns:
+            int: The number of rows, or 0 if the query failed.
+        """
+        query = self.statement(count_sql(table))
+        if not query.exec() or not query.next():
+            logger.error(f"Error counting rows: {table} - {query.lastError().text()}")
+            return 0
+        count = int(query.value(0))
+        query.finish()
+        return count
+
+    def fetch_row(self, table: str, row_id: int) -> Optional[List]:
+        """
+        Reads a single row by primary key with the cached SELECT statement.
+
+        Args:
+            table (str): The table to read from.
+            row_id (int): The primary key of the row.
+
+        Returns:
+            Optional[List]: The id followed by the column values, or None if not found.
+        """
+        query = self.statement(select_by_id_sql(table))
+        query.addBindValue(row_id)
+        if not query.exec():
+            logger.error(f"Error selecting row: {table} - {query.lastError().text()}")
+            return None
+        row = None
+        if query.next():
+            row = [query.value(i) for i in range(len(TABLE_COLUMNS[table]) + 1)]
+        query.finish()
+        return row
+
+    def fetch_range(self, table: str, start: int, end: int) -> List[List]:
+        """
+        Reads the rows of a table whose timestamp falls in a range, oldest first.
+
+        Args:
+            table (str): The table to read from.
+            start (int): The inclusive lower bound, in epoch seconds.
+            end (int): The exclusive upper bound, in epoch seconds.
+
+        Returns:
+            List[List]: The id followed by the column values of each matching row.
+        """
+        query = self.statement(select_range_sql(table))
+        query.addBindValue(start)
+        query.addBindValue(end)
+        rows: List[List] = []
+        if not query.exec():
+            logger.error(f"Error selecting range: {table} - {query.lastError().text()}")
+            return rows
+        width = len(TABLE_COLUMNS[table]) + 1
+        while query.next():
+            rows.append([query.value(i) for i in range(width)])
+        query.finish()
+        return rows
+
+    def existing_timestamps(self, table: str, timestamps: Sequence[int]) -> Set[int]:
+        """
+        Returns which of the given epoch timestamps already have a live row in a table.
+
+        The lookup is split into IN lists of SQL_VARIABLE_CHUNK values, each answered
+        by seeks on the timestamp index; the last list is padded (padded_chunk) so one
+        cached statement serves every lookup.
+
+        Args:
+            table (str): The exam table.
+            timestamps (Sequence[int]): The timestamps to look up.
+
+        Returns:
+            Set[int]: The timestamps that are already stored.
+        """
+        found: Set[int] = set()
+        for start in range(0, len(timestamps), SQL_VARIABLE_CHUNK):
+            chunk = padded_chunk(timestamps[start:start + SQL_VARIABLE_CHUNK])
+            query = self.statement(timestamps_in_sql(table, SQL_VARIABLE_CHUNK))
+            for value in chunk:
+                query.addBindValue(value)
+            if not query.exec():
+                logger.error(f"Error looking up timestamps: {table} - {query.lastError().text()}")
+                continue
+            while query.next():
+                found.add(int(query.value(0)))
+            query.finish()
+        return found
+
+    def fetch_rollup(self, table: str, period: str, first: str, last: str) -> List[dict]:
+        """
+        Reads precomputed per-day, per-week or per-month statistics of a table.
+
+        Args:
+            table (str): The exam table.
+            period (str): 'day', 'week' or 'month'.
+            first (str): The first bucket to read, as 'yyyy-MM-dd' (inclusive).
+            last (str): The last bucket to read, as 'yyyy-MM-dd' (inclusive).
+
+        Returns:
+            List[dict]: One dict per bucket with 'bucket', 'count' and, for every item and
+            the summary, '<column>_mean', '<column>_min' and '<column>_max'.
+        """
+        if period not in PERIODS:
+            raise ValueError(f"Unknown rollup period: {period}")
+        query = self.statement(select_rollup_sql(table))
+        for value in (period, first, last):
+            query.addBindValue(value)
+        buckets: List[dict] = []
+        if not query.exec():
+            logger.error(f"Error selecting rollup: {table} - {query.lastError().text()}")
+            return buckets
+        while query.next():
+            bucket = {'bucket': query.value(0), 'count': int(query.value(1))}
+            for position, column in enumerate(metric_columns(table)):
+                base = 2 + position * 3
+                bucket[f"{column}_mean"] = query.value(base)
+                bucket[f"{column}_min"] = query.value(base + 1)
+                bucket[f"{column}_max"] = query.value(base + 2)
+            buckets.append(bucket)
+        query.finish()
+        return buckets
+
+    def delete_rows(self, table: str, row_ids: Iterable[int]) -> bool:
+        """
+        Soft-deletes rows by primary key: each row gets a deleted_at tombstone and
+        drops out of the live view, the rollups and every reader.
+
+        The tombstones are set with UPDATE ... WHERE id IN (...) statements in chunks
+        of SQL_VARIABLE_CHUNK ids, all in one transaction. The ids that were actually
+        tombstoned are announced through the notifier once the transaction commits.
+        The rows stay in the file until compact() purges them, so restore_rows() can
+        bring them back in the meantime.
+
+        Args:
+            table (str): The table to delete from.
+            row_ids (Iterable[int]): The primary keys of the rows.
+
+        Returns:
+            bool: True if the transaction committed; ids that are not live are skipped.
+        """
+        deleted = self._update_in(table, row_ids, soft_delete_in_sql, (int(time.time()),))
+        if deleted is None:
+            return False
+        if deleted:
+            self.notifier.rowsDeleted.emit(table, deleted)
+        return True
+
+    def restore_rows(self, table: str, row_ids: Iterable[int]) -> bool:
+        """
+        Clears the tombstone of soft-deleted rows that have not been compacted yet.
+
+        Restored rows reappear in the middle of the table, so the notifier announces a
+        table reset rather than row inserts.
+
+        Args:
+            table (str): The table the rows were deleted from.
+            row_ids (Iterable[int]): The primary keys of the rows.
+
+        Returns:
+            bool: True if the transaction committed; ids that are not tombstoned are skipped.
+        """
+        restored = self._update_in(table, row_ids, restore_in_sql)
+        if restored is None:
+            return False
+        if restored:
+            self.notifier.tableReset.emit(table)
+        return True
+
+    def _update_in(self,
+                   table: str,
+                   row_ids: Iterable[int],
+                   build_sql: Callable[[str, int], str],
+                   leading: Sequence = ()) -> Optional[List[int]]:
+        """
+        Runs a RETURNING id statement over a set of primary keys in one transaction.
+
+        The ids go in chunks of SQL_VARIABLE_CHUNK; the last chunk is padded
+        (padded_chunk) so every chunk reuses the same cached statement.
+
+        Args:
+            table (str): The table to update.
+            row_ids (Iterable[int]): The primary keys of the rows.
+            build_sql (Callable[[str, int], str]): Builds the statement for a table and an id count.
+            leading (Sequence): Values bound before the ids of every chunk.
+
+        Returns:
+            Optional[List[int]]: The sorted ids the statements returned, or None if the
+            transaction was rolled back.
+        """
+        row_ids = sorted({int(row_id) for row_id in row_ids})
+        if not row_ids:
+            return []
+        if not self.db.transaction():
+            logger.error(f"Error starting transaction: {table} - {self.db.lastError().text()}")
+            return None
+        changed: List[int] = []
+        for start in range(0, len(row_ids), SQL_VARIABLE_CHUNK):
+            chunk = padded_chunk(row_ids[start:start + SQL_VARIABLE_CHUNK])
+            try:
+                query = self.statement(build_sql(table, SQL_VARIABLE_CHUNK))
+            except RuntimeError as e:
+                logger.error(f"Error preparing statement: {table} - {e}")
+                self.db.rollback()
+                return None
+            for value in list(leading) + chunk:
+                query.addBindValue(value)
+            if not query.exec():
+                logger.error(f"Error updating rows: {table} - {query.lastError().text()}")
+                query.finish()
+                self.db.rollback()
+                return None
+            while query.next():
+                changed.append(int(query.value(0)))
+            query.finish()
+        if not self.refresh_rollups(table):
+            self.db.rollback()
+            return None
+        if not self.db.commit():
+            logger.error(f"Error committing update: {table} - {self.db.lastError().text()}")
+            self.db.rollback()
+            return None
+        return sorted(changed)
+
+    def refresh_rollups(self, table: str) -> bool:
+        """
+        Recomputes the rollup buckets of a table that lost rows since the last refresh.
+
+        The removal triggers only adjust counts and sums and record the day of every
+        removed row; this rebuilds each recorded bucket with one set-based statement
+        per period (refresh_rollup_sql), so removing a thousand rows costs one pass over
+        their buckets instead of a rescan per row. Call it inside the transaction that
+        removed the rows.
+
+        Args:
+            table (str): The exam table.
+
+        Returns:
+            bool: True if every bucket was recomputed.
+        """
+        for sql in refresh_rollup_sql(table):
+            try:
+                query = self.statement(sql)
+            except RuntimeError as e:
+                logger.error(f"Error preparing rollup refresh: {table} - {e}")
+                return False
+            if not query.exec():
+                logger.error(f"Error refreshing rollup: {table} - {query.lastError().text()}")
+                query.finish()
+                return False
+            query.finish()
+        return True
+
+    def compact(self,
+                retention_days: float = tkc.TOMBSTONE_RETENTION_DAYS,
+                batch_size: int = tkc.COMPACTION_BATCH_SIZE) -> Optional[int]:
+        """
+        Hard-deletes tombstones older than the retention period and returns the freed pages to the file system.
+
+        Tombstones are purged in batches of batch_size rows, each batch in its own
+        transaction, so a writer waiting behind compaction never waits for more than
+        one batch. The rollup triggers ignore tombstoned rows, so purging them costs no
+        rollup maintenance. Afterwards PRAGMA incremental_vacuum truncates the free
+        pages; a database created before auto_vacuum was part of the connection
+        profile is converted once with a full VACUUM.
+
+        Args:
+            retention_days (float): How long a tombstoned row stays restorable.
+            batch_size (int): The number of rows hard-deleted per transaction.
+
+        Returns:
+            Optional[int]: The number of rows purged, or None if compaction failed.
+        """
+        cutoff = int(time.time() - retention_days * 86400)
+        purged = 0
+        for table in TABLE_COLUMNS:
+            while True:
+                if not self.db.transaction():
+                    logger.error(f"Error starting compaction: {table} - {self.db.lastError().text()}")
+                    return None
+                query = self.statement(purge_tombstones_sql(table))
+                query.addBindValue(cutoff)
+                query.addBindValue(batch_size)
+                if not query.exec():
+                    logger.error(f"Error purging tombstones: {table} - {query.lastError().text()}")
+                    self.db.rollback()
+                    return None
+                batch = query.numRowsAffected()
+                query.finish()
+                if not self.db.commit():
+                    logger.error(f"Error committing compaction: {table} - {self.db.lastError().text()}")
+                    self.db.rollback()
+                    return None
+                purged += batch
+                if batch < batch_size:
+                    break
+
+        query = QSqlQuery(self.db)
+        if query.exec("PRAGMA auto_vacuum") and query.next() and int(query.value(0)) != 2:
+            query.finish()
+            logger.info("Converting database to incremental auto_vacuum")
+            if not (query.exec("PRAGMA auto_vacuum = INCREMENTAL") and query.exec("VACUUM")):
+                logger.error(f"Error converting to incremental auto_vacuum: {query.lastError().text()}")
+        elif query.exec("PRAGMA freelist_count") and query.next():
+            free_pages = int(query.value(0))
+            query.finish()
+            # Each step of incremental_vacuum frees one page and QSqlQuery.exec() steps
+            # once, so the pragma is executed once per free page, in one transaction.
+            if free_pages and self.db.transaction():
+                query.prepare("PRAGMA incremental_vacuum")
+                for _ in range(free_pages):
+                    if not query.exec():
+                        logger.error(f"Error running incremental vacuum: {query.lastError().text()}")
+                        break
+                query.finish()
+                if not self.db.commit():
+                    logger.error(f"Error committing incremental vacuum: {self.db.lastError().text()}")
+                    self.db.rollback()
+        query.finish()
+        logger.info(f"Compaction purged {purged} tombstoned rows")
+        return purged
+
+    def insert_many_beck(self,
+                         rows: Iterable[Union[Sequence, Mapping]],
+                         chunk_size: int = 10000) -> BatchInsertResult:
+        """
+        Inserts many rows into the beck_table in a single transaction.
+
+        Args:
+            rows (Iterable[Union[Sequence, Mapping]]): Rows in the same order as the
+                arguments of insert_into_beck_table, or mappings keyed by column name.
+            chunk_size (int): The number of rows bound per execBatch call.
+
+        Returns:
+            BatchInsertResult: The number of rows written and the throughput.
+        """
+        return self._insert_many('beck_table', rows, chunk_size)
+
+    def insert_many_altman(self,
+                           rows: Iterable[Union[Sequence, Mapping]],
+                           chunk_size: int = 10000) -> BatchInsertResult:
+        """
+        Inserts many rows into the altman_table in a single transaction.
+
+        Args:
+            rows (Iterable[Union[Sequence, Mapping]]): Rows in the same order as the
+                arguments of insert_into_altman_table, or mappings keyed by column name.
+            chunk_size (int): The number of rows bound per execBatch call.
+
+        Returns:
+            BatchInsertResult: The number of rows written and the throughput.
+        """
+        return self._insert_many('altman_table', rows, chunk_size)
+
+    def _insert_many(self,
+                     table: str,
+                     rows: Iterable[Union[Sequence, Mapping]],
+                     chunk_size: int) -> BatchInsertResult:
+        """
+        Writes rows to a table with QSqlQuery.execBatch inside one transaction.
+
+        The cached INSERT statement is reused; each chunk of rows is transposed into one
+        bind list per column so Qt can bind the whole chunk in a single call.
+        Any failure rolls the whole batch back.
+
+        Args:
+            table (str): The table to write to.
+            rows (Iterable[Union[Sequence, Mapping]]): The rows to write.
+            chunk_size (int): The number of rows bound per execBatch call.
+
+        Returns:
+            BatchInsertResult: The number of rows written and the throughput.
+        """
+        columns = TABLE_COLUMNS[table]
+        started = time.perf_counter()
+        written = 0
+        if not self.db.transaction():
+            logger.error(f"Error starting transaction: {table} - {self.db.lastError().text()}")
+            return BatchInsertResult(table, 0, 0.0, 0.0)
+        try:
+            query = self.statement(insert_sql(table))
+            chunk: List[Sequence] = []
+            for row in rows:
+                if isinstance(row, Mapping):
+                    row = [row[column] for column in columns]
+                if len(row) != len(columns):
+                    raise ValueError(f"Mismatch: {table} Expected {len(columns)} "
+                                     f"bind values, got {len(row)}.")
+                chunk.append(row)
+                if len(chunk) >= chunk_size:
+                    written += self._exec_batch(query, chunk)
+                    chunk = []
+            if chunk:
+                written += self._exec_batch(query, chunk)
+            if not self.db.commit():
+                raise RuntimeError(self.db.lastError().text())
         except Exception as e:
-            logger.error(f"Error during data insertion: beck_table {e}", exc_info=True)
+            self.db.rollback()
+            logger.error(f"Error during batch insertion: {table} {e}", exc_info=True)
+            return BatchInsertResult(table, 0, time.perf_counter() - started, 0.0)
+        seconds = time.perf_counter() - started
+        rate = written / seconds if seconds > 0 else float(written)
+        logger.info(f"Batch insert {table}: {written} rows in {seconds:.3f}s ({rate:.0f} rows/s)")
+        if written:
+            self.notifier.tableReset.emit(table)
+        return BatchInsertResult(table, written, seconds, rate)
+
+    @staticmethod
+    def _exec_batch(query: QSqlQuery, chunk: List[Sequence]) -> int:
+        """
+        Binds a chunk of rows column by column and executes it as one batch.
+
+        Args:
+            query (QSqlQuery): A prepared insert query.
+            chunk (List[Sequence]): The rows to bind.
+
+        Returns:
+            int: The number of rows executed.
+        """
+        for column in zip(*chunk):
+            query.addBindValue(list(column))
+        if not query.execBatch():
+            raise RuntimeError(query.lastError().text())
+        return len(chunk)
 
 
 def close_database(self) -> None:
@@ -1,16 +1,22 @@
+from typing import Callable, Iterable
 from PyQt6.QtWidgets import QTableView, QMainWindow
 from logger_setup import logger
 
 
 def delete_selected_rows(main_window_instance: QMainWindow, table_view_widget_name: str,
-                         model_name: str) -> None:
+                         model_name: str, db_delete_method: Callable[[str, Iterable[int]], bool]) -> None:
     """
     Delete the selected rows from the specified QTableView model.
 
+    The primary keys of the selected rows are handed to the data layer, which deletes
+    them and notifies the model so it can drop just those rows.
+
     Args:
         main_window_instance (QMainWindow): The instance of the main window.
         table_view_widget_name (str): The name of the QTableView widget in the main window.
         model_name (str): The name of the model associated with the QTableView.
+        db_delete_method (Callable[[str, Iterable[int]], bool]): The method used to delete
+            rows by table name and primary keys.
 
     Raises:
         Exception: If an error occurs while deleting records.
@@ -22,20 +28,18 @@ def delete_selected_rows(main_window_instance: QMainWindow, table_view_widget_na
     try:
         # Retrieve the QTableView and model instances from the main window
         table_view: QTableView = getattr(main_window_instance, table_view_widget_name)
-        model = getattr(main_window_instance, model_name)  # The model's specific type could vary
+        model = getattr(main_window_instance, model_name)
         
-        if table_view is not None:
-            # Get indices of selected rows, sorted in reverse order for deletion
-            selected_rows = table_view.selectionModel().selectedRows()
-            rows_to_delete = sorted([index.row() for index in selected_rows], reverse=True)
-            
-            # Delete each selected row from the model
-            for row in rows_to_delete:
-                model.removeRow(row)
+        if table_view is not None and model is not None:
+            # Map the selected rows to their primary keys. The selection's ranges give the
+            # rows directly; selectedRows() asks the model for every selected cell's flags.
+            selected_rows = {row for selection_range in table_view.selectionModel().selection()
+                             for row in range(selection_range.top(), selection_range.bottom() + 1)}
+            row_ids = [model.row_id(row) for row in sorted(selected_rows)]
+            row_ids = [row_id for row_id in row_ids if row_id is not None]
             
-            # Submit changes and refresh the model
-            model.submitAll()
-            model.select()
+            if row_ids:
+                db_delete_method(model.table, row_ids)
     
     except Exception as e:
         logger.error(f"An error occurred while deleting records: {str(e)}")
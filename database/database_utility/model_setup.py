@@ -1,30 +1,46 @@
-from PyQt6 import QtSql
+from typing import Optional
+
+from PyQt6.QtSql import QSqlDatabase
 from PyQt6.QtWidgets import QAbstractItemView
+from database.database_manager import DataNotifier, target_db_path
+from database.database_utility.paged_table_model import PagedTableModel
 from logger_setup import logger
 
 
-def create_and_set_model(table_name: str, view_widget: QAbstractItemView) -> QtSql.QSqlTableModel:
+def create_and_set_model(table_name: str, view_widget: QAbstractItemView,
+                         db: Optional[QSqlDatabase] = None,
+                         notifier: Optional[DataNotifier] = None,
+                         db_name: str = target_db_path) -> PagedTableModel:
     """
-    Creates and sets up a QSqlTableModel for the specified table name and view widget.
+    Creates and sets up a PagedTableModel for the specified table name and view widget.
 
     Args:
         table_name (str): The name of the table to create the model for.
         view_widget (QAbstractItemView): The view widget to set the model on.
+        db (Optional[QSqlDatabase]): The connection to read from; this thread's read-only
+            reader of db_name if omitted.
+        notifier (Optional[DataNotifier]): Row-level change notifications the model applies
+            incrementally instead of re-selecting.
+        db_name (str): The database (e.g. a patient's shard) read and written when db is
+            omitted.
 
     Returns:
-        QSqlTableModel: The created QSqlTableModel.
+        PagedTableModel: The created PagedTableModel.
 
     Raises:
         RuntimeError: If there is an error selecting data from the table.
     """
-    model = QtSql.QSqlTableModel()
-    model.setTable(table_name)
-    model.setEditStrategy(QtSql.QSqlTableModel.EditStrategy.OnFieldChange)
+    model = PagedTableModel(table_name, db, db_name=db_name)
 
     if not model.select():
         error_message = f"Error selecting data from table: {table_name}, {model.lastError().text()}"
         logger.error(error_message)
         raise RuntimeError(error_message)
 
+    if notifier is not None:
+        notifier.rowsInserted.connect(model.apply_inserted)
+        notifier.rowsDeleted.connect(model.apply_deleted)
+        notifier.tableReset.connect(model.apply_reset)
+
     view_widget.setModel(model)
     return model
@@ -0,0 +1,492 @@
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PyQt6.QtSql import QSqlDatabase, QSqlError, QSqlQuery
+
+import tracker_config as tkc
+from database.connections import connections, target_db_path
+from database.rollups import refresh_rollup_sql
+from database.schema import LIVE_VIEWS, TABLE_COLUMNS
+from logger_setup import logger
+
+# Lower bound for the keyset of the first page; every real id is above it.
+FIRST_PAGE_ANCHOR: int = -(2 ** 63)
+
+
+class PagedTableModel(QAbstractTableModel):
+    """
+    A read-mostly table model that pages an exam table in by primary key.
+
+    Rows are exposed to the view a page at a time through canFetchMore/fetchMore.
+    Each page is read with a keyset query (``WHERE id >= anchor ORDER BY id LIMIT n``)
+    and only the most recently used pages are kept in memory, so memory stays flat
+    however many exams are stored. The row count comes from a cached ``COUNT(*)``.
+    Rows are read from the table's live view, so tombstoned rows never show; edits
+    are written to the table itself. Reads go through a read-only reader connection
+    by default and edits through the thread's read-write connection, so refreshing a
+    long history never holds up the writer under WAL.
+    Inserts and deletes announced by a DataNotifier are applied row by row through
+    apply_inserted/apply_deleted instead of re-reading the table.
+
+    Attributes:
+        table (str): The table being shown.
+        source (str): The live view the rows are read from.
+        db (QSqlDatabase): The connection the rows are read from.
+        write_db (QSqlDatabase): The connection edits are written through.
+        columns (tuple): The primary key followed by the table's data columns.
+        page_size (int): The number of rows per page.
+        max_pages (int): The number of pages kept in the LRU cache.
+    """
+
+    def __init__(self,
+                 table: str,
+                 db: Optional[QSqlDatabase] = None,
+                 write_db: Optional[QSqlDatabase] = None,
+                 db_name: str = target_db_path,
+                 page_size: int = tkc.MODEL_PAGE_SIZE,
+                 max_pages: int = tkc.MODEL_CACHED_PAGES,
+                 parent=None) -> None:
+        super().__init__(parent)
+        self.table: str = table
+        self.source: str = LIVE_VIEWS[table]
+        self.columns: tuple = ('id',) + TABLE_COLUMNS[table]
+        self.page_size: int = page_size
+        self.max_pages: int = max(1, max_pages)
+        if db is None:
+            self.db: QSqlDatabase = connections.reader(db_name)
+            self.write_db: QSqlDatabase = write_db if write_db is not None else connections.connection(db_name)
+        else:
+            self.db = db
+            self.write_db = write_db if write_db is not None else db
+        self._last_error: QSqlError = QSqlError()
+        self._total: Optional[int] = None
+        self._fetched: int = 0
+        self._pages: "OrderedDict[int, List[list]]" = OrderedDict()
+        self._anchors: Dict[int, int] = {0: FIRST_PAGE_ANCHOR}
+        self._page_query: QSqlQuery = self._prepare(
+            f"SELECT {', '.join(self.columns)} FROM {self.source} "
+            f"WHERE id >= ? ORDER BY id LIMIT ?")
+        self._count_query: QSqlQuery = self._prepare(f"SELECT COUNT(*) FROM {self.source}")
+        self._anchor_query: QSqlQuery = self._prepare(
+            f"SELECT id FROM {self.source} ORDER BY id LIMIT 1 OFFSET ?")
+        self._count_below_query: QSqlQuery = self._prepare(
+            f"SELECT COUNT(*) FROM {self.source} WHERE id < ?")
+        self._count_between_query: QSqlQuery = self._prepare(
+            f"SELECT COUNT(*) FROM {self.source} WHERE id > ? AND id < ?")
+        self._row_query: QSqlQuery = self._prepare(
+            f"SELECT {', '.join(self.columns)} FROM {self.source} WHERE id = ?")
+
+    def _prepare(self, sql: str) -> QSqlQuery:
+        """
+        Prepares a forward-only query on the model's connection.
+
+        Args:
+            sql (str): The SQL statement.
+
+        Returns:
+            QSqlQuery: The prepared query.
+        """
+        query = QSqlQuery(self.db)
+        query.setForwardOnly(True)
+        if not query.prepare(sql):
+            self._last_error = query.lastError()
+            logger.error(f"Error preparing model query: {self.table} - {query.lastError().text()}")
+        return query
+
+    def lastError(self) -> QSqlError:
+        """
+        Returns the last database error seen by the model.
+
+        Returns:
+            QSqlError: The last error, or an empty error if none occurred.
+        """
+        return self._last_error
+
+    # ////////////////////////////////////////////////////////////////////////////////////////
+    # Loading
+    # ////////////////////////////////////////////////////////////////////////////////////////
+    def select(self) -> bool:
+        """
+        Drops every cached page and the cached count, then exposes the first page.
+
+        Returns:
+            bool: True if the row count could be read.
+        """
+        self.beginResetModel()
+        self._pages.clear()
+        self._anchors = {0: FIRST_PAGE_ANCHOR}
+        self._total = None
+        total = self.total_rows()
+        self._fetched = min(self.page_size, total)
+        self.endResetModel()
+        return self._count_query.lastError().type() == QSqlError.ErrorType.NoError
+
+    def total_rows(self) -> int:
+        """
+        Returns the number of rows in the table, counting them only when the cache is stale.
+
+        Returns:
+            int: The cached row count.
+        """
+        if self._total is None:
+            query = self._count_query
+            if query.exec() and query.next():
+                self._total = int(query.value(0))
+            else:
+                self._last_error = query.lastError()
+                logger.error(f"Error counting rows: {self.table} - {query.lastError().text()}")
+                self._total = 0
+            query.finish()
+        return self._total
+
+    def _anchor(self, page: int) -> int:
+        """
+        Returns the lowest id on a page.
+
+        Anchors are learned as neighbouring pages load; a page reached without one
+        (e.g. after a jump scroll) is located once with an OFFSET lookup on the
+        primary key and remembered.
+
+        Args:
+            page (int): The page number.
+
+        Returns:
+            int: The keyset anchor of the page.
+        """
+        anchor = self._anchors.get(page)
+        if anchor is None:
+            query = self._anchor_query
+            query.addBindValue(page * self.page_size)
+            if query.exec() and query.next():
+                anchor = int(query.value(0))
+                self._anchors[page] = anchor
+            else:
+                self._last_error = query.lastError()
+                anchor = FIRST_PAGE_ANCHOR
+            query.finish()
+        return anchor
+
+    def _page(self, page: int) -> List[list]:
+        """
+        Returns the rows of a page, loading it and evicting the least recently used page if needed.
+
+        Args:
+            page (int): The page number.
+
+        Returns:
+            List[list]: The rows on the page.
+        """
+        rows = self._pages.get(page)
+        if rows is not None:
+            self._pages.move_to_end(page)
+            return rows
+
+        query = self._page_query
+        query.addBindValue(self._anchor(page))
+        query.addBindValue(self.page_size + 1)
+        rows = []
+        if query.exec():
+            width = len(self.columns)
+            while query.next():
+                rows.append([query.value(i) for i in range(width)])
+        else:
+            self._last_error = query.lastError()
+            logger.error(f"Error loading page {page}: {self.table} - {query.lastError().text()}")
+        query.finish()
+
+        if len(rows) > self.page_size:
+            # The extra row is the anchor of the next page.
+            self._anchors[page + 1] = int(rows.pop()[0])
+        self._pages[page] = rows
+        while len(self._pages) > self.max_pages:
+            self._pages.popitem(last=False)
+        return rows
+
+    def _row(self, row: int) -> Optional[list]:
+        """
+        Returns the cached values of a row.
+
+        Args:
+            row (int): The row number.
+
+        Returns:
+            Optional[list]: The row values, or None if the row is out of range.
+        """
+        page, offset = divmod(row, self.page_size)
+        rows = self._page(page)
+        return rows[offset] if offset < len(rows) else None
+
+    def row_id(self, row: int) -> Optional[int]:
+        """
+        Returns the primary key of a row.
+
+        Args:
+            row (int): The row number.
+
+        Returns:
+            Optional[int]: The primary key, or None if the row is out of range.
+        """
+        values = self._row(row)
+        return int(values[0]) if values is not None else None
+
+    # ////////////////////////////////////////////////////////////////////////////////////////
+    # QAbstractTableModel
+    # ////////////////////////////////////////////////////////////////////////////////////////
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._fetched
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.columns)
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        return not parent.isValid() and self._fetched < self.total_rows()
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        if parent.isValid():
+            return
+        remaining = self.total_rows() - self._fetched
+        if remaining <= 0:
+            return
+        count = min(self.page_size, remaining)
+        self.beginInsertRows(QModelIndex(), self._fetched, self._fetched + count - 1)
+        self._fetched += count
+        self.endInsertRows()
+
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self.columns[section] if 0 <= section < len(self.columns) else None
+        return section + 1
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid() or role not in (Qt.ItemDataRole.DisplayRole,
+                                               Qt.ItemDataRole.EditRole):
+            return None
+        values = self._row(index.row())
+        return values[index.column()] if values is not None else None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        flags = super().flags(index)
+        if index.isValid() and index.column() > 0:
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        """
+        Writes an edited cell straight to the database, as QSqlTableModel's OnFieldChange did.
+
+        The edit and the recomputation of the rollup buckets it touched commit together.
+
+        Args:
+            index (QModelIndex): The edited cell.
+            value (Any): The new value.
+            role (int): The item data role.
+
+        Returns:
+            bool: True if the row was updated.
+        """
+        if not index.isValid() or role != Qt.ItemDataRole.EditRole or index.column() == 0:
+            return False
+        values = self._row(index.row())
+        if values is None:
+            return False
+        if not self.write_db.transaction():
+            self._last_error = self.write_db.lastError()
+            logger.error(f"Error starting transaction: {self.table} - {self.write_db.lastError().text()}")
+            return False
+        query = QSqlQuery(self.write_db)
+        query.prepare(f"UPDATE {self.table} SET {self.columns[index.column()]} = ? WHERE id = ?")
+        query.addBindValue(value)
+        query.addBindValue(values[0])
+        if (not query.exec() or not all(query.exec(sql) for sql in refresh_rollup_sql(self.table))
+                or not self.write_db.commit()):
+            self._last_error = query.lastError() if query.lastError().isValid() else self.write_db.lastError()
+            logger.error(f"Error updating row: {self.table} - {self._last_error.text()}")
+            query.finish()
+            self.write_db.rollback()
+            return False
+        query.finish()
+        values[index.column()] = value
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    # ////////////////////////////////////////////////////////////////////////////////////////
+    # Change notifications
+    # ////////////////////////////////////////////////////////////////////////////////////////
+    def apply_inserted(self, table: str, row_id: int) -> None:
+        """
+        Appends a newly inserted row without re-reading the table.
+
+        New ids are the largest in the table, so the row lands at the end. It is only
+        shown immediately if every earlier row has already been fetched; otherwise the
+        bumped count lets fetchMore() reach it.
+
+        Args:
+            table (str): The table the row was inserted into.
+            row_id (int): The id of the new row.
+        """
+        if table != self.table or self._total is None:
+            return
+        position = self._total
+        page, offset = divmod(position, self.page_size)
+        rows = self._pages.get(page)
+        if rows and int(rows[-1][0]) > row_id:
+            # Out-of-order id (e.g. an explicit id from an import); positions are unknown.
+            self.select()
+            return
+        fully_fetched = self._fetched == self._total
+        self._total += 1
+        if offset == 0:
+            self._anchors[page] = row_id
+        if rows is not None and len(rows) == offset:
+            values = self._fetch_values(row_id)
+            if values is None:
+                self._pages.pop(page)
+            else:
+                rows.append(values)
+        elif rows is not None:
+            self._pages.pop(page)
+        if fully_fetched:
+            self.beginInsertRows(QModelIndex(), position, position)
+            self._fetched += 1
+            self.endInsertRows()
+
+    def apply_deleted(self, table: str, row_ids: list) -> None:
+        """
+        Removes deleted rows from the model without re-reading the table.
+
+        The former position of the lowest id is the number of surviving ids below it;
+        every later id sits one past the previous deleted id plus the surviving ids in
+        between. Each count is a range on the primary key, so a selection of thousands
+        of rows costs one scan up to the first id plus the gaps, not one full count per
+        id. Contiguous positions are removed as one range, and only pages from the
+        first affected one onwards are dropped from the cache.
+
+        Args:
+            table (str): The table the rows were deleted from.
+            row_ids (list): The ids of the deleted rows.
+        """
+        if table != self.table or not row_ids or self._total is None:
+            return
+        deleted = sorted({int(row_id) for row_id in row_ids})
+        positions = []
+        for rank, row_id in enumerate(deleted):
+            if rank == 0:
+                position = self._count_below(row_id)
+            else:
+                between = self._count_between(deleted[rank - 1], row_id)
+                position = None if between is None else positions[-1] + 1 + between
+            if position is None:
+                self.select()
+                return
+            positions.append(position)
+
+        for first, last in reversed(self._runs(positions)):
+            self._total = max(0, self._total - (last - first + 1))
+            if first < self._fetched:
+                last = min(last, self._fetched - 1)
+                self.beginRemoveRows(QModelIndex(), first, last)
+                self._fetched -= last - first + 1
+                self.endRemoveRows()
+
+        first_page = positions[0] // self.page_size
+        for page in [page for page in self._pages if page >= first_page]:
+            del self._pages[page]
+        for page in [page for page in self._anchors if page > first_page]:
+            del self._anchors[page]
+
+    def apply_reset(self, table: str) -> None:
+        """
+        Re-reads the model after a bulk change to its table.
+
+        Args:
+            table (str): The table that changed.
+        """
+        if table == self.table:
+            self.select()
+
+    @staticmethod
+    def _runs(positions: List[int]) -> List[tuple]:
+        """
+        Groups sorted row positions into contiguous (first, last) ranges.
+
+        Args:
+            positions (List[int]): Sorted, distinct row positions.
+
+        Returns:
+            List[tuple]: The ranges in ascending order.
+        """
+        runs: List[tuple] = []
+        for position in positions:
+            if runs and runs[-1][1] == position - 1:
+                runs[-1] = (runs[-1][0], position)
+            else:
+                runs.append((position, position))
+        return runs
+
+    def _count_below(self, row_id: int) -> Optional[int]:
+        """
+        Counts the rows whose id is below the given id.
+
+        Args:
+            row_id (int): The id to compare against.
+
+        Returns:
+            Optional[int]: The count, or None if the query failed.
+        """
+        query = self._count_below_query
+        query.addBindValue(row_id)
+        count = None
+        if query.exec() and query.next():
+            count = int(query.value(0))
+        else:
+            self._last_error = query.lastError()
+            logger.error(f"Error locating row: {self.table} - {query.lastError().text()}")
+        query.finish()
+        return count
+
+    def _count_between(self, low: int, high: int) -> Optional[int]:
+        """
+        Counts the rows whose id lies strictly between two ids.
+
+        Args:
+            low (int): The lower bound (exclusive).
+            high (int): The upper bound (exclusive).
+
+        Returns:
+            Optional[int]: The count, or None if the query failed.
+        """
+        query = self._count_between_query
+        query.addBindValue(low)
+        query.addBindValue(high)
+        count = None
+        if query.exec() and query.next():
+            count = int(query.value(0))
+        else:
+            self._last_error = query.lastError()
+            logger.error(f"Error locating row: {self.table} - {query.lastError().text()}")
+        query.finish()
+        return count
+
+    def _fetch_values(self, row_id: int) -> Optional[list]:
+        """
+        Reads a single row by id.
+
+        Args:
+            row_id (int): The id of the row.
+
+        Returns:
+            Optional[list]: The row values, or None if it could not be read.
+        """
+        query = self._row_query
+        query.addBindValue(row_id)
+        values = None
+        if query.exec() and query.next():
+            values = [query.value(i) for i in range(len(self.columns))]
+        else:
+            self._last_error = query.lastError()
+        query.finish()
+        return values
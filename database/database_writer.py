@@ -0,0 +1,158 @@
+import queue
+from typing import Iterable, Optional, Tuple
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from database.database_manager import DataManager, DataNotifier, target_db_path
+from logger_setup import logger
+
+
+class DatabaseWriter(QThread):
+    """
+    A write-behind queue that performs inserts and deletes on a dedicated thread.
+
+    The GUI thread only enqueues jobs, so a slow disk never stalls input. The thread
+    gets its own connection from the connection manager through a private DataManager; row
+    changes are announced on the shared DataNotifier, whose signals Qt queues back
+    to the table models on the GUI thread.
+
+    Signals:
+        jobFinished (str, str, bool): The job kind ('insert', 'delete', 'restore' or
+            'compact'), the table ('' for compaction) and whether the write succeeded.
+    """
+    jobFinished = pyqtSignal(str, str, bool)
+
+    def __init__(self,
+                 db_name: str = target_db_path,
+                 notifier: Optional[DataNotifier] = None,
+                 parent=None) -> None:
+        super().__init__(parent)
+        self.db_name: str = db_name
+        self.notifier: DataNotifier = notifier if notifier is not None else DataNotifier()
+        self.jobs: "queue.Queue[Optional[Tuple[str, str, tuple]]]" = queue.Queue()
+
+    def insert_beck(self, *values) -> None:
+        """
+        Queues a row for the beck_table, in insert_into_beck_table argument order.
+
+        Args:
+            *values: The row values.
+        """
+        self.jobs.put(('insert', 'beck_table', values))
+
+    def insert_altman(self, *values) -> None:
+        """
+        Queues a row for the altman_table, in insert_into_altman_table argument order.
+
+        Args:
+            *values: The row values.
+        """
+        self.jobs.put(('insert', 'altman_table', values))
+
+    def delete_rows(self, table: str, row_ids: Iterable[int]) -> bool:
+        """
+        Queues the deletion of rows by primary key.
+
+        Args:
+            table (str): The table to delete from.
+            row_ids (Iterable[int]): The primary keys of the rows.
+
+        Returns:
+            bool: True once the job is queued; the outcome arrives through jobFinished.
+        """
+        self.jobs.put(('delete', table, tuple(row_ids)))
+        return True
+
+    def restore_rows(self, table: str, row_ids: Iterable[int]) -> bool:
+        """
+        Queues the restoration of soft-deleted rows by primary key.
+
+        Args:
+            table (str): The table the rows were deleted from.
+            row_ids (Iterable[int]): The primary keys of the rows.
+
+        Returns:
+            bool: True once the job is queued; the outcome arrives through jobFinished.
+        """
+        self.jobs.put(('restore', table, tuple(row_ids)))
+        return True
+
+    def compact(self) -> None:
+        """
+        Queues a compaction pass (see DataManager.compact) behind the pending writes.
+
+        Returns:
+            None
+        """
+        self.jobs.put(('compact', '', ()))
+
+    def is_idle(self) -> bool:
+        """
+        Returns whether no job is waiting in the queue.
+
+        Returns:
+            bool: True if the queue is empty.
+        """
+        return self.jobs.empty()
+
+    def stop(self) -> None:
+        """
+        Lets the queued jobs drain, then ends the thread and waits for it.
+
+        Returns:
+            None
+        """
+        if self.isRunning():
+            self.jobs.put(None)
+            self.wait()
+
+    def run(self) -> None:
+        """
+        Opens the writer connection and executes queued jobs until stop() is called.
+
+        The connection is closed by the connection manager when the thread finishes.
+
+        Returns:
+            None
+        """
+        manager = DataManager(self.db_name, notifier=self.notifier)
+        try:
+            while True:
+                job = self.jobs.get()
+                if job is None:
+                    break
+                self.execute(manager, *job)
+        finally:
+            manager.close()
+            del manager
+
+    def execute(self, manager: DataManager, kind: str, table: str, payload: tuple) -> None:
+        """
+        Performs one job on the writer connection and reports the outcome.
+
+        Args:
+            manager (DataManager): The writer thread's DataManager.
+            kind (str): 'insert', 'delete', 'restore' or 'compact'.
+            table (str): The table the job targets.
+            payload (tuple): The row values for an insert, the ids for a delete or restore.
+
+        Returns:
+            None
+        """
+        try:
+            if kind == 'insert' and table == 'beck_table':
+                success = manager.insert_into_beck_table(*payload) is not None
+            elif kind == 'insert' and table == 'altman_table':
+                success = manager.insert_into_altman_table(*payload) is not None
+            elif kind == 'delete':
+                success = manager.delete_rows(table, payload)
+            elif kind == 'restore':
+                success = manager.restore_rows(table, payload)
+            elif kind == 'compact':
+                success = manager.compact() is not None
+            else:
+                raise ValueError(f"Unknown job: {kind} {table}")
+        except Exception as e:
+            logger.error(f"Error executing queued {kind}: {table} {e}", exc_info=True)
+            success = False
+        self.jobFinished.emit(kind, table, success)
@@ -0,0 +1,121 @@
+import json
+from typing import Iterator, List, Sequence
+
+from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtSql import QSqlDatabase, QSqlQuery
+
+import tracker_config as tkc
+from database.connections import connections, target_db_path
+from database.exporter import export_rows
+from database.schema import LIVE_VIEWS, TABLE_COLUMNS, count_sql
+from logger_setup import logger
+
+
+def iter_row_chunks(db: QSqlDatabase, table: str,
+                    chunk_size: int = tkc.EXPORT_CHUNK_SIZE) -> Iterator[List[Sequence]]:
+    """
+    Streams a table's live rows in primary-key order through a forward-only query.
+
+    A forward-only QSqlQuery does not buffer the rows it has already returned, so
+    only the current chunk is ever held in memory. SQLite packs each row into one
+    json_array value, which costs one value() call per row instead of one per cell.
+
+    Args:
+        db (QSqlDatabase): The connection to read from.
+        table (str): The exam table.
+        chunk_size (int): The number of rows per chunk.
+
+    Yields:
+        List[Sequence]: The id followed by the column values of each row, chunk_size rows at a time.
+
+    Raises:
+        RuntimeError: If the query fails.
+    """
+    loads = json.loads
+    query = QSqlQuery(db)
+    query.setForwardOnly(True)
+    if not query.exec(f"SELECT json_array(id, {', '.join(TABLE_COLUMNS[table])}) "
+                      f"FROM {LIVE_VIEWS[table]} ORDER BY id"):
+        raise RuntimeError(query.lastError().text())
+    chunk: List[Sequence] = []
+    while query.next():
+        chunk.append(loads(query.value(0)))
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+    query.finish()
+
+
+def count_rows(db: QSqlDatabase, table: str) -> int:
+    """
+    Counts the live rows of a table.
+
+    Args:
+        db (QSqlDatabase): The connection to read from.
+        table (str): The exam table.
+
+    Returns:
+        int: The number of rows, or 0 if the query failed.
+    """
+    query = QSqlQuery(db)
+    query.setForwardOnly(True)
+    count = int(query.value(0)) if query.exec(count_sql(table)) and query.next() else 0
+    query.finish()
+    return count
+
+
+class ExportWorker(QThread):
+    """
+    Exports one exam table to CSV or JSON Lines (optionally .gz) off the GUI thread.
+
+    The worker streams the table through iter_row_chunks on the thread's own
+    read-only reader from the connection manager and reports progress after every chunk.
+
+    Signals:
+        progress (int, int): Rows written so far and the total row count.
+        exported (str, int): The output path and the number of rows written.
+        failed (str): The error message if the export did not complete.
+    """
+    progress = pyqtSignal(int, int)
+    exported = pyqtSignal(str, int)
+    failed = pyqtSignal(str)
+
+    def __init__(self,
+                 table: str,
+                 path: str,
+                 db_name: str = target_db_path,
+                 chunk_size: int = tkc.EXPORT_CHUNK_SIZE,
+                 parent=None) -> None:
+        super().__init__(parent)
+        self.table: str = table
+        self.path: str = path
+        self.db_name: str = db_name
+        self.chunk_size: int = chunk_size
+
+    def run(self) -> None:
+        """
+        Streams the table to the file on the thread's read-only reader.
+
+        Returns:
+            None
+        """
+        try:
+            db = connections.reader(self.db_name)
+            if not db.isOpen():
+                raise RuntimeError(db.lastError().text())
+            total = count_rows(db, self.table)
+            self.progress.emit(0, total)
+            written = export_rows(
+                self.path,
+                ('id',) + TABLE_COLUMNS[self.table],
+                iter_row_chunks(db, self.table, self.chunk_size),
+                progress=lambda rows: self.progress.emit(rows, total),
+                should_stop=self.isInterruptionRequested)
+            if self.isInterruptionRequested():
+                raise RuntimeError(f"cancelled after {written} rows")
+            self.exported.emit(self.path, written)
+        except Exception as e:
+            logger.error(f"Error exporting {self.table} to {self.path}: {e}", exc_info=True)
+            self.failed.emit(str(e))
@@ -0,0 +1,143 @@
+import csv
+import gzip
+import io
+import json
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+EXPORT_FORMATS: Tuple[str, ...] = ('csv', 'jsonl')
+
+
+def export_format(path: str) -> Tuple[str, bool]:
+    """
+    Infers the export format and compression from a file name.
+
+    Args:
+        path (str): The target file, e.g. 'beck.csv', 'beck.jsonl' or 'beck.jsonl.gz'.
+
+    Returns:
+        Tuple[str, bool]: The format ('csv' or 'jsonl') and whether to gzip the output.
+
+    Raises:
+        ValueError: If the extension is not a supported format.
+    """
+    name = path.lower()
+    compressed = name.endswith('.gz')
+    if compressed:
+        name = name[:-3]
+    for fmt in EXPORT_FORMATS:
+        if name.endswith(f'.{fmt}'):
+            return fmt, compressed
+    raise ValueError(f"Unsupported export file: {path} (use .csv, .jsonl, optionally .gz)")
+
+
+def open_export(path: str, compressed: bool) -> TextIO:
+    """
+    Opens a text stream for an export, gzip-compressed if requested.
+
+    Args:
+        path (str): The target file.
+        compressed (bool): Whether to gzip the output.
+
+    Returns:
+        TextIO: The stream; newline translation is left to the writers.
+    """
+    if compressed:
+        return io.TextIOWrapper(gzip.open(path, 'wb', compresslevel=6), encoding='utf-8', newline='')
+    return open(path, 'w', encoding='utf-8', newline='')
+
+
+def csv_lines(columns: Sequence[str], chunks: Iterable[List[Sequence]]) -> Iterator[str]:
+    """
+    Renders chunks of rows as CSV text, one string per chunk, after a header.
+
+    Args:
+        columns (Sequence[str]): The column names.
+        chunks (Iterable[List[Sequence]]): Rows grouped in chunks.
+
+    Yields:
+        str: The header, then the CSV text of each chunk.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    writer.writerow(columns)
+    yield buffer.getvalue()
+    for chunk in chunks:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(chunk)
+        yield buffer.getvalue()
+
+
+def jsonl_lines(columns: Sequence[str], chunks: Iterable[List[Sequence]]) -> Iterator[str]:
+    """
+    Renders chunks of rows as JSON Lines text, one string per chunk.
+
+    Args:
+        columns (Sequence[str]): The column names used as keys.
+        chunks (Iterable[List[Sequence]]): Rows grouped in chunks.
+
+    Yields:
+        str: The JSON Lines text of each chunk.
+    """
+    dumps = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+    for chunk in chunks:
+        yield ''.join(dumps(dict(zip(columns, row))) + '\n' for row in chunk)
+
+
+def counted(chunks: Iterable[List[Sequence]],
+            progress: Optional[Callable[[int], None]] = None) -> Iterator[List[Sequence]]:
+    """
+    Passes chunks through while reporting the running row count.
+
+    Args:
+        chunks (Iterable[List[Sequence]]): Rows grouped in chunks.
+        progress (Optional[Callable[[int], None]]): Called with the rows handed on so far, before each chunk.
+
+    Yields:
+        List[Sequence]: The chunks, unchanged.
+    """
+    seen = 0
+    for chunk in chunks:
+        seen += len(chunk)
+        if progress is not None:
+            progress(seen)
+        yield chunk
+
+
+def export_rows(path: str,
+                columns: Sequence[str],
+                chunks: Iterable[List[Sequence]],
+                progress: Optional[Callable[[int], None]] = None,
+                should_stop: Optional[Callable[[], bool]] = None) -> int:
+    """
+    Streams rows into a CSV or JSON Lines file, optionally gzip-compressed.
+
+    Only one chunk is held in memory at a time, so the memory used does not grow
+    with the number of rows exported.
+
+    Args:
+        path (str): The target file; its extension selects the format.
+        columns (Sequence[str]): The column names.
+        chunks (Iterable[List[Sequence]]): Rows grouped in chunks, e.g. from a forward-only query.
+        progress (Optional[Callable[[int], None]]): Called with the rows written so far.
+        should_stop (Optional[Callable[[], bool]]): Polled between chunks; returning True ends the export early.
+
+    Returns:
+        int: The number of rows written.
+    """
+    fmt, compressed = export_format(path)
+    written = 0
+
+    def tally(count: int) -> None:
+        nonlocal written
+        written = count
+        if progress is not None:
+            progress(count)
+
+    render = csv_lines if fmt == 'csv' else jsonl_lines
+    with open_export(path, compressed) as handle:
+        for text in render(columns, counted(chunks, tally)):
+            handle.write(text)
+            if should_stop is not None and should_stop():
+                break
+    return written
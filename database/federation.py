@@ -0,0 +1,284 @@
+import os
+import sqlite3
+import time
+import urllib.parse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+import tracker_config as tkc
+from database.schema import LIVE_VIEWS, SUMMARY_COLUMNS, TIMESTAMP_COLUMNS
+from logger_setup import logger
+
+registry_db_path = os.path.join(os.path.expanduser('~'), tkc.PATIENTS_DIR, tkc.PATIENT_REGISTRY_NAME)
+
+# SQLite's compile-time default for SQLITE_MAX_ATTACHED, used if the limit cannot be read.
+DEFAULT_ATTACH_LIMIT: int = 10
+
+# One shard's partial aggregate: (shard path, exams, summary total, summary min, summary max).
+Partial = Tuple[str, int, float, Optional[int], Optional[int]]
+
+
+class CohortResult(NamedTuple):
+    """
+    Merged outcome of a cohort query.
+
+    Attributes:
+        table (str): The exam table queried in every shard.
+        shards (int): The number of shards queried.
+        patients (int): The number of shards with at least one matching exam.
+        exams (int): The number of matching exams across all shards.
+        total (float): The sum of the matching exams' summary scores.
+        minimum (Optional[int]): The lowest matching summary score, None without matches.
+        maximum (Optional[int]): The highest matching summary score, None without matches.
+        matched (Tuple[str, ...]): The shards with at least one matching exam.
+        failed (Tuple[str, ...]): The shards that could not be read.
+        seconds (float): Wall-clock time of the whole query.
+    """
+    table: str
+    shards: int
+    patients: int
+    exams: int
+    total: float
+    minimum: Optional[int]
+    maximum: Optional[int]
+    matched: Tuple[str, ...]
+    failed: Tuple[str, ...]
+    seconds: float
+
+    @property
+    def mean(self) -> float:
+        """
+        Returns the mean summary score of the matching exams.
+
+        Returns:
+            float: The mean, 0.0 without matches.
+        """
+        return self.total / self.exams if self.exams else 0.0
+
+
+def read_only_uri(path: str) -> str:
+    """
+    Returns the URI that opens a database file read-only.
+
+    Args:
+        path (str): The database file.
+
+    Returns:
+        str: The mode=ro file URI.
+    """
+    return f"file:{urllib.parse.quote(os.path.abspath(path))}?mode=ro"
+
+
+def attach_limit() -> int:
+    """
+    Returns how many databases one connection of this SQLite build can attach.
+
+    Returns:
+        int: The SQLITE_LIMIT_ATTACHED of a fresh connection.
+    """
+    connection = sqlite3.connect(':memory:')
+    try:
+        return connection.getlimit(sqlite3.SQLITE_LIMIT_ATTACHED)
+    except (AttributeError, sqlite3.Error):
+        return DEFAULT_ATTACH_LIMIT
+    finally:
+        connection.close()
+
+
+def shard_paths(registry: str = registry_db_path) -> List[str]:
+    """
+    Lists the shard of every registered patient that exists on disk.
+
+    Shards registered but never opened by the app have no file yet and hold no
+    exams, so they are left out.
+
+    Args:
+        registry (str): The patient registry database.
+
+    Returns:
+        List[str]: The absolute shard paths, in registry order.
+    """
+    directory = os.path.dirname(os.path.abspath(registry))
+    connection = sqlite3.connect(read_only_uri(registry), uri=True)
+    try:
+        rows = connection.execute("SELECT shard FROM patients WHERE shard IS NOT NULL ORDER BY id").fetchall()
+    finally:
+        connection.close()
+    paths = [os.path.join(directory, shard) for shard, in rows]
+    return [path for path in paths if os.path.exists(path)]
+
+
+def batched(shards: Sequence[str], size: int) -> List[List[str]]:
+    """
+    Splits shards into batches of at most `size`.
+
+    Args:
+        shards (Sequence[str]): The shard paths.
+        size (int): The largest batch.
+
+    Returns:
+        List[List[str]]: The batches, in order.
+    """
+    size = max(1, size)
+    return [list(shards[start:start + size]) for start in range(0, len(shards), size)]
+
+
+def summary_filter(table: str,
+                   above: Optional[int] = None,
+                   first: Optional[str] = None,
+                   last: Optional[str] = None) -> Tuple[str, tuple]:
+    """
+    Builds the WHERE clause of a cohort query on a table's summary score and exam dates.
+
+    The date range is compared on the timestamp column so every shard answers it
+    from its live timestamp index.
+
+    Args:
+        table (str): The exam table.
+        above (Optional[int]): Only exams whose summary score is greater than this.
+        first (Optional[str]): Only exams on or after this day, yyyy-MM-dd.
+        last (Optional[str]): Only exams on or before this day, yyyy-MM-dd.
+
+    Returns:
+        Tuple[str, tuple]: The condition ('1' when unfiltered) and its bound values.
+    """
+    timestamp = TIMESTAMP_COLUMNS[table]
+    conditions, params = [], []
+    if first is not None:
+        conditions.append(f"{timestamp} >= CAST(strftime('%s', ?) AS INTEGER)")
+        params.append(first)
+    if last is not None:
+        conditions.append(f"{timestamp} < CAST(strftime('%s', ?, '+1 day') AS INTEGER)")
+        params.append(last)
+    if above is not None:
+        conditions.append(f"{SUMMARY_COLUMNS[table]} > ?")
+        params.append(above)
+    return ' AND '.join(conditions) or '1', tuple(params)
+
+
+def partial_aggregates_sql(table: str, where: str, count: int) -> str:
+    """
+    Builds the UNION ALL returning one partial aggregate row per attached shard.
+
+    Args:
+        table (str): The exam table.
+        where (str): The condition every shard applies.
+        count (int): The number of shards attached as s0 .. s{count - 1}.
+
+    Returns:
+        str: The SELECT statement; the condition's values are bound once per shard.
+    """
+    summary = SUMMARY_COLUMNS[table]
+    return ' UNION ALL '.join(
+        f"SELECT {index}, COUNT(*), TOTAL({summary}), MIN({summary}), MAX({summary}) "
+        f"FROM s{index}.{LIVE_VIEWS[table]} WHERE {where}"
+        for index in range(count))
+
+
+def batch_partials(table: str, where: str, params: tuple, shards: Sequence[str]) -> List[Partial]:
+    """
+    Attaches a batch of shards read-only to one connection and aggregates each of them.
+
+    Runs in a worker process.
+
+    Args:
+        table (str): The exam table.
+        where (str): The condition every shard applies.
+        params (tuple): The condition's bound values.
+        shards (Sequence[str]): The shard paths, no more than the attach limit.
+
+    Returns:
+        List[Partial]: One partial aggregate per shard.
+    """
+    connection = sqlite3.connect('file::memory:', uri=True)
+    try:
+        for index, shard in enumerate(shards):
+            connection.execute(f"ATTACH DATABASE ? AS s{index}", (read_only_uri(shard),))
+        rows = connection.execute(partial_aggregates_sql(table, where, len(shards)),
+                                  params * len(shards)).fetchall()
+    finally:
+        connection.close()
+    return [(shards[index], count, total, minimum, maximum) for index, count, total, minimum, maximum in rows]
+
+
+def merge_partials(table: str, partials: Sequence[Partial], failed: Sequence[str] = (),
+                   seconds: float = 0.0) -> CohortResult:
+    """
+    Merges per-shard partial aggregates into the cohort result.
+
+    Args:
+        table (str): The exam table.
+        partials (Sequence[Partial]): The partial aggregate of every shard read.
+        failed (Sequence[str]): The shards that could not be read.
+        seconds (float): The time the query took.
+
+    Returns:
+        CohortResult: The merged aggregate.
+    """
+    matched = tuple(shard for shard, count, *_ in partials if count)
+    minima = [minimum for _, count, _, minimum, _ in partials if count]
+    maxima = [maximum for _, count, _, _, maximum in partials if count]
+    return CohortResult(
+        table=table,
+        shards=len(partials) + len(failed),
+        patients=len(matched),
+        exams=sum(count for _, count, *_ in partials),
+        total=sum(total for _, _, total, _, _ in partials),
+        minimum=min(minima) if minima else None,
+        maximum=max(maxima) if maxima else None,
+        matched=matched,
+        failed=tuple(failed),
+        seconds=seconds)
+
+
+def cohort_summary(table: str,
+                   where: str = '1',
+                   params: tuple = (),
+                   shards: Optional[Sequence[str]] = None,
+                   workers: Optional[int] = tkc.FEDERATION_WORKERS,
+                   batch_size: int = tkc.FEDERATION_BATCH_SIZE) -> CohortResult:
+    """
+    Aggregates the summary scores of the exams matching a condition across patient shards.
+
+    Shards are grouped into batches of at most the ATTACH limit; each batch is
+    attached read-only to one in-memory connection and answered by a single UNION
+    ALL over the attached live views, one partial aggregate (count, total, min, max)
+    per shard. Batches are fanned out over a ProcessPoolExecutor and the partials are
+    merged here. Workers only use the stdlib sqlite3 driver and never import Qt.
+
+    Args:
+        table (str): The exam table.
+        where (str): The condition, e.g. from summary_filter(); every exam if omitted.
+        params (tuple): The condition's bound values.
+        shards (Optional[Sequence[str]]): The shards to query; every registered shard if omitted.
+        workers (Optional[int]): The worker processes; one per core if None. A single
+            batch, or a single worker, is answered in this process.
+        batch_size (int): The shards attached per connection, capped at the attach limit.
+
+    Returns:
+        CohortResult: The merged aggregate; unreadable batches are listed in failed.
+    """
+    started = time.perf_counter()
+    shards = list(shard_paths() if shards is None else shards)
+    batches = batched(shards, min(batch_size, attach_limit()))
+    workers = min(workers or os.cpu_count() or 1, len(batches))
+    partials: List[Partial] = []
+    failed: List[str] = []
+    if workers <= 1:
+        for batch in batches:
+            try:
+                partials.extend(batch_partials(table, where, params, batch))
+            except sqlite3.Error as e:
+                logger.error(f"Error querying shards {batch[0]} .. {batch[-1]}: {e}")
+                failed.extend(batch)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(batch_partials, table, where, params, batch): batch for batch in batches}
+            for future in as_completed(futures):
+                batch = futures[future]
+                try:
+                    partials.extend(future.result())
+                except Exception as e:
+                    logger.error(f"Error querying shards {batch[0]} .. {batch[-1]}: {e}")
+                    failed.extend(batch)
+    return merge_partials(table, partials, failed, time.perf_counter() - started)
@@ -0,0 +1,69 @@
+from typing import Optional
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+import tracker_config as tkc
+from database.database_manager import DataManager, DataNotifier, target_db_path
+from database.importer import Importer
+from logger_setup import logger
+
+
+class ImportWorker(QThread):
+    """
+    Imports a CSV or JSON Lines file (optionally .gz) off the GUI thread.
+
+    The worker runs the Importer over the thread's own connection from the connection
+    manager, which closes it when the thread finishes. Inserted chunks are not
+    announced one by one; once the import finishes the shared notifier gets a single
+    tableReset so the views re-read once.
+
+    Signals:
+        progress (int, int): Records read and rows inserted so far.
+        imported (str, int, int, int): The table, rows inserted, duplicates skipped and invalid records skipped.
+        failed (str): The error message if the import did not complete or some valid
+            records could not be written.
+    """
+    progress = pyqtSignal(int, int)
+    imported = pyqtSignal(str, int, int, int)
+    failed = pyqtSignal(str)
+
+    def __init__(self,
+                 path: str,
+                 table: Optional[str] = None,
+                 db_name: str = target_db_path,
+                 notifier: Optional[DataNotifier] = None,
+                 chunk_size: int = tkc.IMPORT_CHUNK_SIZE,
+                 parent=None) -> None:
+        super().__init__(parent)
+        self.path: str = path
+        self.table: Optional[str] = table
+        self.db_name: str = db_name
+        self.notifier: Optional[DataNotifier] = notifier
+        self.chunk_size: int = chunk_size
+
+    def run(self) -> None:
+        """
+        Imports the file on the thread's connection.
+
+        Returns:
+            None
+        """
+        manager: Optional[DataManager] = None
+        try:
+            manager = DataManager(self.db_name, notifier=DataNotifier())
+            result = Importer(manager, self.chunk_size).run(
+                self.path, self.table,
+                progress=self.progress.emit,
+                should_stop=self.isInterruptionRequested)
+            if self.notifier is not None and result.inserted:
+                self.notifier.tableReset.emit(result.table)
+            self.imported.emit(result.table, result.inserted, result.duplicates, result.invalid)
+            if result.failed:
+                self.failed.emit(f"{result.failed} records could not be written")
+        except Exception as e:
+            logger.error(f"Error importing {self.path}: {e}", exc_info=True)
+            self.failed.emit(str(e))
+        finally:
+            if manager is not None:
+                manager.close()
+            manager = None
@@ -0,0 +1,282 @@
+import argparse
+import calendar
+import csv
+import gzip
+import io
+import json
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Mapping, NamedTuple, Optional, Tuple
+
+import tracker_config as tkc
+from database.schema import ITEM_RANGES, TABLE_COLUMNS
+from logger_setup import logger
+
+DATE_FORMATS: Tuple[str, ...] = ('%Y-%m-%d', '%Y/%m/%d')
+TIME_FORMATS: Tuple[str, ...] = ('%H:%M:%S', '%H:%M')
+
+
+class ImportRowError(ValueError):
+    """Raised when a record cannot be turned into a valid exam row."""
+
+
+class ImportResult(NamedTuple):
+    """
+    Outcome of an import.
+
+    Attributes:
+        table (str): The table the rows were written to.
+        read (int): The records read from the file.
+        inserted (int): The rows written.
+        duplicates (int): Records skipped because their date and time were already stored or repeated in the file.
+        invalid (int): Records skipped because they failed validation or could not be parsed.
+        failed (int): Valid records that were not written because their chunk's insert failed.
+        seconds (float): Wall-clock time of the import.
+    """
+    table: str
+    read: int
+    inserted: int
+    duplicates: int
+    invalid: int
+    failed: int
+    seconds: float
+
+
+def open_text(path: str) -> io.TextIOBase:
+    """
+    Opens an import file as text, transparently decompressing .gz files.
+
+    Args:
+        path (str): The file to read.
+
+    Returns:
+        io.TextIOBase: The text stream.
+    """
+    if path.lower().endswith('.gz'):
+        return io.TextIOWrapper(gzip.open(path, 'rb'), encoding='utf-8-sig', newline='')
+    return open(path, 'r', encoding='utf-8-sig', newline='')
+
+
+def iter_records(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Streams the records of a CSV or JSON Lines file (optionally .gz) one at a time.
+
+    Args:
+        path (str): The file to read; '.jsonl' (or '.jsonl.gz') is read as JSON Lines, anything else as CSV.
+
+    Yields:
+        Any: One record per row or line, keyed by column name. A JSON line is yielded
+            as parsed, whatever its type; a line that is not valid JSON is yielded as an
+            ImportRowError, so one bad line does not end the stream.
+    """
+    name = path.lower()[:-3] if path.lower().endswith('.gz') else path.lower()
+    with open_text(path) as handle:
+        if name.endswith('.jsonl') or name.endswith('.json'):
+            for line in handle:
+                line = line.strip()
+                if line:
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError as e:
+                        yield ImportRowError(f"Invalid JSON: {e}")
+        else:
+            yield from csv.DictReader(handle)
+
+
+def detect_table(record: Mapping[str, Any]) -> str:
+    """
+    Works out which exam a record belongs to from its column names.
+
+    Args:
+        record (Mapping[str, Any]): The first record of a file.
+
+    Returns:
+        str: 'beck_table' or 'altman_table'.
+
+    Raises:
+        ImportRowError: If the record is not an object or matches neither exam.
+    """
+    if not isinstance(record, Mapping):
+        raise ImportRowError(f"Not an object: {record!r}")
+    for table, columns in TABLE_COLUMNS.items():
+        if columns[0] in record:
+            return table
+    raise ImportRowError(f"Cannot tell the exam from columns: {', '.join(record)}")
+
+
+def _parse(value: str, formats: Tuple[str, ...], kind: str) -> datetime:
+    for fmt in formats:
+        try:
+            return datetime.strptime(value.strip(), fmt)
+        except ValueError:
+            continue
+    raise ImportRowError(f"Invalid {kind}: {value!r}")
+
+
+def validate_record(table: str, record: Mapping[str, Any]) -> Tuple[int, tuple]:
+    """
+    Validates a record and normalises it into a row in insert order.
+
+    Dates become 'yyyy-MM-dd' and times 'hh:mm:ss', as written by the exam pages.
+    Items must lie in the table's ITEM_RANGES; a missing summary is computed as the sum
+    of the items, a present one must lie between 0 and the highest possible total.
+
+    Args:
+        table (str): The exam table.
+        record (Mapping[str, Any]): The record read from the file.
+
+    Returns:
+        Tuple[int, tuple]: The epoch timestamp of the exam and the row values.
+
+    Raises:
+        ImportRowError: If the record is not an object, is missing values or any value is out of range.
+    """
+    if not isinstance(record, Mapping):
+        raise ImportRowError(f"Not an object: {record!r}")
+    columns = TABLE_COLUMNS[table]
+    date_column, time_column, items, summary_column = columns[0], columns[1], columns[2:-1], columns[-1]
+    low, high = ITEM_RANGES[table]
+    try:
+        day = _parse(str(record[date_column]), DATE_FORMATS, date_column)
+        moment = _parse(str(record[time_column]), TIME_FORMATS, time_column)
+    except KeyError as e:
+        raise ImportRowError(f"Missing column: {e.args[0]}")
+    stamp = datetime.combine(day.date(), moment.time())
+
+    scores: List[int] = []
+    for item in items:
+        value = record.get(item)
+        try:
+            score = int(value)
+        except (TypeError, ValueError):
+            raise ImportRowError(f"Invalid {item}: {value!r}")
+        if not low <= score <= high or str(score) != str(value).strip():
+            raise ImportRowError(f"{item} out of range {low}-{high}: {value!r}")
+        scores.append(score)
+
+    total = sum(scores)
+    summary = record.get(summary_column)
+    if summary not in (None, ''):
+        try:
+            total = int(summary)
+        except (TypeError, ValueError):
+            raise ImportRowError(f"Invalid {summary_column}: {summary!r}")
+        if not 0 <= total <= high * len(items):
+            raise ImportRowError(f"{summary_column} out of range 0-{high * len(items)}: {summary!r}")
+
+    row = (stamp.strftime('%Y-%m-%d'), stamp.strftime('%H:%M:%S'), *scores, total)
+    return calendar.timegm(stamp.timetuple()), row
+
+
+class Importer:
+    """
+    Streams exam rows from a file into the database in validated, deduplicated chunks.
+
+    The store is duck-typed so the same importer runs on DataManager (Qt) and on the
+    headless stdlib store: it needs insert_many_beck, insert_many_altman and
+    existing_timestamps(table, timestamps). Duplicates are exams whose date and time
+    are already stored, found through the timestamp index, or repeated in the file.
+    Each chunk is committed before the next one is checked, so repeats across chunks
+    are caught by the index and only the current chunk is held in memory. Records that
+    cannot be parsed or validated are counted and skipped; a chunk whose insert fails
+    is counted as failed and the import goes on with the next one.
+
+    Attributes:
+        store (Any): Where rows are looked up and written.
+        chunk_size (int): Records validated and committed per transaction.
+    """
+
+    def __init__(self, store: Any, chunk_size: int = tkc.IMPORT_CHUNK_SIZE) -> None:
+        self.store: Any = store
+        self.chunk_size: int = chunk_size
+
+    def run(self, path: str, table: Optional[str] = None,
+            progress: Optional[Callable[[int, int], None]] = None,
+            should_stop: Optional[Callable[[], bool]] = None) -> ImportResult:
+        """
+        Imports a file.
+
+        Args:
+            path (str): The CSV or JSON Lines file, optionally .gz.
+            table (Optional[str]): The target table; detected from the first record if omitted.
+            progress (Optional[Callable[[int, int], None]]): Called with the records read and rows inserted after each chunk.
+            should_stop (Optional[Callable[[], bool]]): Polled between chunks; returning True ends the import
+                after the chunks already committed.
+
+        Returns:
+            ImportResult: The counts of the import.
+        """
+        started = time.perf_counter()
+        read = inserted = duplicates = invalid = failed = 0
+        chunk: Dict[int, tuple] = {}
+
+        def flush() -> None:
+            nonlocal inserted, duplicates, failed
+            stored = self.store.existing_timestamps(table, list(chunk))
+            rows = [row for stamp, row in chunk.items() if stamp not in stored]
+            duplicates += len(chunk) - len(rows)
+            if rows:
+                insert = (self.store.insert_many_beck if table == 'beck_table'
+                          else self.store.insert_many_altman)
+                written = insert(rows).rows
+                inserted += written
+                if written < len(rows):
+                    failed += len(rows) - written
+                    logger.error(f"Import {path}: {len(rows) - written} of {len(rows)} records "
+                                 f"up to record {read} were not written")
+            chunk.clear()
+            if progress is not None:
+                progress(read, inserted)
+
+        for record in iter_records(path):
+            read += 1
+            try:
+                if isinstance(record, ImportRowError):
+                    raise record
+                if table is None:
+                    table = detect_table(record)
+                stamp, row = validate_record(table, record)
+            except ImportRowError as e:
+                invalid += 1
+                if invalid <= tkc.IMPORT_MAX_REPORTED_ERRORS:
+                    logger.error(f"Import {path} record {read}: {e}")
+                continue
+            if stamp in chunk:
+                duplicates += 1
+                continue
+            chunk[stamp] = row
+            if len(chunk) >= self.chunk_size:
+                flush()
+                if should_stop is not None and should_stop():
+                    break
+        if chunk:
+            flush()
+
+        result = ImportResult(table or '', read, inserted, duplicates, invalid, failed,
+                              time.perf_counter() - started)
+        logger.info(f"Imported {path}: {result}")
+        return result
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Command-line entry point: python -m database.importer FILE [--table TABLE] [--db PATH].
+    """
+    parser = argparse.ArgumentParser(description="Import Beck or Altman exams from CSV/JSONL.")
+    parser.add_argument('path', help="CSV or JSON Lines file, optionally .gz")
+    parser.add_argument('--table', choices=sorted(TABLE_COLUMNS), help="detected from the columns if omitted")
+    parser.add_argument('--db', help="database file (defaults to the app database)")
+    args = parser.parse_args(argv)
+
+    from database.sqlite_store import SQLiteStore, target_db_path
+
+    store = SQLiteStore(args.db or target_db_path)
+    result = Importer(store).run(args.path, args.table)
+    store.close()
+    print(f"{result.table}: read {result.read}, inserted {result.inserted}, "
+          f"duplicates {result.duplicates}, invalid {result.invalid}, failed {result.failed} "
+          f"in {result.seconds:.2f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,145 @@
+from typing import List, NamedTuple, Tuple
+
+from database.rollups import create_dirty_days_table_sql, rollup_statements, tombstone_rollup_triggers_sql
+from database.schema import EDIT_COUNTS_TABLE, LIVE_VIEWS, SUMMARY_COLUMNS, TABLE_COLUMNS, TIMESTAMP_COLUMNS
+
+
+class Migration(NamedTuple):
+    """
+    One step of the schema history.
+
+    Attributes:
+        version (int): The PRAGMA user_version the database is at once the step is applied.
+        description (str): What the step changes.
+        statements (Tuple[str, ...]): The SQL run, in order, inside one transaction.
+    """
+    version: int
+    description: str
+    statements: Tuple[str, ...]
+
+
+def _timestamp_statements(table: str, date_column: str, time_column: str) -> Tuple[str, ...]:
+    """
+    Builds the statements adding an epoch timestamp and its covering index to a table.
+
+    The timestamp is a generated column over the free-text date and time, so every
+    existing row is backfilled by definition and every insert path fills it without
+    having to know about it. The index stores the computed value next to the summary,
+    which makes date-range lookups and summary trends index-only seeks.
+
+    Args:
+        table (str): The exam table.
+        date_column (str): The 'yyyy-MM-dd' date column.
+        time_column (str): The 'hh:mm:ss' time column.
+
+    Returns:
+        Tuple[str, ...]: The ALTER TABLE and CREATE INDEX statements.
+    """
+    timestamp = TIMESTAMP_COLUMNS[table]
+    return (
+        f"ALTER TABLE {table} ADD COLUMN {timestamp} INTEGER GENERATED ALWAYS AS "
+        f"(CAST(strftime('%s', {date_column} || ' ' || {time_column}) AS INTEGER)) VIRTUAL",
+        f"CREATE INDEX IF NOT EXISTS idx_{table}_{timestamp} "
+        f"ON {table}({timestamp}, {SUMMARY_COLUMNS[table]})",
+    )
+
+
+def _tombstone_statements(table: str) -> Tuple[str, ...]:
+    """
+    Builds the statements adding soft deletion to a table.
+
+    Rows get a deleted_at tombstone (epoch seconds) and a view over the rows without
+    one. The timestamp index is rebuilt as a partial index over live rows, so it stays
+    covering for the view, and a second partial index over tombstones lets compaction
+    find old ones without scanning the table. The rollup triggers are replaced with
+    ones that only count live rows.
+
+    Args:
+        table (str): The exam table.
+
+    Returns:
+        Tuple[str, ...]: The ALTER TABLE, index, view and trigger statements.
+    """
+    timestamp = TIMESTAMP_COLUMNS[table]
+    columns = ', '.join(('id',) + TABLE_COLUMNS[table] + (timestamp,))
+    return (
+        f"ALTER TABLE {table} ADD COLUMN deleted_at INTEGER",
+        f"DROP INDEX IF EXISTS idx_{table}_{timestamp}",
+        f"CREATE INDEX idx_{table}_{timestamp} "
+        f"ON {table}({timestamp}, {SUMMARY_COLUMNS[table]}) WHERE deleted_at IS NULL",
+        f"CREATE INDEX IF NOT EXISTS idx_{table}_deleted_at ON {table}(deleted_at) WHERE deleted_at IS NOT NULL",
+        f"CREATE VIEW IF NOT EXISTS {LIVE_VIEWS[table]} AS "
+        f"SELECT {columns} FROM {table} WHERE deleted_at IS NULL",
+    ) + tombstone_rollup_triggers_sql(table)
+
+
+def _edit_count_statements(table: str) -> Tuple[str, ...]:
+    """
+    Builds the statements counting a table's row updates in EDIT_COUNTS_TABLE.
+
+    Only updates are counted: they are rare (cell edits, tombstoning, restoring), so
+    batch inserts pay nothing for the counter.
+
+    Args:
+        table (str): The exam table.
+
+    Returns:
+        Tuple[str, ...]: The seed row and the CREATE TRIGGER statement.
+    """
+    return (
+        f"INSERT OR IGNORE INTO {EDIT_COUNTS_TABLE} (name, edits) VALUES ('{table}', 0)",
+        f"CREATE TRIGGER IF NOT EXISTS {table}_edit_count AFTER UPDATE ON {table}\n"
+        f"BEGIN\n    UPDATE {EDIT_COUNTS_TABLE} SET edits = edits + 1 WHERE name = '{table}';\nEND",
+    )
+
+
+MIGRATIONS: Tuple[Migration, ...] = (
+    Migration(
+        1,
+        "Add epoch timestamps and covering timestamp indexes to the exam tables",
+        _timestamp_statements('beck_table', 'beck_date', 'beck_time')
+        + _timestamp_statements('altman_table', 'altman_date', 'altman_time'),
+    ),
+    Migration(
+        2,
+        "Add trigger-maintained daily/weekly/monthly rollups of every exam score",
+        rollup_statements('beck_table') + rollup_statements('altman_table'),
+    ),
+    Migration(
+        3,
+        "Add deleted_at tombstones, live-row views and tombstone-aware rollup triggers",
+        _tombstone_statements('beck_table') + _tombstone_statements('altman_table'),
+    ),
+    Migration(
+        4,
+        "Count row updates per exam table for cache invalidation",
+        (f"CREATE TABLE IF NOT EXISTS {EDIT_COUNTS_TABLE} (name TEXT PRIMARY KEY, edits INTEGER NOT NULL)",)
+        + _edit_count_statements('beck_table') + _edit_count_statements('altman_table'),
+    ),
+    Migration(
+        5,
+        "Recompute rollup buckets once per statement instead of rescanning them per removed row",
+        (create_dirty_days_table_sql('beck_table'),) + tombstone_rollup_triggers_sql('beck_table')
+        + (create_dirty_days_table_sql('altman_table'),) + tombstone_rollup_triggers_sql('altman_table'),
+    ),
+    Migration(
+        6,
+        "Only record the day of a tombstoned row for the rollup refresh",
+        tombstone_rollup_triggers_sql('beck_table') + tombstone_rollup_triggers_sql('altman_table'),
+    ),
+)
+
+SCHEMA_VERSION: int = MIGRATIONS[-1].version
+
+
+def pending_migrations(current_version: int) -> List[Migration]:
+    """
+    Returns the migrations a database at the given version still needs, oldest first.
+
+    Args:
+        current_version (int): The database's PRAGMA user_version.
+
+    Returns:
+        List[Migration]: The migrations to apply.
+    """
+    return [migration for migration in MIGRATIONS if migration.version > current_version]
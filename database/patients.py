@@ -0,0 +1,224 @@
+import os
+import time
+from typing import List, NamedTuple, Optional
+
+from PyQt6.QtSql import QSqlDatabase, QSqlQuery
+
+import tracker_config as tkc
+from database.connections import connections, target_db_path
+from logger_setup import logger
+
+# Patients' shards and the registry that lists them.
+patients_dir = os.path.join(os.path.expanduser('~'), tkc.PATIENTS_DIR)
+registry_db_path = os.path.join(patients_dir, tkc.PATIENT_REGISTRY_NAME)
+
+CREATE_PATIENTS_SQL: str = (
+    "CREATE TABLE IF NOT EXISTS patients ("
+    "id INTEGER PRIMARY KEY, "
+    "name TEXT NOT NULL UNIQUE, "
+    "shard TEXT UNIQUE, "
+    "created_at INTEGER NOT NULL, "
+    "last_opened_at INTEGER)")
+PATIENT_COLUMNS: str = "id, name, shard"
+
+
+class Patient(NamedTuple):
+    """
+    A registered patient and the shard their exams are stored in.
+
+    Attributes:
+        id (int): The registry id.
+        name (str): The display name, unique in the registry.
+        shard (str): The absolute path of the patient's SQLite database.
+    """
+    id: int
+    name: str
+    shard: str
+
+
+def shard_name(patient_id: int) -> str:
+    """
+    Returns the file name of a new patient's shard.
+
+    Args:
+        patient_id (int): The registry id.
+
+    Returns:
+        str: The shard file name, relative to the patients directory.
+    """
+    return f"patient_{patient_id:06d}.db"
+
+
+class PatientRegistry:
+    """
+    Lists patients and maps each one to their own SQLite shard.
+
+    Every patient's Beck and Altman history lives in a separate database file under
+    tkc.PATIENTS_DIR, so each shard's tables and indexes only ever hold one patient's
+    exams. The registry itself is a small SQLite file next to the shards. The first
+    time it is opened, the single pre-registry database is registered as the
+    tkc.DEFAULT_PATIENT_NAME patient, so existing history stays where it is.
+
+    Attributes:
+        db_name (str): The path of the registry database.
+        shard_dir (str): The directory new shards are created in.
+    """
+
+    def __init__(self,
+                 db_name: str = registry_db_path,
+                 shard_dir: str = patients_dir,
+                 default_shard: str = target_db_path) -> None:
+        """
+        Opens the registry on the calling thread's connection, creating it if needed.
+
+        Args:
+            db_name (str): The path of the registry database.
+            shard_dir (str): The directory new shards are created in.
+            default_shard (str): The database registered as the default patient in a
+                new registry.
+        """
+        self.db_name: str = db_name
+        self.shard_dir: str = shard_dir
+        try:
+            os.makedirs(shard_dir, exist_ok=True)
+            os.makedirs(os.path.dirname(os.path.abspath(db_name)), exist_ok=True)
+            query = QSqlQuery(self.db)
+            if not query.exec(CREATE_PATIENTS_SQL):
+                logger.error(f"Error creating patient registry: {query.lastError().text()}")
+            query.finish()
+            if not self.patients():
+                self.add(tkc.DEFAULT_PATIENT_NAME, default_shard)
+        except Exception as e:
+            logger.error(f"Error opening patient registry {db_name}: {e}", exc_info=True)
+
+    @property
+    def db(self) -> QSqlDatabase:
+        """
+        Returns the calling thread's connection to the registry, reopening it if the pool closed it.
+
+        Returns:
+            QSqlDatabase: The registry connection.
+        """
+        return connections.connection(self.db_name)
+
+    def _patient(self, query: QSqlQuery) -> Patient:
+        shard = os.path.join(self.shard_dir, query.value(2))
+        return Patient(int(query.value(0)), query.value(1), shard)
+
+    def _select(self, where: str = '', *values) -> List[Patient]:
+        query = QSqlQuery(self.db)
+        query.setForwardOnly(True)
+        query.prepare(f"SELECT {PATIENT_COLUMNS} FROM patients {where}")
+        for value in values:
+            query.addBindValue(value)
+        patients = []
+        if query.exec():
+            while query.next():
+                patients.append(self._patient(query))
+        else:
+            logger.error(f"Error reading patient registry: {query.lastError().text()}")
+        query.finish()
+        return patients
+
+    def patients(self) -> List[Patient]:
+        """
+        Returns every registered patient, the most recently opened first.
+
+        Returns:
+            List[Patient]: The patients.
+        """
+        return self._select("ORDER BY last_opened_at IS NULL, last_opened_at DESC, name")
+
+    def get(self, patient_id: int) -> Optional[Patient]:
+        """
+        Looks a patient up by registry id.
+
+        Args:
+            patient_id (int): The registry id.
+
+        Returns:
+            Optional[Patient]: The patient, or None if no patient has that id.
+        """
+        found = self._select("WHERE id = ?", patient_id)
+        return found[0] if found else None
+
+    def find(self, name: str) -> Optional[Patient]:
+        """
+        Looks a patient up by name.
+
+        Args:
+            name (str): The patient's name.
+
+        Returns:
+            Optional[Patient]: The patient, or None if no patient has that name.
+        """
+        found = self._select("WHERE name = ?", name)
+        return found[0] if found else None
+
+    def add(self, name: str, shard: Optional[str] = None) -> Optional[Patient]:
+        """
+        Registers a patient.
+
+        The shard file itself is created and migrated by the first DataManager that
+        opens it.
+
+        Args:
+            name (str): The patient's name.
+            shard (Optional[str]): An existing database to use as the patient's shard;
+                a new file in the patients directory if omitted.
+
+        Returns:
+            Optional[Patient]: The registered patient, or None if the name is empty,
+                already taken or the insert failed.
+        """
+        name = name.strip()
+        if not name:
+            return None
+        db = self.db
+        query = QSqlQuery(db)
+        try:
+            if not db.transaction():
+                logger.error(f"Error starting transaction: {db.lastError().text()}")
+                return None
+            query.prepare("INSERT INTO patients (name, shard, created_at) VALUES (?, ?, ?) RETURNING id")
+            query.addBindValue(name)
+            query.addBindValue(shard)
+            query.addBindValue(int(time.time()))
+            if not query.exec() or not query.next():
+                raise RuntimeError(query.lastError().text())
+            patient_id = int(query.value(0))
+            query.finish()
+            if shard is None:
+                shard = shard_name(patient_id)
+                query.prepare("UPDATE patients SET shard = ? WHERE id = ?")
+                query.addBindValue(shard)
+                query.addBindValue(patient_id)
+                if not query.exec():
+                    raise RuntimeError(query.lastError().text())
+            if not db.commit():
+                raise RuntimeError(db.lastError().text())
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error registering patient {name}: {e}")
+            return None
+        finally:
+            query.finish()
+        return Patient(patient_id, name, os.path.join(self.shard_dir, shard))
+
+    def touch(self, patient_id: int) -> None:
+        """
+        Records that a patient was opened, for the most-recent-first ordering.
+
+        Args:
+            patient_id (int): The registry id.
+
+        Returns:
+            None
+        """
+        query = QSqlQuery(self.db)
+        query.prepare("UPDATE patients SET last_opened_at = ? WHERE id = ?")
+        query.addBindValue(int(time.time()))
+        query.addBindValue(patient_id)
+        if not query.exec():
+            logger.error(f"Error updating patient registry: {query.lastError().text()}")
+        query.finish()
@@ -0,0 +1,282 @@
+from typing import Dict, List, Tuple
+
+from database.schema import TABLE_COLUMNS, TIMESTAMP_COLUMNS
+
+ROLLUP_TABLES: Dict[str, str] = {
+    'beck_table': 'beck_rollup',
+    'altman_table': 'altman_rollup',
+}
+
+# Days whose buckets lost a row since the last refresh. Removal triggers only record
+# the day; refresh_rollup_sql() recomputes the touched buckets once per statement.
+DIRTY_DAYS_TABLES: Dict[str, str] = {
+    'beck_table': 'beck_rollup_dirty',
+    'altman_table': 'altman_rollup_dirty',
+}
+
+# Bucket key (the first day of the bucket, 'yyyy-MM-dd') as a function of an epoch
+# timestamp expression, and the modifier that moves a bucket key to the next bucket.
+PERIODS: Dict[str, Tuple[str, str]] = {
+    'day': ("date({ts}, 'unixepoch')", '+1 day'),
+    'week': ("date({ts}, 'unixepoch', 'weekday 0', '-6 days')", '+7 days'),
+    'month': ("date({ts}, 'unixepoch', 'start of month')", '+1 month'),
+}
+
+
+def metric_columns(table: str) -> Tuple[str, ...]:
+    """
+    Returns the scored columns of an exam table: every item and the summary.
+
+    Args:
+        table (str): The exam table.
+
+    Returns:
+        Tuple[str, ...]: The columns rolled up.
+    """
+    return TABLE_COLUMNS[table][2:]
+
+
+def rollup_columns(table: str) -> List[str]:
+    """
+    Returns the aggregate columns of a rollup table in storage order.
+
+    Args:
+        table (str): The exam table.
+
+    Returns:
+        List[str]: A <column>_sum, <column>_min and <column>_max for every metric column.
+    """
+    return [f"{column}_{aggregate}" for column in metric_columns(table)
+            for aggregate in ('sum', 'min', 'max')]
+
+
+def _bucket(period: str, ts: str) -> str:
+    return PERIODS[period][0].format(ts=ts)
+
+
+def create_rollup_table_sql(table: str) -> str:
+    """
+    Builds the CREATE TABLE statement for a table's rollup.
+
+    Args:
+        table (str): The exam table.
+
+    Returns:
+        str: The statement.
+    """
+    aggregates = ',\n'.join(f"    {column} INTEGER" for column in rollup_columns(table))
+    return (f"CREATE TABLE IF NOT EXISTS {ROLLUP_TABLES[table]} (\n"
+            f"    period TEXT NOT NULL,\n"
+            f"    bucket TEXT NOT NULL,\n"
+            f"    n INTEGER NOT NULL,\n"
+            f"{aggregates},\n"
+            f"    PRIMARY KEY (period, bucket)\n"
+            f") WITHOUT ROWID")
+
+
+def _add_row_sql(table: str, period: str, row: str) -> str:
+    """
+    Builds the UPSERT folding one row (NEW or OLD) into its bucket.
+    """
+    timestamp = f"{row}.{TIMESTAMP_COLUMNS[table]}"
+    values = ', '.join(f"{row}.{column}, {row}.{column}, {row}.{column}"
+                       for column in metric_columns(table))
+    updates = ',\n        '.join(
+        f"{column}_sum = coalesce({column}_sum, 0) + coalesce(excluded.{column}_sum, 0), "
+        f"{column}_min = coalesce(min({column}_min, excluded.{column}_min), {column}_min, excluded.{column}_min), "
+        f"{column}_max = coalesce(max({column}_max, excluded.{column}_max), {column}_max, excluded.{column}_max)"
+        for column in metric_columns(table))
+    return (f"INSERT INTO {ROLLUP_TABLES[table]}(period, bucket, n, {', '.join(rollup_columns(table))})\n"
+            f"    VALUES ('{period}', {_bucket(period, timestamp)}, 1, {values})\n"
+            f"    ON CONFLICT(period, bucket) DO UPDATE SET n = n + 1,\n"
+            f"        {updates};")
+
+
+def _remove_row_sql(table: str, period: str, row: str) -> str:
+    """
+    Builds the statements taking one row (OLD) out of its bucket's count and sums.
+
+    A min or max cannot be decremented; it is left as it is until refresh_rollup_sql()
+    recomputes the bucket, so removing a row never rescans the bucket per row.
+    """
+    rollup = ROLLUP_TABLES[table]
+    timestamp = f"{row}.{TIMESTAMP_COLUMNS[table]}"
+    updates = ', '.join(f"{column}_sum = {column}_sum - coalesce({row}.{column}, 0)"
+                        for column in metric_columns(table))
+    key = f"period = '{period}' AND bucket = {_bucket(period, timestamp)}"
+    return (f"UPDATE {rollup} SET n = n - 1, {updates} WHERE {key};\n"
+            f"    DELETE FROM {rollup} WHERE {key} AND n <= 0;")
+
+
+def _mark_dirty_sql(table: str, row: str) -> str:
+    """
+    Builds the INSERT recording the day of a removed row (OLD) for the next refresh.
+    """
+    return (f"INSERT OR IGNORE INTO {DIRTY_DAYS_TABLES[table]}(day) "
+            f"VALUES ({_bucket('day', f'{row}.{TIMESTAMP_COLUMNS[table]}')});")
+
+
+def create_dirty_days_table_sql(table: str) -> str:
+    """
+    Builds the CREATE TABLE statement for the days a table's rollup must recompute.
+
+    Args:
+        table (str): The exam table.
+
+    Returns:
+        str: The statement.
+    """
+    return f"CREATE TABLE IF NOT EXISTS {DIRTY_DAYS_TABLES[table]} (day TEXT PRIMARY KEY) WITHOUT ROWID"
+
+
+def create_rollup_triggers_sql(table: str, live_only: bool = False) -> Tuple[str, ...]:
+    """
+    Builds the triggers keeping a table's rollup current on insert, delete and edit.
+
+    An edit is handled as taking the old row out of its bucket and folding the new
+    row in. With live_only the rollup only counts rows without a tombstone: setting
+    deleted_at takes a row out, clearing it folds the row back in, and hard-deleting
+    a tombstoned row is a no-op. Setting deleted_at only records the row's day, since
+    the refresh that must follow rebuilds the bucket's count and sums as well.
+
+    Folding a row in is a per-row UPSERT. Taking one out only adjusts the count and
+    sums and records the row's day; the writer that removed rows runs
+    refresh_rollup_sql() before committing to recompute each touched bucket once.
+
+    Args:
+        table (str): The exam table.
+        live_only (bool): Whether the table has the deleted_at tombstone column.
+
+    Returns:
+        Tuple[str, ...]: The CREATE TRIGGER statements.
+    """
+    timestamp = TIMESTAMP_COLUMNS[table]
+    tracked = ', '.join(TABLE_COLUMNS[table] + (('deleted_at',) if live_only else ()))
+    new_counted = f"NEW.{timestamp} IS NOT NULL" + (" AND NEW.deleted_at IS NULL" if live_only else "")
+    old_counted = f"OLD.{timestamp} IS NOT NULL" + (" AND OLD.deleted_at IS NULL" if live_only else "")
+    add_new = '\n    '.join(_add_row_sql(table, period, 'NEW') for period in PERIODS)
+    remove_old = '\n    '.join([_remove_row_sql(table, period, 'OLD') for period in PERIODS]
+                                 + [_mark_dirty_sql(table, 'OLD')])
+    return (
+        f"CREATE TRIGGER IF NOT EXISTS {table}_rollup_insert AFTER INSERT ON {table}\n"
+        f"WHEN {new_counted}\n"
+        f"BEGIN\n    {add_new}\nEND",
+        f"CREATE TRIGGER IF NOT EXISTS {table}_rollup_delete AFTER DELETE ON {table}\n"
+        f"WHEN {old_counted}\n"
+        f"BEGIN\n    {remove_old}\nEND",
+        f"CREATE TRIGGER IF NOT EXISTS {table}_rollup_update_old AFTER UPDATE OF {tracked} ON {table}\n"
+        f"WHEN {old_counted}" + (" AND NEW.deleted_at IS NULL" if live_only else "") + "\n"
+        f"BEGIN\n    {remove_old}\nEND",
+        f"CREATE TRIGGER IF NOT EXISTS {table}_rollup_update_new AFTER UPDATE OF {tracked} ON {table}\n"
+        f"WHEN {new_counted}\n"
+        f"BEGIN\n    {add_new}\nEND",
+    ) + ((
+        f"CREATE TRIGGER IF NOT EXISTS {table}_rollup_tombstone AFTER UPDATE OF deleted_at ON {table}\n"
+        f"WHEN {old_counted} AND NEW.deleted_at IS NOT NULL\n"
+        f"BEGIN\n    {_mark_dirty_sql(table, 'OLD')}\nEND",
+    ) if live_only else ())
+
+
+def tombstone_rollup_triggers_sql(table: str) -> Tuple[str, ...]:
+    """
+    Builds the statements replacing a table's rollup triggers with the tombstone-aware set.
+
+    Args:
+        table (str): The exam table, which must already have the deleted_at column.
+
+    Returns:
+        Tuple[str, ...]: The DROP TRIGGER and CREATE TRIGGER statements.
+    """
+    drops = tuple(f"DROP TRIGGER IF EXISTS {table}_rollup_{event}"
+                  for event in ('insert', 'delete', 'update_old', 'update_new', 'tombstone'))
+    return drops + create_rollup_triggers_sql(table, live_only=True)
+
+
+def backfill_rollup_sql(table: str) -> Tuple[str, ...]:
+    """
+    Builds the statements filling a table's rollup from the rows already stored.
+
+    Args:
+        table (str): The exam table.
+
+    Returns:
+        Tuple[str, ...]: One INSERT ... SELECT per period.
+    """
+    timestamp = TIMESTAMP_COLUMNS[table]
+    aggregates = ', '.join(f"sum({column}), min({column}), max({column})"
+                           for column in metric_columns(table))
+    return tuple(
+        f"INSERT OR REPLACE INTO {ROLLUP_TABLES[table]}(period, bucket, n, {', '.join(rollup_columns(table))}) "
+        f"SELECT '{period}', {_bucket(period, timestamp)} AS bucket, count(*), {aggregates} "
+        f"FROM {table} WHERE {timestamp} IS NOT NULL GROUP BY bucket"
+        for period in PERIODS)
+
+
+def refresh_rollup_sql(table: str) -> Tuple[str, ...]:
+    """
+    Builds the statements recomputing every rollup bucket that lost rows since the last refresh.
+
+    For each period the buckets containing a recorded day are deleted and rebuilt
+    with one INSERT ... SELECT ... GROUP BY over their live rows, each bucket read once
+    through the timestamp index; buckets left without rows stay deleted. The recorded
+    days are cleared last. Run inside the transaction that removed the rows.
+
+    Args:
+        table (str): The exam table, which must have the deleted_at column.
+
+    Returns:
+        Tuple[str, ...]: A DELETE and an INSERT per period, then the DELETE of the recorded days.
+    """
+    rollup = ROLLUP_TABLES[table]
+    dirty = DIRTY_DAYS_TABLES[table]
+    timestamp = TIMESTAMP_COLUMNS[table]
+    aggregates = ', '.join(f"sum({column}), min({column}), max({column})"
+                           for column in metric_columns(table))
+    day = "CAST(strftime('%s', day) AS INTEGER)"
+    statements = []
+    for period, (_, step) in PERIODS.items():
+        buckets = f"SELECT DISTINCT {_bucket(period, day)} AS bucket FROM {dirty}"
+        statements.append(f"DELETE FROM {rollup} WHERE period = '{period}' AND bucket IN ({buckets})")
+        statements.append(
+            f"INSERT INTO {rollup}(period, bucket, n, {', '.join(rollup_columns(table))}) "
+            f"SELECT '{period}', buckets.bucket, count(*), {aggregates} "
+            f"FROM ({buckets}) AS buckets JOIN {table} "
+            f"ON {timestamp} >= CAST(strftime('%s', buckets.bucket) AS INTEGER) "
+            f"AND {timestamp} < CAST(strftime('%s', buckets.bucket, '{step}') AS INTEGER) "
+            f"WHERE deleted_at IS NULL GROUP BY buckets.bucket")
+    statements.append(f"DELETE FROM {dirty}")
+    return tuple(statements)
+
+
+def select_rollup_sql(table: str) -> str:
+    """
+    Builds the SELECT reading a period's buckets between two bucket keys.
+
+    Each result row is the bucket key, the row count, then the mean, min and max of
+    every metric column.
+
+    Args:
+        table (str): The exam table.
+
+    Returns:
+        str: The statement with the period, the first bucket (inclusive) and the last bucket (inclusive).
+    """
+    aggregates = ', '.join(f"CAST({column}_sum AS REAL) / n, {column}_min, {column}_max"
+                           for column in metric_columns(table))
+    return (f"SELECT bucket, n, {aggregates} FROM {ROLLUP_TABLES[table]} "
+            f"WHERE period = ? AND bucket >= ? AND bucket <= ? ORDER BY bucket")
+
+
+def rollup_statements(table: str) -> Tuple[str, ...]:
+    """
+    Returns every statement creating, wiring and backfilling a table's rollup.
+
+    Args:
+        table (str): The exam table.
+
+    Returns:
+        Tuple[str, ...]: The statements, in order.
+    """
+    return ((create_rollup_table_sql(table), create_dirty_days_table_sql(table))
+            + create_rollup_triggers_sql(table)
+            + backfill_rollup_sql(table))
@@ -0,0 +1,224 @@
+from typing import Dict, NamedTuple, Tuple
+
+# Column order used by every insert path (single row, batch and import).
+# The primary key is left out on purpose: SQLite assigns it.
+BECK_COLUMNS: Tuple[str, ...] = (
+    'beck_date',
+    'beck_time',
+    'sadness',
+    'outlook',
+    'guilt',
+    'solitude',
+    'sexdrive',
+    'hygiene',
+    'decisiveness',
+    'effort',
+    'interest',
+    'pessimism',
+    'victimhood',
+    'sleep',
+    'beck_summary',
+)
+
+ALTMAN_COLUMNS: Tuple[str, ...] = (
+    'altman_date',
+    'altman_time',
+    'altmans_sleep',
+    'altmans_speech',
+    'altmans_activity',
+    'altmans_cheer',
+    'altmans_confidence',
+    'altmans_summary',
+)
+
+TABLE_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    'beck_table': BECK_COLUMNS,
+    'altman_table': ALTMAN_COLUMNS,
+}
+
+# Epoch-second timestamp derived from each table's date and time columns (see migrations).
+TIMESTAMP_COLUMNS: Dict[str, str] = {
+    'beck_table': 'beck_timestamp',
+    'altman_table': 'altman_timestamp',
+}
+
+# Views over each table's rows that are not tombstoned (deleted_at IS NULL, see migrations).
+# Every reader goes through these; only writes and compaction touch the tables directly.
+LIVE_VIEWS: Dict[str, str] = {
+    'beck_table': 'beck_live',
+    'altman_table': 'altman_live',
+}
+
+# Per-table count of row updates, kept by triggers (see migrations). Inserts and deletes
+# already show in max(id) and the rollups; this catches edits that change neither,
+# e.g. moving an exam to another date within the same month.
+EDIT_COUNTS_TABLE: str = 'edit_counts'
+
+SUMMARY_COLUMNS: Dict[str, str] = {
+    'beck_table': 'beck_summary',
+    'altman_table': 'altmans_summary',
+}
+
+# Inclusive score range of every item, matching the slider ranges set in MainWindow.
+ITEM_RANGES: Dict[str, Tuple[int, int]] = {
+    'beck_table': (0, 3),
+    'altman_table': (0, 4),
+}
+
+# Bound parameters per statement for IN (...) lists; below SQLite's historic 999 limit.
+SQL_VARIABLE_CHUNK: int = 500
+
+
+class BatchInsertResult(NamedTuple):
+    """
+    Outcome of a batched insert.
+
+    Attributes:
+        table (str): The table the rows were written to.
+        rows (int): The number of rows written.
+        seconds (float): Wall-clock time spent preparing, binding and committing.
+        rows_per_second (float): Throughput of the batch.
+    """
+    table: str
+    rows: int
+    seconds: float
+    rows_per_second: float
+
+
+def create_table_sql(table: str) -> str:
+    """
+    Builds the CREATE TABLE statement of an exam table as DataManager creates it.
+
+    Args:
+        table (str): The name of the table.
+
+    Returns:
+        str: The statement; the date and time columns are TEXT, every score INTEGER.
+    """
+    columns = TABLE_COLUMNS[table]
+    definitions = ([f"{column} TEXT" for column in columns[:2]]
+                   + [f"{column} INTEGER" for column in columns[2:]])
+    return (f"CREATE TABLE IF NOT EXISTS {table} ("
+            f"id INTEGER PRIMARY KEY AUTOINCREMENT, {', '.join(definitions)})")
+
+
+def insert_sql(table: str) -> str:
+    """
+    Builds the positional INSERT statement for a table.
+
+    Args:
+        table (str): The name of the table.
+
+    Returns:
+        str: The INSERT statement with one placeholder per column.
+    """
+    columns = TABLE_COLUMNS[table]
+    return (f"INSERT INTO {table}({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' for _ in columns)})")
+
+
+def count_sql(table: str) -> str:
+    """
+    Builds the row count statement for a table.
+
+    Args:
+        table (str): The name of the table.
+
+    Returns:
+        str: The COUNT statement over the live rows.
+    """
+    return f"SELECT COUNT(*) FROM {LIVE_VIEWS[table]}"
+
+
+def select_by_id_sql(table: str) -> str:
+    """
+    Builds the single-row SELECT statement for a table.
+
+    Args:
+        table (str): The name of the table.
+
+    Returns:
+        str: The SELECT statement keyed on the primary key; tombstoned rows are not found.
+    """
+    return f"SELECT id, {', '.join(TABLE_COLUMNS[table])} FROM {LIVE_VIEWS[table]} WHERE id = ?"
+
+
+def select_range_sql(table: str) -> str:
+    """
+    Builds the date-range SELECT statement for a table.
+
+    The range is expressed in epoch seconds on the table's timestamp column so the
+    lookup is answered by the timestamp index.
+
+    Args:
+        table (str): The name of the table.
+
+    Returns:
+        str: The SELECT statement with a lower (inclusive) and upper (exclusive) bound.
+    """
+    timestamp = TIMESTAMP_COLUMNS[table]
+    return (f"SELECT id, {', '.join(TABLE_COLUMNS[table])} FROM {LIVE_VIEWS[table]} "
+            f"WHERE {timestamp} >= ? AND {timestamp} < ? ORDER BY {timestamp}")
+
+
+def timestamps_in_sql(table: str, count: int) -> str:
+    """
+    Builds the SELECT returning which of a list of timestamps already exist among a table's live rows.
+
+    Args:
+        table (str): The name of the table.
+        count (int): The number of timestamps bound.
+
+    Returns:
+        str: The SELECT statement, answered by the timestamp index.
+    """
+    timestamp = TIMESTAMP_COLUMNS[table]
+    return (f"SELECT DISTINCT {timestamp} FROM {LIVE_VIEWS[table]} "
+            f"WHERE {timestamp} IN ({', '.join('?' for _ in range(count))})")
+
+
+def soft_delete_in_sql(table: str, count: int) -> str:
+    """
+    Builds the set-based UPDATE that tombstones rows of a table.
+
+    Args:
+        table (str): The name of the table.
+        count (int): The number of primary keys bound after the deletion time.
+
+    Returns:
+        str: The UPDATE statement, returning the id of every live row it tombstoned.
+    """
+    return (f"UPDATE {table} SET deleted_at = ? "
+            f"WHERE id IN ({', '.join('?' for _ in range(count))}) AND deleted_at IS NULL "
+            "RETURNING id")
+
+
+def restore_in_sql(table: str, count: int) -> str:
+    """
+    Builds the set-based UPDATE that clears the tombstone of rows of a table.
+
+    Args:
+        table (str): The name of the table.
+        count (int): The number of primary keys bound.
+
+    Returns:
+        str: The UPDATE statement, returning the id of every row it restored.
+    """
+    return (f"UPDATE {table} SET deleted_at = NULL "
+            f"WHERE id IN ({', '.join('?' for _ in range(count))}) AND deleted_at IS NOT NULL "
+            "RETURNING id")
+
+
+def purge_tombstones_sql(table: str) -> str:
+    """
+    Builds the DELETE that removes one batch of old tombstones from a table.
+
+    Args:
+        table (str): The name of the table.
+
+    Returns:
+        str: The DELETE statement with the cutoff (epoch seconds, exclusive) and the batch size,
+        answered by the partial deleted_at index.
+    """
+    return (f"DELETE FROM {table} WHERE id IN "
+            f"(SELECT id FROM {table} WHERE deleted_at < ? ORDER BY deleted_at LIMIT ?)")
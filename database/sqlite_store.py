@@ -0,0 +1,241 @@
+import os
+import sqlite3
+import time
+from typing import Iterable, Iterator, List, Mapping, Optional, Sequence, Set, Union
+
+import tracker_config as tkc
+from database.migrations import pending_migrations
+from database.rollups import PERIODS, ROLLUP_TABLES, metric_columns, select_rollup_sql
+from database.schema import (LIVE_VIEWS, SQL_VARIABLE_CHUNK, TABLE_COLUMNS, BatchInsertResult, count_sql,
+                             create_table_sql, insert_sql, timestamps_in_sql)
+from logger_setup import logger
+
+target_db_path = os.path.join(os.path.expanduser('~'), tkc.DB_NAME)
+
+
+class SQLiteStore:
+    """
+    The stdlib sqlite3 counterpart of DataManager for scripted, headless use.
+
+    It opens the same database file with the same connection profile, creates the
+    tables and runs the same migrations, and offers the subset of the DataManager
+    API the importer and the command line need. Nothing here imports Qt, so a
+    cron job pays for the sqlite3 module and nothing else.
+
+    Attributes:
+        db_name (str): The database file.
+        connection (sqlite3.Connection): The open connection, in autocommit mode;
+            writes open their own transactions.
+    """
+
+    def __init__(self,
+                 db_name: str = target_db_path,
+                 pragmas: Optional[Mapping[str, Union[str, int]]] = None) -> None:
+        self.db_name: str = db_name
+        self.connection: sqlite3.Connection = sqlite3.connect(db_name, isolation_level=None)
+        self.apply_connection_profile(tkc.SQLITE_PRAGMAS if pragmas is None else pragmas)
+        self.setup_tables()
+
+    def apply_connection_profile(self, pragmas: Mapping[str, Union[str, int]]) -> None:
+        """
+        Applies PRAGMA settings to the open connection.
+
+        Args:
+            pragmas (Mapping[str, Union[str, int]]): PRAGMA names and the values to set.
+
+        Returns:
+            None
+        """
+        for name, value in pragmas.items():
+            try:
+                self.connection.execute(f"PRAGMA {name} = {value}").fetchall()
+            except sqlite3.Error as e:
+                logger.error(f"Error applying PRAGMA {name}: {e}")
+
+    def setup_tables(self) -> None:
+        """
+        Creates the exam tables if needed and applies every pending migration.
+
+        Each migration and its user_version bump commit together, as in DataManager.
+
+        Returns:
+            None
+        """
+        for table in TABLE_COLUMNS:
+            self.connection.execute(create_table_sql(table))
+        current = self.connection.execute("PRAGMA user_version").fetchone()[0]
+        for migration in pending_migrations(current):
+            try:
+                self.connection.execute("BEGIN")
+                for sql in migration.statements + (f"PRAGMA user_version = {migration.version}",):
+                    self.connection.execute(sql)
+                self.connection.execute("COMMIT")
+            except sqlite3.Error as e:
+                self.connection.execute("ROLLBACK")
+                logger.error(f"Error applying migration {migration.version} ({migration.description}): {e}")
+                return
+            logger.info(f"Applied migration {migration.version}: {migration.description}")
+
+    def close(self) -> None:
+        """
+        Closes the connection.
+
+        Returns:
+            None
+        """
+        self.connection.close()
+
+    def insert_many_beck(self, rows: Iterable[Union[Sequence, Mapping]]) -> BatchInsertResult:
+        """
+        Writes many beck_table rows in one transaction.
+
+        Args:
+            rows (Iterable[Union[Sequence, Mapping]]): Rows in BECK_COLUMNS order, or mappings keyed by column name.
+
+        Returns:
+            BatchInsertResult: The number of rows written and the throughput.
+        """
+        return self._insert_many('beck_table', rows)
+
+    def insert_many_altman(self, rows: Iterable[Union[Sequence, Mapping]]) -> BatchInsertResult:
+        """
+        Writes many altman_table rows in one transaction.
+
+        Args:
+            rows (Iterable[Union[Sequence, Mapping]]): Rows in ALTMAN_COLUMNS order, or mappings keyed by column name.
+
+        Returns:
+            BatchInsertResult: The number of rows written and the throughput.
+        """
+        return self._insert_many('altman_table', rows)
+
+    def _insert_many(self, table: str, rows: Iterable[Union[Sequence, Mapping]]) -> BatchInsertResult:
+        columns = TABLE_COLUMNS[table]
+        started = time.perf_counter()
+        values = [[row[column] for column in columns] if isinstance(row, Mapping) else row
+                  for row in rows]
+        try:
+            self.connection.execute("BEGIN")
+            written = self.connection.executemany(insert_sql(table), values).rowcount
+            self.connection.execute("COMMIT")
+        except (sqlite3.Error, ValueError) as e:
+            if self.connection.in_transaction:
+                self.connection.execute("ROLLBACK")
+            logger.error(f"Error during batch insertion: {table} {e}", exc_info=True)
+            return BatchInsertResult(table, 0, time.perf_counter() - started, 0.0)
+        seconds = time.perf_counter() - started
+        rate = written / seconds if seconds > 0 else float(written)
+        logger.info(f"Batch insert {table}: {written} rows in {seconds:.3f}s ({rate:.0f} rows/s)")
+        return BatchInsertResult(table, written, seconds, rate)
+
+    def existing_timestamps(self, table: str, timestamps: Sequence[int]) -> Set[int]:
+        """
+        Returns which of the given epoch timestamps already have a live row in a table.
+
+        Args:
+            table (str): The exam table.
+            timestamps (Sequence[int]): The timestamps to look up.
+
+        Returns:
+            Set[int]: The timestamps that are already stored.
+        """
+        found: Set[int] = set()
+        for start in range(0, len(timestamps), SQL_VARIABLE_CHUNK):
+            chunk = list(timestamps[start:start + SQL_VARIABLE_CHUNK])
+            found.update(value for value, in
+                         self.connection.execute(timestamps_in_sql(table, len(chunk)), chunk))
+        return found
+
+    def count_rows(self, table: str) -> int:
+        """
+        Counts the live rows of a table.
+
+        Args:
+            table (str): The exam table.
+
+        Returns:
+            int: The number of rows.
+        """
+        return self.connection.execute(count_sql(table)).fetchone()[0]
+
+    def latest_rows(self, table: str, limit: int) -> List[tuple]:
+        """
+        Returns the most recently added live rows of a table, newest first.
+
+        Args:
+            table (str): The exam table.
+            limit (int): The number of rows.
+
+        Returns:
+            List[tuple]: The id followed by the column values of each row.
+        """
+        return self.connection.execute(
+            f"SELECT id, {', '.join(TABLE_COLUMNS[table])} FROM {LIVE_VIEWS[table]} ORDER BY id DESC LIMIT ?",
+            (limit,)).fetchall()
+
+    def iter_row_chunks(self, table: str, chunk_size: int = tkc.EXPORT_CHUNK_SIZE) -> Iterator[List[Sequence]]:
+        """
+        Streams a table's live rows in primary-key order, chunk_size rows at a time.
+
+        Args:
+            table (str): The exam table.
+            chunk_size (int): The number of rows per chunk.
+
+        Yields:
+            List[Sequence]: The id followed by the column values of each row.
+        """
+        cursor = self.connection.execute(
+            f"SELECT id, {', '.join(TABLE_COLUMNS[table])} FROM {LIVE_VIEWS[table]} ORDER BY id")
+        while True:
+            chunk = cursor.fetchmany(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+    def fetch_rollup(self, table: str, period: str, first: str, last: str) -> List[dict]:
+        """
+        Reads precomputed per-day, per-week or per-month statistics of a table.
+
+        Args:
+            table (str): The exam table.
+            period (str): 'day', 'week' or 'month'.
+            first (str): The first bucket to read, as 'yyyy-MM-dd' (inclusive).
+            last (str): The last bucket to read, as 'yyyy-MM-dd' (inclusive).
+
+        Returns:
+            List[dict]: One dict per bucket, keyed as DataManager.fetch_rollup keys them.
+        """
+        if period not in PERIODS:
+            raise ValueError(f"Unknown rollup period: {period}")
+        names = ['bucket', 'count'] + [f"{column}_{aggregate}" for column in metric_columns(table)
+                                       for aggregate in ('mean', 'min', 'max')]
+        return [dict(zip(names, row)) for row in
+                self.connection.execute(select_rollup_sql(table), (period, first, last))]
+
+    def totals(self, table: str) -> dict:
+        """
+        Summarises a table from its monthly rollup without scanning the rows.
+
+        Args:
+            table (str): The exam table.
+
+        Returns:
+            dict: 'count', 'first' and 'last' (bucket keys) and the summary's 'mean', 'min' and 'max'.
+        """
+        summary = metric_columns(table)[-1]
+        row = self.connection.execute(
+            f"SELECT total(n), min(bucket), max(bucket), total({summary}_sum) / max(total(n), 1), "
+            f"min({summary}_min), max({summary}_max) FROM {ROLLUP_TABLES[table]} WHERE period = 'month'"
+        ).fetchone()
+        return dict(zip(('count', 'first', 'last', 'mean', 'min', 'max'), row))
+
+    def vacuum(self) -> None:
+        """
+        Checkpoints the write-ahead log, rebuilds the file and refreshes planner statistics.
+
+        Returns:
+            None
+        """
+        self.connection.execute(f"PRAGMA wal_checkpoint({tkc.SQLITE_CHECKPOINT_MODE})").fetchall()
+        self.connection.execute("VACUUM")
+        self.connection.execute("PRAGMA optimize").fetchall()
@@ -20,8 +20,13 @@ log_file = os.path.join(log_directory, tkc.LOG_FILE)
 
 logger = logging.getLogger(__name__)
 
-logging.basicConfig(level=logging.ERROR,
-                    format='%(asctime)s - %(levelname)s - %(message)s',
-                    datefmt=tkc.DATEFORMAT,
-                    filename=log_file,
-                    filemode=tkc.FILE_MODE)
+# Worker processes (e.g. of cohort queries) log through the parent's file as-is;
+# configuring it again there would truncate it (FILE_MODE 'w'). The file is only
+# opened, and truncated, by the first record, so a launch that just forwards its
+# command to the running instance leaves that instance's log alone.
+multiprocessing = sys.modules.get('multiprocessing')
+if multiprocessing is None or multiprocessing.parent_process() is None:
+    logging.basicConfig(level=logging.ERROR,
+                        format='%(asctime)s - %(levelname)s - %(message)s',
+                        datefmt=tkc.DATEFORMAT,
+                        handlers=[logging.FileHandler(log_file, mode=tkc.FILE_MODE, delay=True)])
@@ -1,33 +1,60 @@
-from PyQt6.QtWidgets import QApplication
-from ui.main_window import MainWindow
+from utility.app_operations.startup_profile import startup_profiler
+import gc
 import sys
+import tracker_config as tkc
 from logger_setup import logger
-# pyrcc5 resources.qrc -o resources.py
-from ui.main_ui import res
+from utility.app_operations.single_instance import InstanceServer, forward_command, parse_command
 
 
 def run_app():
     """
     Runs the application.
 
-    This function initializes the application, creates the main window,
-    and starts the event loop.
+    This function hands the launch's command to an already running instance if
+    there is one and exits; otherwise it initializes the application, creates the
+    main window, listens for later launches and starts the event loop. The widget,
+    window and database modules are only imported once this launch is known to be
+    the instance.
 
     Raises:
         Exception: If an error occurs during the execution of the application.
     """
     logger.info("ENTER BY PORTAL START YES!")
     try:
+        command = parse_command(sys.argv[1:])
+        if tkc.SINGLE_INSTANCE and forward_command(command):
+            sys.exit(0)
+        from PyQt6.QtCore import QTimer
+        from PyQt6.QtWidgets import QApplication
+        from ui.main_window import MainWindow
+        from database.connections import connections
+        # python -m ui.main_ui.build_resources (resources.qrc -> resources.rcc)
+        from ui.main_ui import res
+        startup_profiler.mark('imports')
         app = QApplication(sys.argv)
-        
+        startup_profiler.mark('QApplication')
+
         window = MainWindow()
         window.show()
-        sys.exit(app.exec())
+        startup_profiler.mark('show')
+        if tkc.SINGLE_INSTANCE:
+            instance = InstanceServer(app)
+            instance.commandReceived.connect(window.run_command)
+            instance.listen()
+        if command:
+            window.run_command(command)
+        # Runs once the event loop has processed the first expose and paint.
+        QTimer.singleShot(0, startup_profiler.finish)
+        exit_code = app.exec()
+        # The window (and, through its signal lambdas, a reference cycle) holds the models
+        # and statements; collect it first so the GUI thread's connection is unused.
+        window = None
+        gc.collect()
+        connections.release()
+        sys.exit(exit_code)
     except Exception as e:
         logger.error(f"Error at portal {e}", exc_info=True)
-    
+
 
 if __name__ == "__main__":
     run_app()
-
-
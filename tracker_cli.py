@@ -0,0 +1,217 @@
+"""
+Headless command line for scripted and scheduled work on the exam database.
+
+    python -m tracker_cli add beck 1 0 2 0 0 1 0 0 1 0 0 2 [--date 2024-05-01 --time 08:30]
+    python -m tracker_cli list altman [--limit 20]
+    python -m tracker_cli export beck beck.csv.gz
+    python -m tracker_cli import history.jsonl [--exam altman]
+    python -m tracker_cli stats beck [--period week --first 2024-01-01 --last 2024-12-31]
+    python -m tracker_cli vacuum
+    python -m tracker_cli cohort beck --above 28 --first 2024-05-01 --last 2024-05-31
+
+Everything goes through the stdlib sqlite3 driver (SQLiteStore); no Qt module is
+imported, so a run costs the interpreter start and the query, not the GUI.
+"""
+import argparse
+import sys
+from datetime import datetime
+from typing import List, Optional
+
+import tracker_config as tkc
+from database.exporter import export_rows
+from database.federation import cohort_summary, registry_db_path, shard_paths, summary_filter
+from database.importer import ImportRowError, Importer, validate_record
+from database.rollups import PERIODS
+from database.schema import TABLE_COLUMNS
+from database.sqlite_store import SQLiteStore, target_db_path
+from logger_setup import logger
+
+TABLES = {
+    'beck': 'beck_table',
+    'altman': 'altman_table',
+}
+
+
+def add(store: SQLiteStore, args: argparse.Namespace) -> int:
+    """
+    Validates one exam given as item scores and stores it.
+    """
+    table = TABLES[args.exam]
+    items = TABLE_COLUMNS[table][2:-1]
+    if len(args.scores) != len(items):
+        print(f"{args.exam} takes {len(items)} scores ({', '.join(items)}), got {len(args.scores)}",
+              file=sys.stderr)
+        return 2
+    now = datetime.now()
+    record = dict(zip(items, args.scores))
+    record[TABLE_COLUMNS[table][0]] = args.date or now.strftime('%Y-%m-%d')
+    record[TABLE_COLUMNS[table][1]] = args.time or now.strftime('%H:%M:%S')
+    try:
+        _, row = validate_record(table, record)
+    except ImportRowError as e:
+        print(e, file=sys.stderr)
+        return 2
+    insert = store.insert_many_beck if table == 'beck_table' else store.insert_many_altman
+    if not insert([row]).rows:
+        return 1
+    print(f"{table}: {', '.join(str(value) for value in row)}")
+    return 0
+
+
+def list_rows(store: SQLiteStore, args: argparse.Namespace) -> int:
+    """
+    Prints the latest exams of a table as tab-separated rows, newest first.
+    """
+    table = TABLES[args.exam]
+    print('\t'.join(('id',) + TABLE_COLUMNS[table]))
+    for row in store.latest_rows(table, args.limit):
+        print('\t'.join('' if value is None else str(value) for value in row))
+    return 0
+
+
+def export(store: SQLiteStore, args: argparse.Namespace) -> int:
+    """
+    Streams a table to CSV or JSON Lines, optionally gzipped.
+    """
+    table = TABLES[args.exam]
+    written = export_rows(args.path, ('id',) + TABLE_COLUMNS[table],
+                          store.iter_row_chunks(table, args.chunk_size))
+    print(f"{table}: exported {written} rows to {args.path}")
+    return 0
+
+
+def import_file(store: SQLiteStore, args: argparse.Namespace) -> int:
+    """
+    Imports a CSV or JSON Lines file with validation and dedup.
+    """
+    result = Importer(store).run(args.path, TABLES[args.exam] if args.exam else None)
+    print(f"{result.table}: read {result.read}, inserted {result.inserted}, "
+          f"duplicates {result.duplicates}, invalid {result.invalid}, failed {result.failed} "
+          f"in {result.seconds:.2f}s")
+    return 0 if result.table and not result.failed else 1
+
+
+def stats(store: SQLiteStore, args: argparse.Namespace) -> int:
+    """
+    Prints overall totals, or per-bucket summary statistics when a period is given.
+    """
+    tables = [TABLES[args.exam]] if args.exam else list(TABLES.values())
+    for table in tables:
+        if args.period is None:
+            totals = store.totals(table)
+            print(f"{table}: {int(totals['count'])} exams {totals['first'] or '-'} .. {totals['last'] or '-'}, "
+                  f"summary mean {totals['mean']:.2f} min {totals['min']} max {totals['max']}")
+            continue
+        summary = TABLE_COLUMNS[table][-1]
+        print(f"{table} by {args.period}")
+        for bucket in store.fetch_rollup(table, args.period, args.first, args.last):
+            print(f"{bucket['bucket']}\t{bucket['count']}\t{bucket[f'{summary}_mean']:.2f}\t"
+                  f"{bucket[f'{summary}_min']}\t{bucket[f'{summary}_max']}")
+    return 0
+
+
+def vacuum(store: SQLiteStore, args: argparse.Namespace) -> int:
+    """
+    Checkpoints, rebuilds and re-analyses the database file.
+    """
+    store.vacuum()
+    print(f"vacuumed {store.db_name}")
+    return 0
+
+
+def cohort(store: SQLiteStore, args: argparse.Namespace) -> int:
+    """
+    Prints how many patients and exams match a summary threshold and date range across every patient's shard.
+    """
+    table = TABLES[args.exam]
+    where, params = summary_filter(table, args.above, args.first, args.last)
+    result = cohort_summary(table, where, params, shard_paths(args.registry), workers=args.workers)
+    minimum = '-' if result.minimum is None else result.minimum
+    maximum = '-' if result.maximum is None else result.maximum
+    print(f"{table}: {result.patients} of {result.shards} patients, {result.exams} exams, "
+          f"summary mean {result.mean:.2f} min {minimum} max {maximum} ({result.seconds:.2f}s)")
+    for shard in result.failed:
+        print(f"unreadable shard: {shard}", file=sys.stderr)
+    return 1 if result.failed else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Builds the argument parser with one sub-command per task.
+
+    Returns:
+        argparse.ArgumentParser: The parser; each sub-command sets 'handler'.
+    """
+    parser = argparse.ArgumentParser(prog='tracker_cli', description="Beck and Altman exams without the GUI.")
+    parser.add_argument('--db', default=target_db_path, help="database file (defaults to the app database)")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    command = commands.add_parser('add', help="store one exam")
+    command.add_argument('exam', choices=TABLES)
+    command.add_argument('scores', nargs='+', help="item scores in column order")
+    command.add_argument('--date', help="yyyy-MM-dd, today if omitted")
+    command.add_argument('--time', help="hh:mm[:ss], now if omitted")
+    command.set_defaults(handler=add)
+
+    command = commands.add_parser('list', help="print the latest exams")
+    command.add_argument('exam', choices=TABLES)
+    command.add_argument('--limit', type=int, default=20)
+    command.set_defaults(handler=list_rows)
+
+    command = commands.add_parser('export', help="write a table to .csv or .jsonl, optionally .gz")
+    command.add_argument('exam', choices=TABLES)
+    command.add_argument('path')
+    command.add_argument('--chunk-size', type=int, default=tkc.EXPORT_CHUNK_SIZE)
+    command.set_defaults(handler=export)
+
+    command = commands.add_parser('import', help="load exams from .csv or .jsonl, optionally .gz")
+    command.add_argument('path')
+    command.add_argument('--exam', choices=TABLES, help="detected from the columns if omitted")
+    command.set_defaults(handler=import_file)
+
+    command = commands.add_parser('stats', help="print totals, or rollups per period")
+    command.add_argument('exam', nargs='?', choices=TABLES)
+    command.add_argument('--period', choices=PERIODS)
+    command.add_argument('--first', default='0000-01-01', help="first bucket, yyyy-MM-dd")
+    command.add_argument('--last', default='9999-12-31', help="last bucket, yyyy-MM-dd")
+    command.set_defaults(handler=stats)
+
+    command = commands.add_parser('vacuum', help="checkpoint, rebuild and optimize the database")
+    command.set_defaults(handler=vacuum)
+
+    command = commands.add_parser('cohort', help="count patients and exams matching a query across every patient")
+    command.add_argument('exam', choices=TABLES)
+    command.add_argument('--above', type=int, help="only exams whose summary score is greater than this")
+    command.add_argument('--first', help="first day, yyyy-MM-dd")
+    command.add_argument('--last', help="last day, yyyy-MM-dd")
+    command.add_argument('--registry', default=registry_db_path, help="patient registry database")
+    command.add_argument('--workers', type=int, default=tkc.FEDERATION_WORKERS,
+                         help="worker processes, one per core if omitted")
+    command.set_defaults(handler=cohort)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Runs one command against the database.
+
+    Args:
+        argv (Optional[List[str]]): The arguments; sys.argv[1:] if omitted.
+
+    Returns:
+        int: The process exit status.
+    """
+    args = build_parser().parse_args(argv)
+    store = SQLiteStore(args.db)
+    try:
+        return args.handler(store, args)
+    except Exception as e:
+        logger.error(f"Error running {args.command}: {e}", exc_info=True)
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        store.close()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
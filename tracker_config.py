@@ -10,5 +10,48 @@ DATEFORMAT = '%d-%b-%y %I:%M:%S %p'  # this is how you want it from now on lolol
 FILE_MODE = 'w'
 # database
 DB_NAME = 'the_one_and_only_babababy_june17.db'
-
-
+# patients: one database shard per patient, listed in a registry
+PATIENTS_DIR = 'beckAltman_patients'  # under the home directory, holds the registry and the shards
+PATIENT_REGISTRY_NAME = 'patients.db'
+DEFAULT_PATIENT_NAME = 'Default'  # the patient the pre-registry database (DB_NAME) is registered as
+CONNECTION_POOL_SIZE = 8  # database files a thread keeps open; the least recently used is closed beyond that
+FEDERATION_BATCH_SIZE = 125  # shards attached per connection by cohort queries, capped at SQLite's attach limit
+FEDERATION_WORKERS = None  # worker processes for cohort queries; one per core if None
+# startup
+SINGLE_INSTANCE = True  # a second launch forwards its command (--page, --add, --import) to the running window and exits
+INSTANCE_TIMEOUT_MS = 500  # how long a launch waits on the running instance's socket
+STARTUP_PROFILE = True  # write per-phase startup timings to the log
+LAZY_DATA_PAGES = True  # build the table models the first time their data page is shown, not at startup
+# table models
+MODEL_PAGE_SIZE = 256  # rows fetched per page by the exam table models
+MODEL_CACHED_PAGES = 8  # pages kept in memory per model before the oldest is dropped
+# sqlite connection profile, applied by DataManager whenever it opens a connection
+SQLITE_PRAGMAS = {
+    'auto_vacuum': 'INCREMENTAL',  # free pages can be returned by PRAGMA incremental_vacuum; takes effect on new files
+    'journal_mode': 'WAL',  # readers never block the writer, commits append to the -wal file
+    'synchronous': 'NORMAL',  # fsync at checkpoints instead of on every commit (safe under WAL)
+    'mmap_size': 268435456,  # 256 MiB of the file read through memory mapping
+    'cache_size': -16000,  # page cache in KiB when negative (~16 MiB)
+    'temp_store': 'MEMORY',  # temp tables and sort spill stay in RAM
+}
+# profile of the read-only reader connections; the file-level settings above are the writer's to make
+SQLITE_READER_PRAGMAS = {
+    'mmap_size': 268435456,
+    'cache_size': -16000,
+    'temp_store': 'MEMORY',
+}
+SQLITE_CHECKPOINT_MODE = 'TRUNCATE'  # wal_checkpoint mode used by DataManager.checkpoint()
+# soft delete
+TOMBSTONE_RETENTION_DAYS = 30  # deleted exams stay restorable this long before compaction purges them
+COMPACTION_BATCH_SIZE = 1000  # tombstoned rows hard-deleted per transaction by DataManager.compact()
+COMPACTION_IDLE_MINUTES = 10  # compaction is queued on the writer this often, when it has nothing else to do
+# commit
+COMMIT_BOTH_EXAMS = False  # default for the 'Commit Both Exams' toggle; otherwise only the showing exam is written
+# trends (Data > Exam Trends…)
+TREND_WINDOW = 7  # exams averaged by the rolling mean
+TREND_ALPHA = 0.2  # smoothing factor of the exponentially weighted trend
+TREND_MAX_LAG = 7  # days the Beck and Altman daily summaries are shifted by when correlated
+# export / import
+EXPORT_CHUNK_SIZE = 5000  # rows pulled from the forward-only query per write
+IMPORT_CHUNK_SIZE = 5000  # rows validated, deduplicated and committed per transaction
+IMPORT_MAX_REPORTED_ERRORS = 50  # invalid rows described in the log per import; the rest are only counted
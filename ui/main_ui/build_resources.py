@@ -0,0 +1,120 @@
+"""
+Compiles resources.qrc into the binary resource bundle resources.rcc.
+
+PyQt6 no longer ships pyrcc, so this writes Qt's binary resource format
+(`rcc -binary`, format version 1) directly. Run it after changing anything the
+.qrc lists:
+
+    python -m ui.main_ui.build_resources
+"""
+import os
+import struct
+import xml.etree.ElementTree as ElementTree
+from typing import Dict, List, Tuple, Union
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+QRC_PATH = os.path.join(HERE, 'resources.qrc')
+RCC_PATH = os.path.join(HERE, 'resources.rcc')
+
+FORMAT_VERSION = 1
+DIRECTORY_FLAG = 0x02
+LANGUAGE_C = 1
+TERRITORY_ANY = 0
+
+Tree = Dict[str, Union['Tree', bytes]]
+
+
+def qt_hash(name: str) -> int:
+    """
+    Hashes a path segment the way QResource looks it up.
+
+    Args:
+        name (str): The file or directory name.
+
+    Returns:
+        int: The 28-bit hash children are sorted by.
+    """
+    value = 0
+    encoded = name.encode('utf-16-be')
+    for unit in struct.unpack(f'>{len(encoded) // 2}H', encoded):
+        value = (value << 4) + unit
+        value ^= (value & 0xf0000000) >> 23
+        value &= 0x0fffffff
+    return value
+
+
+def read_qrc(path: str) -> Tree:
+    """
+    Reads a .qrc file into a tree of resource paths and file contents.
+
+    Args:
+        path (str): The .qrc file; listed files are relative to it.
+
+    Returns:
+        Tree: Nested dicts of directory names, with file contents as leaves.
+    """
+    root: Tree = {}
+    base = os.path.dirname(path)
+    for resource in ElementTree.parse(path).getroot().iter('qresource'):
+        prefix = [part for part in resource.get('prefix', '/').split('/') if part]
+        for entry in resource.iter('file'):
+            alias = entry.get('alias') or entry.text
+            parts = prefix + [part for part in alias.split('/') if part]
+            node = root
+            for part in parts[:-1]:
+                node = node.setdefault(part, {})
+            with open(os.path.join(base, entry.text), 'rb') as handle:
+                node[parts[-1]] = handle.read()
+    return root
+
+
+def build_rcc(tree: Tree) -> bytes:
+    """
+    Serialises a resource tree as a binary .rcc bundle.
+
+    Nodes are laid out breadth first so every directory's children are contiguous
+    and, as QResource's binary search expects, ordered by qt_hash.
+
+    Args:
+        tree (Tree): The resource tree from read_qrc.
+
+    Returns:
+        bytes: The bundle, ready for QResource.registerResource.
+    """
+    order: List[Tuple[str, Union[Tree, bytes]]] = [('', tree)]
+    first_child: Dict[int, int] = {}
+    position = 0
+    while position < len(order):
+        node = order[position][1]
+        if isinstance(node, dict):
+            first_child[position] = len(order)
+            order.extend(sorted(node.items(), key=lambda item: qt_hash(item[0])))
+        position += 1
+
+    names = bytearray()
+    data = bytearray()
+    nodes = bytearray()
+    for position, (name, node) in enumerate(order):
+        name_offset = 0
+        if position:
+            name_offset = len(names)
+            encoded = name.encode('utf-16-be')
+            names.extend(struct.pack('>HI', len(encoded) // 2, qt_hash(name)) + encoded)
+        if isinstance(node, dict):
+            nodes.extend(struct.pack('>IHII', name_offset, DIRECTORY_FLAG, len(node), first_child[position]))
+        else:
+            nodes.extend(struct.pack('>IHHHI', name_offset, 0, TERRITORY_ANY, LANGUAGE_C, len(data)))
+            data.extend(struct.pack('>I', len(node)) + node)
+
+    header_size = 20
+    data_offset = header_size
+    names_offset = data_offset + len(data)
+    tree_offset = names_offset + len(names)
+    header = b'qres' + struct.pack('>IIII', FORMAT_VERSION, tree_offset, data_offset, names_offset)
+    return header + bytes(data) + bytes(names) + bytes(nodes)
+
+
+if __name__ == '__main__':
+    with open(RCC_PATH, 'wb') as output:
+        output.write(build_rcc(read_qrc(QRC_PATH)))
+    print(f"wrote {RCC_PATH}")
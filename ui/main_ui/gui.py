@@ -13,148 +13,6 @@ class Ui_MainWindow(object):
     def setupUi(self, MainWindow):
         MainWindow.setObjectName("MainWindow")
         MainWindow.resize(454, 189)
-        MainWindow.setStyleSheet("QWidget {\n"
-"    background-color: #121212;\n"
-"color:#fff;\n"
-"font:11pt \"Helvetica\";\n"
-"}\n"
-"\n"
-"QLabel {\n"
-"background:transparent;\n"
-"}\n"
-"/* /////////////////////////////////////////////////////////////////////////////\n"
-"                                 QSlider\n"
-"///////////////////////////////////////////////////////////////////////////// */\n"
-"QSlider::groove:horizontal {\n"
-"    height: 10px;\n"
-"    margin: 0px;\n"
-"    background-color: rgba(22,22,22,100);\n"
-"}\n"
-"QSlider::groove:horizontal:hover {\n"
-"    background-color: rgb(32, 32, 32);\n"
-"}\n"
-"QSlider::handle:horizontal {\n"
-"    background-color: rgb(255, 88, 71);\n"
-"    border: none;\n"
-"    height: 10px;\n"
-"    width: 10px;\n"
-"    margin: 0px;\n"
-"    border-radius: 5px;\n"
-"}\n"
-"QSlider::handle:horizontal:hover {\n"
-"    background-color: white;\n"
-"}\n"
-"QSlider::handle:horizontal:pressed {\n"
-"    background-color:white;\n"
-"}\n"
-"\n"
-"/*\n"
-"VERTICAL\n"
-"///////////////////////////////////////////////////////////////////////////// */\n"
-"QSlider::groove:vertical {\n"
-"    border-radius: 11px;\n"
-"    width: 22px;\n"
-"    margin: 0px;\n"
-"    background-color: rgba(33,33,33,100);\n"
-"}\n"
-"\n"
-"QSlider::groove:vertical:hover {\n"
-"    background-color: rgba(44,44,44,100);    \n"
-"}\n"
-"QSlider::handle:vertical {\n"
-"    background-color: rgb(255, 88, 71);\n"
-"    border: none;\n"
-"    height: 22px;\n"
-"    width: 22px;\n"
-"    margin: 0px;\n"
-"    border-radius: 11px;\n"
-"}\n"
-"QSlider::handle:vertical:hover {\n"
-"    background-color: rgb(195, 155, 255);\n"
-"}\n"
-"QSlider::handle:vertical:pressed {\n"
-"    background-color: rgb(255, 121, 198);\n"
-"}\n"
-"\n"
-"/* ////////////////////////////////////////////////////////////////////////////////////////////////\n"
-"                                    QScrollBar\n"
-"//////////////////////////////////////////////////////////////////////////////////////////////// */\n"
-"QScrollBar:horizontal {\n"
-"    border: none;\n"
-"    background:transparent;\n"
-"    height: 12px;\n"
-"    margin: 0px 10px 0px 10px;\n"
-"    border-radius: 3px;\n"
-"}\n"
-"QScrollBar::handle:horizontal {\n"
-"    background: rgb(22,22,22);\n"
-"    min-width:24px;\n"
-"    border-radius: 4px;\n"
-"}\n"
-"QScrollBar::add-line:horizontal {\n"
-"    border: none;\n"
-"    background: transparent;\n"
-"    width: 20px;\n"
-"    border-top-right-radius: 4px;\n"
-"    border-bottom-right-radius: 4px;\n"
-"    subcontrol-position: right;\n"
-"    subcontrol-origin: margin;\n"
-"}\n"
-"QScrollBar::sub-line:horizontal {\n"
-"    border: none;\n"
-"    background: transparent;\n"
-"    width: 20px;\n"
-"    border-top-left-radius: 4px;\n"
-"    border-bottom-left-radius: 4px;\n"
-"    subcontrol-position: left;\n"
-"    subcontrol-origin: margin;\n"
-"}\n"
-"QScrollBar::up-arrow:horizontal, \n"
-"QScrollBar::down-arrow:horizontal {\n"
-"    background: none;\n"
-"}\n"
-"QScrollBar::add-page:horizontal, \n"
-"QScrollBar::sub-page:horizontal {\n"
-"    background: transparent;\n"
-"}\n"
-"QScrollBar:vertical {\n"
-"    border: none;\n"
-"    background-color:transparent;\n"
-"    width: 12px;\n"
-"    margin: 10px 0px 10px 0px;\n"
-"    border-radius: 4px;\n"
-"}\n"
-"QScrollBar::handle:vertical {\n"
-"    background: rgb(22,22,22);\n"
-"    min-height: 12px;\n"
-"    border-radius: 4px;\n"
-"}\n"
-"QScrollBar::add-line:vertical {\n"
-"    border: none;\n"
-"    background: transparent;\n"
-"    height: 20px;\n"
-"    border-bottom-left-radius: 4px;\n"
-"    border-bottom-right-radius: 4px;\n"
-"    subcontrol-position: bottom;\n"
-"    subcontrol-origin: margin;\n"
-"}\n"
-"QScrollBar::sub-line:vertical {\n"
-"    border: none;\n"
-"    background: transparent;\n"
-"    height: 20px;\n"
-"    border-top-left-radius: 4px;\n"
-"    border-top-right-radius: 4px;\n"
-"    subcontrol-position: top;\n"
-"    subcontrol-origin: margin;\n"
-"}\n"
-"QScrollBar::up-arrow:vertical, \n"
-"QScrollBar::down-arrow:vertical {\n"
-"    background: none;\n"
-"}\n"
-"QScrollBar::add-page:vertical, \n"
-"QScrollBar::sub-page:vertical {\n"
-"    background: transparent;\n"
-"}")
         self.centralwidget = QtWidgets.QWidget(parent=MainWindow)
         self.centralwidget.setObjectName("centralwidget")
         self.gridLayout_12 = QtWidgets.QGridLayout(self.centralwidget)
@@ -258,19 +116,7 @@ class Ui_MainWindow(object):
         self.sadness = QtWidgets.QSlider(parent=self.frame_4)
         self.sadness.setMinimumSize(QtCore.QSize(25, 90))
         self.sadness.setMaximumSize(QtCore.QSize(25, 90))
-        self.sadness.setStyleSheet("\n"
-"\n"
-"/* ///////////////////////////////////////////////////////////////\n"
-"QSlider Colors\n"
-"/////////////////////////////////////////////////////////////// */\n"
-"\n"
-"QSlider::handle:vertical {background:rgb(87,111,215);}\n"
-"QSlider::handle:vertical:hover {background:rgb(127,151,255);}\n"
-"QSlider::handle:vertical:pressed {background:rgb(37,61,165);}\n"
-"QSlider::groove:vertical:hover {background:rgba(87,111,215,0.25);}\n"
-"QSlider::groove:vertical {background:rgba(87,111,215,0.15);}\n"
-"\n"
-"        ")
+        self.sadness.setProperty("accent", "blue")
         self.sadness.setMaximum(3)
         self.sadness.setProperty("value", 0)
         self.sadness.setOrientation(QtCore.Qt.Orientation.Vertical)
@@ -307,19 +153,7 @@ class Ui_MainWindow(object):
         self.victimhood = QtWidgets.QSlider(parent=self.frame)
         self.victimhood.setMinimumSize(QtCore.QSize(25, 90))
         self.victimhood.setMaximumSize(QtCore.QSize(25, 90))
-        self.victimhood.setStyleSheet("\n"
-"\n"
-"/* ///////////////////////////////////////////////////////////////\n"
-"QSlider Colors\n"
-"/////////////////////////////////////////////////////////////// */\n"
-"\n"
-"QSlider::handle:vertical {background:rgb(153,153,255);}\n"
-"QSlider::handle:vertical:hover {background:rgb(193,193,255);}\n"
-"QSlider::handle:vertical:pressed {background:rgb(103,103,205);}\n"
-"QSlider::groove:vertical:hover {background:rgba(153,153,255,0.25);}\n"
-"QSlider::groove:vertical {background:rgba(153,153,255,0.15);}\n"
-"\n"
-"        ")
+        self.victimhood.setProperty("accent", "periwinkle")
         self.victimhood.setMaximum(3)
         self.victimhood.setProperty("value", 0)
         self.victimhood.setOrientation(QtCore.Qt.Orientation.Vertical)
@@ -360,19 +194,7 @@ class Ui_MainWindow(object):
         self.pessimism = QtWidgets.QSlider(parent=self.frame1)
         self.pessimism.setMinimumSize(QtCore.QSize(25, 90))
         self.pessimism.setMaximumSize(QtCore.QSize(25, 90))
-        self.pessimism.setStyleSheet("\n"
-"\n"
-"/* ///////////////////////////////////////////////////////////////\n"
-"QSlider Colors\n"
-"/////////////////////////////////////////////////////////////// */\n"
-"\n"
-"QSlider::handle:vertical {background:rgb(214,157,210);}\n"
-"QSlider::handle:vertical:hover {background:rgb(254,197,250);}\n"
-"QSlider::handle:vertical:pressed {background:rgb(164,107,160);}\n"
-"QSlider::groove:vertical:hover {background:rgba(214,157,210,0.25);}\n"
-"QSlider::groove:vertical {background:rgba(214,157,210,0.15);}\n"
-"\n"
-"        ")
+        self.pessimism.setProperty("accent", "orchid")
         self.pessimism.setMaximum(3)
         self.pessimism.setProperty("value", 0)
         self.pessimism.setOrientation(QtCore.Qt.Orientation.Vertical)
@@ -403,19 +225,7 @@ class Ui_MainWindow(object):
         self.interest = QtWidgets.QSlider(parent=self.frame_5)
         self.interest.setMinimumSize(QtCore.QSize(25, 90))
         self.interest.setMaximumSize(QtCore.QSize(25, 90))
-        self.interest.setStyleSheet("\n"
-"\n"
-"/* ///////////////////////////////////////////////////////////////\n"
-"QSlider Colors\n"
-"/////////////////////////////////////////////////////////////// */\n"
-"\n"
-"QSlider::handle:vertical {background:rgb(247,198,94);}\n"
-"QSlider::handle:vertical:hover {background:rgb(255,238,134);}\n"
-"QSlider::handle:vertical:pressed {background:rgb(197,148,44);}\n"
-"QSlider::groove:vertical:hover {background:rgba(247,198,94,0.25);}\n"
-"QSlider::groove:vertical {background:rgba(247,198,94,0.15);}\n"
-"\n"
-"        ")
+        self.interest.setProperty("accent", "amber")
         self.interest.setMaximum(3)
         self.interest.setProperty("value", 0)
         self.interest.setOrientation(QtCore.Qt.Orientation.Vertical)
@@ -460,19 +270,7 @@ class Ui_MainWindow(object):
         self.effort = QtWidgets.QSlider(parent=self.frame_6)
         self.effort.setMinimumSize(QtCore.QSize(25, 90))
         self.effort.setMaximumSize(QtCore.QSize(25, 90))
-        self.effort.setStyleSheet("\n"
-"\n"
-"/* ///////////////////////////////////////////////////////////////\n"
-"QSlider Colors\n"
-"/////////////////////////////////////////////////////////////// */\n"
-"\n"
-"QSlider::handle:vertical {background:rgb(255,89,156);}\n"
-"QSlider::handle:vertical:hover {background:rgb(255,129,196);}\n"
-"QSlider::handle:vertical:pressed {background:rgb(205,39,106);}\n"
-"QSlider::groove:vertical:hover {background:rgba(255,89,156,0.25);}\n"
-"QSlider::groove:vertical {background:rgba(255,89,156,0.15);}\n"
-"\n"
-"        ")
+        self.effort.setProperty("accent", "pink")
         self.effort.setMaximum(3)
         self.effort.setProperty("value", 0)
         self.effort.setOrientation(QtCore.Qt.Orientation.Vertical)
@@ -504,19 +302,7 @@ class Ui_MainWindow(object):
         self.decisiveness = QtWidgets.QSlider(parent=self.frame_7)
         self.decisiveness.setMinimumSize(QtCore.QSize(25, 90))
         self.decisiveness.setMaximumSize(QtCore.QSize(25, 90))
-        self.decisiveness.setStyleSheet("\n"
-"\n"
-"/* ///////////////////////////////////////////////////////////////\n"
-"QSlider Colors\n"
-"/////////////////////////////////////////////////////////////// */\n"
-"\n"
-"QSlider::handle:vertical {background:rgb(120,155,172);}\n"
-"QSlider::handle:vertical:hover {background:rgb(160,195,212);}\n"
-"QSlider::handle:vertical:pressed {background:rgb(70,105,122);}\n"
-"QSlider::groove:vertical:hover {background:rgba(120,155,172,0.25);}\n"
-"QSlider::groove:vertical {background:rgba(120,155,172,0.15);}\n"
-"\n"
-"        ")
+        self.decisiveness.setProperty("accent", "slate")
         self.decisiveness.setMaximum(3)
         self.decisiveness.setProperty("value", 0)
         self.decisiveness.setOrientation(QtCore.Qt.Orientation.Vertical)
@@ -556,20 +342,7 @@ class Ui_MainWindow(object):
         self.hygiene = QtWidgets.QSlider(parent=self.frame_8)
         self.hygiene.setMinimumSize(QtCore.QSize(25, 90))
         self.hygiene.setMaximumSize(QtCore.QSize(25, 90))
-        self.hygiene.setStyleSheet("\n"
-"\n"
-"/* ///////////////////////////////////////////////////////////////\n"
-"QSlider Colors\n"
-"/////////////////////////////////////////////////////////////// */\n"
-"\n"
-"QSlider::handle:vertical {background:rgb(96,174,106);}\n"
-"QSlider::handle:vertical:hover {background:rgb(136,214,146);}\n"
-"QSlider::handle:vertical:pressed {background:rgb(46,124,56);}\n"
-"QSlider::groove:vertical:hover {background:rgba(96,174,106,0.25);}\n"
-"\n"
-"QSlider::groove:vertical {background:rgba(96,174,106,0.15);}\n"
-"\n"
-"        ")
+        self.hygiene.setProperty("accent", "green")
         self.hygiene.setMaximum(3)
         self.hygiene.setProperty("value", 0)
         self.hygiene.setOrientation(QtCore.Qt.Orientation.Vertical)
@@ -599,20 +372,7 @@ class Ui_MainWindow(object):
         self.sexdrive = QtWidgets.QSlider(parent=self.frame_9)
         self.sexdrive.setMinimumSize(QtCore.QSize(25, 90))
         self.sexdrive.setMaximumSize(QtCore.QSize(25, 90))
-        self.sexdrive.setStyleSheet("\n"
-"\n"
-"/* ///////////////////////////////////////////////////////////////\n"
-"QSlider Colors\n"
-"/////////////////////////////////////////////////////////////// */\n"
-"\n"
-"QSlider::handle:vertical {background:rgb(229,100,111);}\n"
-"QSlider::handle:vertical:hover {background:rgb(255,140,151);}\n"
-"QSlider::handle:vertical:pressed {background:rgb(179,50,61);}\n"
-"QSlider::groove:vertical:hover {background:rgba(229,100,111,0.25);}\n"
-"\n"
-"QSlider::groove:vertical {background:rgba(229,100,111,0.15);}\n"
-"\n"
-"        ")
+        self.sexdrive.setProperty("accent", "coral")
         self.sexdrive.setMaximum(3)
         self.sexdrive.setProperty("value", 0)
         self.sexdrive.setOrientation(QtCore.Qt.Orientation.Vertical)
@@ -649,20 +409,7 @@ class Ui_MainWindow(object):
         self.solitude = QtWidgets.QSlider(parent=self.frame_10)
         self.solitude.setMinimumSize(QtCore.QSize(25, 90))
         self.solitude.setMaximumSize(QtCore.QSize(25, 90))
-        self.solitude.setStyleSheet("\n"
-"\n"
-"/* ///////////////////////////////////////////////////////////////\n"
-"QSlider Colors\n"
-"/////////////////////////////////////////////////////////////// */\n"
-"\n"
-"QSlider::handle:vertical {background:rgb(223,133,93);}\n"
-"QSlider::handle:vertical:hover {background:rgb(255,173,133);}\n"
-"QSlider::handle:vertical:pressed {background:rgb(173,83,43);}\n"
-"QSlider::groove:vertical:hover {background:rgba(223,133,93,0.25);}\n"
-"\n"
-"QSlider::groove:vertical {background:rgba(223,133,93,0.15);}\n"
-"\n"
-"        ")
+        self.solitude.setProperty("accent", "orange")
         self.solitude.setMaximum(3)
         self.solitude.setProperty("value", 0)
         self.solitude.setOrientation(QtCore.Qt.Orientation.Vertical)
@@ -699,19 +446,7 @@ class Ui_MainWindow(object):
         self.guilt = QtWidgets.QSlider(parent=self.frame_11)
         self.guilt.setMinimumSize(QtCore.QSize(25, 90))
         self.guilt.setMaximumSize(QtCore.QSize(25, 90))
-        self.guilt.setStyleSheet("\n"
-"\n"
-"/* ///////////////////////////////////////////////////////////////\n"
-"QSlider Colors\n"
-"/////////////////////////////////////////////////////////////// */\n"
-"\n"
-"QSlider::handle:vertical {background:rgb(170,129,224);}\n"
-"QSlider::handle:vertical:hover {background:rgb(210,169,255);}\n"
-"QSlider::handle:vertical:pressed {background:rgb(120,79,174);}\n"
-"QSlider::groove:vertical:hover {background:rgba(170,129,224,0.25);}\n"
-"QSlider::groove:vertical {background:rgba(170,129,224,0.15);}\n"
-"\n"
-"        ")
+        self.guilt.setProperty("accent", "purple")
         self.guilt.setMaximum(3)
         self.guilt.setProperty("value", 0)
         self.guilt.setOrientation(QtCore.Qt.Orientation.Vertical)
@@ -747,19 +482,7 @@ class Ui_MainWindow(object):
         self.sleep = QtWidgets.QSlider(parent=self.frame_2)
         self.sleep.setMinimumSize(QtCore.QSize(25, 90))
         self.sleep.setMaximumSize(QtCore.QSize(25, 90))
-        self.sleep.setStyleSheet("\n"
-"\n"
-"/* ///////////////////////////////////////////////////////////////\n"
-"QSlider Colors\n"
-"/////////////////////////////////////////////////////////////// */\n"
-"\n"
-"QSlider::handle:vertical {background:rgb(214,157,210);}\n"
-"QSlider::handle:vertical:hover {background:rgb(254,197,250);}\n"
-"QSlider::handle:vertical:pressed {background:rgb(164,107,160);}\n"
-"QSlider::groove:vertical:hover {background:rgba(214,157,210,0.25);}\n"
-"QSlider::groove:vertical {background:rgba(214,157,210,0.15);}\n"
-"\n"
-"        ")
+        self.sleep.setProperty("accent", "orchid")
         self.sleep.setMaximum(3)
         self.sleep.setProperty("value", 0)
         self.sleep.setOrientation(QtCore.Qt.Orientation.Vertical)
@@ -794,20 +517,7 @@ class Ui_MainWindow(object):
         self.outlook = QtWidgets.QSlider(parent=self.frame_12)
         self.outlook.setMinimumSize(QtCore.QSize(25, 90))
         self.outlook.setMaximumSize(QtCore.QSize(25, 90))
-        self.outlook.setStyleSheet("\n"
-"\n"
-"/* ///////////////////////////////////////////////////////////////\n"
-"QSlider Colors\n"
-"/////////////////////////////////////////////////////////////// */\n"
-"\n"
-"QSlider::handle:vertical {background:rgb(200,129,224);}\n"
-"QSlider::handle:vertical:hover {background:rgb(240,169,255);}\n"
-"QSlider::handle:vertical:pressed {background:rgb(150,79,174);}\n"
-"QSlider::groove:vertical:hover {background:rgba(200,129,224,0.25);}\n"
-"\n"
-"QSlider::groove:vertical {background:rgba(200,129,224,0.15);}\n"
-"\n"
-"        ")
+        self.outlook.setProperty("accent", "violet")
         self.outlook.setMaximum(3)
         self.outlook.setProperty("value", 0)
         self.outlook.setOrientation(QtCore.Qt.Orientation.Vertical)
@@ -875,19 +585,7 @@ class Ui_MainWindow(object):
         self.beck_summary = QtWidgets.QSlider(parent=self.frame_3)
         self.beck_summary.setMinimumSize(QtCore.QSize(45, 110))
         self.beck_summary.setMaximumSize(QtCore.QSize(16777215, 110))
-        self.beck_summary.setStyleSheet("\n"
-"\n"
-"/* ///////////////////////////////////////////////////////////////\n"
-"QSlider Colors\n"
-"/////////////////////////////////////////////////////////////// */\n"
-"\n"
-"QSlider::handle:vertical {background:rgb(244,56,81);}\n"
-"QSlider::handle:vertical:hover {background:rgb(239,116,121);}\n"
-"QSlider::handle:vertical:pressed {background:rgb(149,26,31);}\n"
-"QSlider::groove:vertical:hover {background:rgba(199,76,81,0.35);}\n"
-"QSlider::groove:vertical {background:rgba(199,76,81,0.25);}\n"
-"\n"
-"        ")
+        self.beck_summary.setProperty("accent", "beck-summary")
         self.beck_summary.setMaximum(36)
         self.beck_summary.setOrientation(QtCore.Qt.Orientation.Vertical)
         self.beck_summary.setInvertedAppearance(True)
@@ -956,19 +654,7 @@ class Ui_MainWindow(object):
         self.altmans_sleep = QtWidgets.QSlider(parent=self.frame_14)
         self.altmans_sleep.setMinimumSize(QtCore.QSize(25, 110))
         self.altmans_sleep.setMaximumSize(QtCore.QSize(25, 110))
-        self.altmans_sleep.setStyleSheet("\n"
-"\n"
-"/* ///////////////////////////////////////////////////////////////\n"
-"QSlider Colors\n"
-"/////////////////////////////////////////////////////////////// */\n"
-"\n"
-"QSlider::handle:vertical {background:rgb(87,111,215);}\n"
-"QSlider::handle:vertical:hover {background:rgb(127,151,255);}\n"
-"QSlider::handle:vertical:pressed {background:rgb(37,61,165);}\n"
-"QSlider::groove:vertical:hover {background:rgba(87,111,215,0.25);}\n"
-"QSlider::groove:vertical {background:rgba(87,111,215,0.15);}\n"
-"\n"
-"        ")
+        self.altmans_sleep.setProperty("accent", "blue")
         self.altmans_sleep.setMaximum(4)
         self.altmans_sleep.setTracking(True)
         self.altmans_sleep.setOrientation(QtCore.Qt.Orientation.Vertical)
@@ -1011,20 +697,7 @@ class Ui_MainWindow(object):
         self.altmans_speech = QtWidgets.QSlider(parent=self.frame_15)
         self.altmans_speech.setMinimumSize(QtCore.QSize(25, 110))
         self.altmans_speech.setMaximumSize(QtCore.QSize(25, 110))
-        self.altmans_speech.setStyleSheet("\n"
-"\n"
-"/* ///////////////////////////////////////////////////////////////\n"
-"QSlider Colors\n"
-"/////////////////////////////////////////////////////////////// */\n"
-"\n"
-"QSlider::handle:vertical {background:rgb(68,212,146);}\n"
-"QSlider::handle:vertical:hover {background:rgb(108,252,186);}\n"
-"QSlider::handle:vertical:pressed {background:rgb(18,162,96);}\n"
-"QSlider::groove:vertical:hover {background:rgba(68,212,146,0.25);}\n"
-"\n"
-"QSlider::groove:vertical {background:rgba(68,212,146,0.15);}\n"
-"\n"
-"        ")
+        self.altmans_speech.setProperty("accent", "mint")
         self.altmans_speech.setMaximum(4)
         self.altmans_speech.setOrientation(QtCore.Qt.Orientation.Vertical)
         self.altmans_speech.setInvertedAppearance(True)
@@ -1049,18 +722,7 @@ class Ui_MainWindow(object):
         self.altmans_activity = QtWidgets.QSlider(parent=self.frame_16)
         self.altmans_activity.setMinimumSize(QtCore.QSize(25, 110))
         self.altmans_activity.setMaximumSize(QtCore.QSize(25, 110))
-        self.altmans_activity.setStyleSheet("\n"
-"\n"
-"/* ///////////////////////////////////////////////////////////////\n"
-"QSlider Colors\n"
-"/////////////////////////////////////////////////////////////// */\n"
-"\n"
-"QSlider::handle:vertical {background:rgb(245,235,103);}\n"
-"QSlider::handle:vertical:hover {background:rgb(255,255,143);}\n"
-"QSlider::handle:vertical:pressed {background:rgb(195,185,53);}\n"
-"QSlider::groove:vertical:hover {background:rgba(245,235,103,0.25);}\n"
-"QSlider::groove:vertical {background:rgba(245,235,103,0.15);}\n"
-"        ")
+        self.altmans_activity.setProperty("accent", "yellow")
         self.altmans_activity.setMaximum(4)
         self.altmans_activity.setOrientation(QtCore.Qt.Orientation.Vertical)
         self.altmans_activity.setInvertedAppearance(True)
@@ -1101,19 +763,7 @@ class Ui_MainWindow(object):
         self.altmans_cheer = QtWidgets.QSlider(parent=self.frame_17)
         self.altmans_cheer.setMinimumSize(QtCore.QSize(25, 110))
         self.altmans_cheer.setMaximumSize(QtCore.QSize(25, 110))
-        self.altmans_cheer.setStyleSheet("\n"
-"\n"
-"/* ///////////////////////////////////////////////////////////////\n"
-"QSlider Colors\n"
-"/////////////////////////////////////////////////////////////// */\n"
-"\n"
-"QSlider::handle:vertical {background:rgb(255,161,92);}\n"
-"QSlider::handle:vertical:hover {background:rgb(255,201,132);}\n"
-"QSlider::handle:vertical:pressed {background:rgb(205,111,42);}\n"
-"QSlider::groove:vertical:hover {background:rgba(255,161,92,0.25);}\n"
-"QSlider::groove:vertical {background:rgba(255,161,92,0.15);}\n"
-"\n"
-"        ")
+        self.altmans_cheer.setProperty("accent", "tangerine")
         self.altmans_cheer.setMaximum(4)
         self.altmans_cheer.setOrientation(QtCore.Qt.Orientation.Vertical)
         self.altmans_cheer.setInvertedAppearance(True)
@@ -1138,19 +788,7 @@ class Ui_MainWindow(object):
         self.altmans_confidence = QtWidgets.QSlider(parent=self.frame_18)
         self.altmans_confidence.setMinimumSize(QtCore.QSize(25, 110))
         self.altmans_confidence.setMaximumSize(QtCore.QSize(25, 110))
-        self.altmans_confidence.setStyleSheet("\n"
-"\n"
-"/* ///////////////////////////////////////////////////////////////\n"
-"QSlider Colors\n"
-"/////////////////////////////////////////////////////////////// */\n"
-"\n"
-"QSlider::handle:vertical {background:rgb(199,76,81);}\n"
-"QSlider::handle:vertical:hover {background:rgb(239,116,121);}\n"
-"QSlider::handle:vertical:pressed {background:rgb(149,26,31);}\n"
-"QSlider::groove:vertical:hover {background:rgba(199,76,81,0.25);}\n"
-"QSlider::groove:vertical {background:rgba(199,76,81,0.15);}\n"
-"\n"
-"        ")
+        self.altmans_confidence.setProperty("accent", "red")
         self.altmans_confidence.setMaximum(4)
         self.altmans_confidence.setOrientation(QtCore.Qt.Orientation.Vertical)
         self.altmans_confidence.setInvertedAppearance(True)
@@ -1218,19 +856,7 @@ class Ui_MainWindow(object):
         self.altmans_summary = QtWidgets.QSlider(parent=self.tab_19)
         self.altmans_summary.setMinimumSize(QtCore.QSize(45, 0))
         self.altmans_summary.setMaximumSize(QtCore.QSize(16777215, 110))
-        self.altmans_summary.setStyleSheet("\n"
-"\n"
-"/* ///////////////////////////////////////////////////////////////\n"
-"QSlider Colors\n"
-"/////////////////////////////////////////////////////////////// */\n"
-"\n"
-"QSlider::handle:vertical {background:rgb(244,56,81);}\n"
-"QSlider::handle:vertical:hover {background:rgb(239,116,121);}\n"
-"QSlider::handle:vertical:pressed {background:rgb(149,26,31);}\n"
-"QSlider::groove:vertical:hover {background:rgba(199,76,81,0.25);}\n"
-"QSlider::groove:vertical {background:rgba(199,76,81,0.35);}\n"
-"\n"
-"        ")
+        self.altmans_summary.setProperty("accent", "altman-summary")
         self.altmans_summary.setMaximum(20)
         self.altmans_summary.setOrientation(QtCore.Qt.Orientation.Vertical)
         self.altmans_summary.setInvertedAppearance(True)
@@ -0,0 +1,45 @@
+"""
+Registers the compiled resource bundle (resources.rcc) once, at first import.
+
+The bundle is built from resources.qrc by build_resources.py. Importing this
+module is all that is needed before ':/...' paths are used.
+"""
+import os
+from functools import lru_cache
+
+from PyQt6.QtCore import QFile, QIODevice, QResource
+
+from logger_setup import logger
+
+RCC_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'resources.rcc')
+STYLES_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'styles')
+
+registered: bool = QResource.registerResource(RCC_PATH)
+if not registered:
+    logger.error(f"Error registering resource bundle: {RCC_PATH}")
+
+
+@lru_cache(maxsize=None)
+def stylesheet(name: str = 'app') -> str:
+    """
+    Returns a style sheet from the bundle, read once and cached.
+
+    Falls back to the source .qss next to the bundle if the bundle could not be registered.
+
+    Args:
+        name (str): The style sheet name without the .qss extension.
+
+    Returns:
+        str: The style sheet text, or an empty string if it cannot be read.
+    """
+    source = QFile(f":/styles/{name}.qss")
+    if source.open(QIODevice.OpenModeFlag.ReadOnly | QIODevice.OpenModeFlag.Text):
+        text = bytes(source.readAll()).decode('utf-8')
+        source.close()
+        return text
+    try:
+        with open(os.path.join(STYLES_DIRECTORY, f"{name}.qss"), encoding='utf-8') as handle:
+            return handle.read()
+    except OSError as e:
+        logger.error(f"Error reading style sheet {name}: {e}")
+        return ''
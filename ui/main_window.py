@@ -1,13 +1,17 @@
 import datetime
+import math
 from PyQt6 import QtWidgets
-from PyQt6.QtCore import QDate, QSettings, QTime, Qt, QByteArray, QDateTime
-from PyQt6.QtGui import QCloseEvent
+from PyQt6.QtCore import QDate, QSettings, QTime, QTimer, Qt, QByteArray, QDateTime
+from PyQt6.QtGui import QAction, QCloseEvent
+from typing import Optional
 
 import tracker_config as tkc
+from utility.app_operations.startup_profile import startup_profiler
 # ////////////////////////////////////////////////////////////////////////////////////////
 # UI
 # ////////////////////////////////////////////////////////////////////////////////////////
 from ui.main_ui.gui import Ui_MainWindow
+from ui.main_ui.res import stylesheet
 
 # ////////////////////////////////////////////////////////////////////////////////////////
 # LOGGER
@@ -25,10 +29,24 @@ from utility.app_operations.frameless_window import (
 from utility.app_operations.window_controls import (
     WindowController)
 from utility.app_operations.show_hide import toggle_views
+from utility.widgets_set_widgets.slider_summary import SliderSummary
 
 # Database connections
 from database.database_manager import (
     DataManager)
+from database.database_writer import (
+    DatabaseWriter)
+from database.import_worker import (
+    ImportWorker)
+from database.export_worker import (
+    ExportWorker)
+from database.patients import (
+    Patient, PatientRegistry)
+from database.importer import (
+    ImportRowError, validate_record)
+from database.schema import (
+    TABLE_COLUMNS)
+from database.connections import target_db_path
 
 # Delete Records
 from database.database_utility.delete_records import (
@@ -66,24 +84,46 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
                  **kwargs):
         super().__init__(*args, **kwargs)
         self.becks_model = None
+        self.altmans_model = None
         self.ui = Ui_MainWindow()
+        # One shared sheet, set before the widgets exist so each is polished once.
+        self.setStyleSheet(stylesheet())
         self.setupUi(self)
-        # Database init
-        self.db_manager = DataManager()
-        self.setup_models()
+        startup_profiler.mark('setupUi')
         # QSettings settings_manager setup
         self.settings = QSettings(tkc.ORGANIZATION_NAME, tkc.APPLICATION_NAME)
+        # Database init
+        self.last_deleted = {}
+        self.import_worker = None
+        self.export_worker = None
+        self.analytics = None
+        self.patient_registry = PatientRegistry()
+        self.open_patient(self.restore_patient())
+        startup_profiler.mark('database open, migrations and writer thread')
+        self.setup_models()
+        startup_profiler.mark('models')
         self.window_controller = WindowController()
         self.setWindowFlags(Qt.WindowType.FramelessWindowHint)
         self.restore_state()
+        startup_profiler.mark('restore state')
         self.app_operations()
         # self.slider_set_spinbox()
         self.stack_navigation()
         self.delete_group()
+        self.import_group()
+        self.export_group()
+        self.trends_group()
+        self.patient_group()
+        self.command_pages = {
+            'beck': self.switch_to_page0,
+            'altman': self.switch_to_page1,
+            'beck-data': self.switch_to_page4,
+            'altman-data': self.switch_to_page2,
+        }
+        self.compaction_group()
         self.set_hidden()
-        self.update_altmans_summary()
-        self.update_beck_summary()
-        self.altman_table_commit()
+        self.altman_summary_setup()
+        startup_profiler.mark('signal wiring')
         
         #########################################################################
         # beck summer of summation
@@ -104,37 +144,23 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
                 self.sleep, ]:
             slider.setRange(0, 3)
         
-        self.sadness.valueChanged.connect(self.update_beck_summary)
-        self.outlook.valueChanged.connect(self.update_beck_summary)
-        self.guilt.valueChanged.connect(self.update_beck_summary)
-        self.solitude.valueChanged.connect(self.update_beck_summary)
-        self.sexdrive.valueChanged.connect(self.update_beck_summary)
-        self.hygiene.valueChanged.connect(self.update_beck_summary)
-        self.decisiveness.valueChanged.connect(self.update_beck_summary)
-        self.effort.valueChanged.connect(self.update_beck_summary)
-        self.interest.valueChanged.connect(self.update_beck_summary)
-        self.pessimism.valueChanged.connect(self.update_beck_summary)
-        self.victimhood.valueChanged.connect(self.update_beck_summary)
-        self.sleep.valueChanged.connect(self.update_beck_summary)
+        self.beck_summary_engine = SliderSummary(
+            [self.sadness, self.outlook, self.guilt, self.solitude, self.sexdrive, self.hygiene,
+             self.decisiveness, self.effort, self.interest, self.pessimism, self.victimhood,
+             self.sleep, ],
+            self.beck_summary, self)
     
     def update_beck_summary(self):
         """
-        Updates the averages of the sliders in the wellbeing and pain module such that
-        the overall is the average of the whole.
+        Recomputes the Beck summary from every slider and shows it immediately.
+
+        Slider changes keep the summary current on their own through the
+        beck_summary_engine; this is for when the sliders were changed behind its back.
 
         :return: None
         """
         try:
-            values = [slider.value() for slider in
-                      [self.sadness, self.outlook, self.guilt, self.solitude, self
-                      .sexdrive, self.hygiene, self.decisiveness, self.effort, self
-                       .interest, self.pessimism, self.victimhood, self.sleep, ] if
-                      slider.value() > 0]
-
-            sumabitch = sum(values)
-
-            self.beck_summary.setValue(int(sumabitch))
-
+            self.beck_summary_engine.recompute()
         except Exception as e:
             logger.error(f"{e}", exc_info=True)
     
@@ -230,10 +256,11 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
 
         """
         try:
-            self.beck_table_commit()
+            self.commit_dispatch()
             self.stackedWidget.currentChanged.connect(self.on_page_changed)
             last_index = self.settings.value("lastPageIndex", 0, type=int)
             self.stackedWidget.setCurrentIndex(last_index)
+            self.ensure_page_model(self.stackedWidget.currentIndex())
             self.beck_time.setTime(QTime.currentTime())
             self.beck_date.setDate(QDate.currentDate())
             self.altman_time.setTime(QTime.currentTime())
@@ -290,98 +317,149 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
         except Exception as e:
             logger.error(f"An error has occurred: {e}", exc_info=True)
     
+    def commit_dispatch(self) -> None:
+        """
+        Routes the 'commit' action to the exam page that is currently showing.
+
+        The Beck page commits only to the beck_table and the Altman page only to the altman_table.
+        The checkable 'Commit Both Exams' action switches to writing both exams at once for combined
+        sessions; its state is kept in the settings.
+
+        Raises:
+            Exception: If an error occurs while wiring the commit actions.
+        """
+        try:
+            self.commit_routes = {
+                self.beckPage: self.beck_table_commit,
+                self.altmanPage: self.altman_table_commit,
+            }
+            self.actionCommit.setText("Commit Current Exam")
+            self.actionCommitBoth = QAction("Commit Both Exams", self)
+            self.actionCommitBoth.setObjectName("actionCommitBoth")
+            self.actionCommitBoth.setCheckable(True)
+            self.actionCommitBoth.setChecked(
+                self.settings.value("commitBoth", tkc.COMMIT_BOTH_EXAMS, type=bool))
+            self.actionCommitBoth.toggled.connect(
+                lambda checked: self.settings.setValue("commitBoth", checked))
+            self.menuData.insertAction(self.actionDelete, self.actionCommitBoth)
+            self.actionCommit.triggered.connect(self.commit_active_page)
+        except Exception as e:
+            logger.error(f"An Error has occurred {e}", exc_info=True)
+    
+    def commit_active_page(self) -> None:
+        """
+        Commits the exam on the current page, or both exams in 'Commit Both Exams' mode.
+
+        Nothing is written while a data page is showing.
+
+        Raises:
+            Exception: If an error occurs during the process.
+        """
+        try:
+            if self.actionCommitBoth.isChecked():
+                self.beck_table_commit()
+                self.altman_table_commit()
+                return
+            commit = self.commit_routes.get(self.stackedWidget.currentWidget())
+            if commit is None:
+                logger.info("Commit ignored: no exam page is showing")
+                return
+            commit()
+        except Exception as e:
+            logger.error(f"An Error has occurred {e}", exc_info=True)
+    
     def beck_table_commit(self) -> None:
         """
-        Connects the 'commit' action to the 'add_mentalsolo_data' function and inserts data into the altman_table.
+        Inserts the Beck exam into the beck_table through the 'add_beck_data' function.
 
-        This method connects the 'commit' action to the 'add_beck_data' function, which inserts data into the beck_table.
-        The data to be inserted is retrieved from various UI elements in the main window.
+        The data to be inserted is retrieved from various UI elements in the main window and queued
+        on the background db_writer. A pending summary update is flushed first so the
+        committed summary matches the sliders.
 
         Raises:
             Exception: If an error occurs during the process.
         """
         try:
-            self.actionCommit.triggered.connect(
-                lambda: add_beck_data(
-                    self, {
-                        "beck_date": "beck_date",
-                        "beck_time": "beck_time",
-                        "sadness": "sadness",
-                        "outlook": "outlook",
-                        "guilt": "guilt",
-                        "solitude": "solitude",
-                        "sexdrive": "sexdrive",
-                        "hygiene": "hygiene",
-                        "decisiveness": "decisiveness",
-                        "effort": "effort",
-                        "interest": "interest",
-                        "pessimism": "pessimism",
-                        "victimhood": "victimhood",
-                        "sleep": "sleep",
-                        "beck_summary": "beck_summary",
-                        "model": "becks_model"
-                    },
-                    self.db_manager.insert_into_beck_table, ))
+            self.beck_summary_engine.flush()
+            add_beck_data(
+                self, {
+                    "beck_date": "beck_date",
+                    "beck_time": "beck_time",
+                    "sadness": "sadness",
+                    "outlook": "outlook",
+                    "guilt": "guilt",
+                    "solitude": "solitude",
+                    "sexdrive": "sexdrive",
+                    "hygiene": "hygiene",
+                    "decisiveness": "decisiveness",
+                    "effort": "effort",
+                    "interest": "interest",
+                    "pessimism": "pessimism",
+                    "victimhood": "victimhood",
+                    "sleep": "sleep",
+                    "beck_summary": "beck_summary",
+                },
+                self.db_writer.insert_beck, )
         except Exception as e:
             logger.error(f"An Error has occurred {e}", exc_info=True)
     
     def altman_table_commit(self) -> None:
         """
-        Connects the 'commit' action to the 'add_mentalsolo_data' function and inserts data into the altman_table.
+        Inserts the Altman exam into the altman_table through the 'add_altmans_data' function.
 
-        This method connects the 'commit' action to the 'add_mentalsolo_data' function, which inserts data into the altman_table.
-        The data to be inserted is obtained from various widgets in the UI and passed as arguments to the 'add_altmans_data' function.
-        The 'add_altmans_data' function is called with the appropriate arguments and the 'insert_into_altman_table' method of the 'db_manager' object.
+        The data to be inserted is obtained from various widgets in the UI and passed to the 'insert_altman' method of
+        the background 'db_writer', so the write never blocks the GUI thread. A pending
+        summary update is flushed first so the committed summary matches the sliders.
 
         Raises:
             Exception: If an error occurs during the process.
         """
         try:
-            self.actionCommit.triggered.connect(
-                lambda: add_altmans_data(
-                    self, {
-                        "altman_date": "altman_date",
-                        "altman_time": "altman_time",
-                        "altmans_sleep": "altmans_sleep",
-                        "altmans_speech": "altmans_speech",
-                        "altmans_activity": "altmans_activity",
-                        "altmans_cheer": "altmans_cheer",
-                        "altmans_confidence": "altmans_confidence",
-                        "altmans_summary": "altmans_summary",
-                        "model": "altmans_model"
-                    },
-                    self.db_manager.insert_into_altman_table, ))
+            self.altmans_summary_engine.flush()
+            add_altmans_data(
+                self, {
+                    "altman_date": "altman_date",
+                    "altman_time": "altman_time",
+                    "altmans_sleep": "altmans_sleep",
+                    "altmans_speech": "altmans_speech",
+                    "altmans_activity": "altmans_activity",
+                    "altmans_cheer": "altmans_cheer",
+                    "altmans_confidence": "altmans_confidence",
+                    "altmans_summary": "altmans_summary",
+                },
+                self.db_writer.insert_altman, )
         except Exception as e:
             logger.error(f"An Error has occurred {e}", exc_info=True)
-        
+    
+    def altman_summary_setup(self) -> None:
+        """
+        Sets the Altman slider ranges and connects them to the Altman summary.
+
+        Returns:
+            None
+        """
         self.altmans_summary.setEnabled(False)
         for slider in [
             self.altmans_sleep, self.altmans_speech, self.altmans_activity, self.
                 altmans_cheer, self.altmans_confidence, ]:
             slider.setRange(0, 4)
         
-        self.altmans_sleep.valueChanged.connect(self.update_altmans_summary)
-        self.altmans_speech.valueChanged.connect(self.update_altmans_summary)
-        self.altmans_activity.valueChanged.connect(self.update_altmans_summary)
-        self.altmans_cheer.valueChanged.connect(self.update_altmans_summary)
-        self.altmans_confidence.valueChanged.connect(self.update_altmans_summary)
+        self.altmans_summary_engine = SliderSummary(
+            [self.altmans_sleep, self.altmans_speech, self.altmans_activity, self.altmans_cheer,
+             self.altmans_confidence, ],
+            self.altmans_summary, self)
     
     def update_altmans_summary(self):
         """
-        Updates the averages of the sliders in the wellbeing and pain module such that
-        the overall is the average of the whole.
+        Recomputes the Altman summary from every slider and shows it immediately.
+
+        Slider changes keep the summary current on their own through the
+        altmans_summary_engine; this is for when the sliders were changed behind its back.
 
         :return: None
         """
         try:
-            values = [slider.value() for slider in
-                      [self.altmans_sleep, self.altmans_speech, self.altmans_activity, self.altmans_cheer,
-                       self.altmans_confidence] if slider.value() > 0]
-
-            altmans_sum = sum(values)
-
-            self.altmans_summary.setValue(int(altmans_sum))
-
+            self.altmans_summary_engine.recompute()
         except Exception as e:
             logger.error(f"{e}", exc_info=True)
             
@@ -391,6 +469,8 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
 
         This method connects the delete action to the delete_selected_rows function,
         passing the necessary arguments to delete the selected rows in the altman_table.
+        Deletes are soft, so the ids of the last deletion are kept for the
+        'Undo Delete' action added after it in the Data menu.
 
         Args:
             self: The instance of the main window.
@@ -398,39 +478,530 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
         Returns:
             None
         """
+        self.actionDelete.triggered.connect(lambda: self.last_deleted.clear())
+        self.actionUndoDelete = QAction("Undo Delete", self)
+        self.actionUndoDelete.setObjectName("actionUndoDelete")
+        self.actionUndoDelete.setShortcut("Ctrl+Shift+Z")
+        self.actionUndoDelete.setEnabled(False)
+        self.actionUndoDelete.triggered.connect(self.undo_delete)
+        self.menuData.addAction(self.actionUndoDelete)
         self.actionDelete.triggered.connect(
             lambda: delete_selected_rows(
                 self,
                 'beck_tableview',
-                'becks_model'
+                'becks_model',
+                self.db_writer.delete_rows
             )
         )
         self.actionDelete.triggered.connect(
             lambda: delete_selected_rows(
                 self,
                 'altmans_manic_rating_table',
-                'altmans_model'
+                'altmans_model',
+                self.db_writer.delete_rows
             )
         )
         
+    def remember_deleted(self, table: str, row_ids: list) -> None:
+        """
+        Records the rows tombstoned by the last delete so they can be restored.
+
+        Args:
+            table (str): The table the rows were deleted from.
+            row_ids (list): The ids of the deleted rows.
+
+        Returns:
+            None
+        """
+        self.last_deleted.setdefault(table, []).extend(row_ids)
+        self.actionUndoDelete.setEnabled(True)
+
+    def undo_delete(self) -> None:
+        """
+        Restores the rows of the last delete through the background writer.
+
+        Returns:
+            None
+        """
+        try:
+            for table, row_ids in self.last_deleted.items():
+                self.db_writer.restore_rows(table, row_ids)
+            self.last_deleted.clear()
+            self.actionUndoDelete.setEnabled(False)
+        except Exception as e:
+            logger.error(f"Error restoring deleted records: {e}", exc_info=True)
+
+    def compaction_group(self) -> None:
+        """
+        Starts the timer that purges old tombstones while the app is idle.
+
+        Every tkc.COMPACTION_IDLE_MINUTES a compaction job is queued on the background
+        writer, unless writes are already waiting there.
+
+        Returns:
+            None
+        """
+        self.compaction_timer = QTimer(self)
+        self.compaction_timer.setInterval(tkc.COMPACTION_IDLE_MINUTES * 60 * 1000)
+        self.compaction_timer.timeout.connect(self.compact_when_idle)
+        self.compaction_timer.start()
+
+    def compact_when_idle(self) -> None:
+        """
+        Queues a compaction pass if the background writer has nothing else to do.
+
+        Returns:
+            None
+        """
+        if self.db_writer.is_idle():
+            self.db_writer.compact()
+
+    def import_group(self) -> None:
+        """
+        Adds the 'Import Exams…' action to the Data menu.
+
+        The chosen CSV or JSON Lines file is imported by an ImportWorker on its own
+        connection; the views re-read once when the worker reports the table reset.
+
+        Returns:
+            None
+        """
+        self.actionImport = QAction("Import Exams…", self)
+        self.actionImport.setObjectName("actionImport")
+        self.actionImport.triggered.connect(self.import_exams)
+        self.menuData.insertAction(self.actionDelete, self.actionImport)
+
+    def import_exams(self) -> None:
+        """
+        Asks for a file and starts importing it in the background.
+
+        Returns:
+            None
+        """
+        try:
+            if self.import_worker is not None and self.import_worker.isRunning():
+                logger.info("An import is already running")
+                return
+            path, _ = QtWidgets.QFileDialog.getOpenFileName(
+                self, "Import Exams", "",
+                "Exam files (*.csv *.jsonl *.csv.gz *.jsonl.gz);;All files (*)")
+            if not path:
+                return
+            self.start_import(path)
+        except Exception as e:
+            logger.error(f"Error starting import: {e}", exc_info=True)
+
+    def start_import(self, path: str) -> None:
+        """
+        Imports a file into the open patient's shard in the background.
+
+        Args:
+            path (str): The CSV or JSON Lines file, optionally .gz.
+
+        Returns:
+            None
+        """
+        try:
+            if self.import_worker is not None and self.import_worker.isRunning():
+                logger.info("An import is already running")
+                return
+            self.import_worker = ImportWorker(path, db_name=self.patient.shard, notifier=self.db_manager.notifier)
+            self.import_worker.imported.connect(
+                lambda table, inserted, duplicates, invalid: logger.info(
+                    f"Imported {inserted} rows into {table} "
+                    f"({duplicates} duplicates, {invalid} invalid skipped)"))
+            self.import_worker.start()
+        except Exception as e:
+            logger.error(f"Error starting import: {e}", exc_info=True)
+
+    def export_group(self) -> None:
+        """
+        Adds the 'Export Exams…' action to the Data menu, after 'Import Exams…'.
+
+        The chosen table is written to CSV or JSON Lines (optionally .gz) by an
+        ExportWorker on its own read-only connection, so the window stays responsive.
+
+        Returns:
+            None
+        """
+        self.actionExport = QAction("Export Exams…", self)
+        self.actionExport.setObjectName("actionExport")
+        self.actionExport.triggered.connect(self.export_exams)
+        self.menuData.insertAction(self.actionDelete, self.actionExport)
+
+    def export_exams(self) -> None:
+        """
+        Asks which exam to export and where to, then starts exporting it in the background.
+
+        The exam of the showing page is offered first.
+
+        Returns:
+            None
+        """
+        try:
+            if self.export_worker is not None and self.export_worker.isRunning():
+                logger.info("An export is already running")
+                return
+            tables = {'Beck': 'beck_table', 'Altman': 'altman_table'}
+            showing_altman = self.stackedWidget.currentWidget() in (self.altmanPage, self.altmanDataPage)
+            exam, ok = QtWidgets.QInputDialog.getItem(
+                self, "Export Exams", "Exam:", list(tables), 1 if showing_altman else 0, False)
+            if not ok:
+                return
+            path, _ = QtWidgets.QFileDialog.getSaveFileName(
+                self, "Export Exams", f"{tables[exam]}.csv",
+                "CSV (*.csv *.csv.gz);;JSON Lines (*.jsonl *.jsonl.gz)")
+            if not path:
+                return
+            self.start_export(tables[exam], path)
+        except Exception as e:
+            logger.error(f"Error starting export: {e}", exc_info=True)
+
+    def start_export(self, table: str, path: str) -> None:
+        """
+        Exports a table of the open patient's shard to a file in the background.
+
+        Args:
+            table (str): The exam table.
+            path (str): The target file; its extension selects the format.
+
+        Returns:
+            None
+        """
+        try:
+            if self.export_worker is not None and self.export_worker.isRunning():
+                logger.info("An export is already running")
+                return
+            self.export_worker = ExportWorker(table, path, db_name=self.patient.shard)
+            self.export_worker.exported.connect(
+                lambda exported_path, written: logger.info(f"Exported {written} rows to {exported_path}"))
+            self.export_worker.start()
+        except Exception as e:
+            logger.error(f"Error starting export: {e}", exc_info=True)
+
+    def trends_group(self) -> None:
+        """
+        Adds the 'Exam Trends…' action to the Data menu, after 'Export Exams…'.
+
+        Returns:
+            None
+        """
+        self.actionTrends = QAction("Exam Trends…", self)
+        self.actionTrends.setObjectName("actionTrends")
+        self.actionTrends.triggered.connect(self.show_trends)
+        self.menuData.insertAction(self.actionDelete, self.actionTrends)
+
+    def show_trends(self) -> None:
+        """
+        Shows the rolling mean, weighted trend and item correlations of both exams, and
+        how Beck and Altman scores move together across days.
+
+        The open patient's ExamAnalytics keeps its arrays and results until a table
+        changes, so showing the trends again without new exams costs no recomputation.
+
+        Returns:
+            None
+        """
+        try:
+            if self.analytics is None:
+                # NumPy is only loaded the first time trends are asked for, not at startup.
+                from database.analytics import ExamAnalytics
+                self.analytics = ExamAnalytics(self.patient.shard)
+            lines = []
+            for exam, table in (('Beck', 'beck_table'), ('Altman', 'altman_table')):
+                overview = self.analytics.overview(table, tkc.TREND_WINDOW, tkc.TREND_ALPHA)
+                if not overview['exams']:
+                    lines.append(f"{exam}: no exams")
+                    continue
+                lines.append(f"{exam}: {overview['exams']} exams, latest {overview['latest']:g}, "
+                             f"{tkc.TREND_WINDOW}-exam mean {overview['rolling_mean']:.1f}, "
+                             f"trend {overview['trend']:.1f}")
+                if overview['items'] is not None:
+                    first, second, r = overview['items']
+                    lines.append(f"    most correlated items: {first} and {second} (r = {r:.2f})")
+            lags = {lag: r for lag, r in self.analytics.cross_correlation(tkc.TREND_MAX_LAG).items() if not math.isnan(r)}
+            if lags:
+                lag = max(lags, key=lambda day: abs(lags[day]))
+                lines.append(f"Beck and Altman: strongest at {lag:+d} days (r = {lags[lag]:.2f})")
+            QtWidgets.QMessageBox.information(self, "Exam Trends", '\n'.join(lines))
+        except Exception as e:
+            logger.error(f"Error showing exam trends: {e}", exc_info=True)
+
+    def run_command(self, command: dict) -> None:
+        """
+        Carries out a command given on the command line, or forwarded by a later launch.
+
+        The window is brought to the front, then the 'page' is shown, the 'add' exam
+        ([exam, score, ...]) is queued and the 'import' file is imported, for the keys
+        present.
+
+        Args:
+            command (dict): The command from single_instance.parse_command().
+
+        Returns:
+            None
+        """
+        try:
+            if self.isMinimized():
+                self.showNormal()
+            self.show()
+            self.raise_()
+            self.activateWindow()
+            page = self.command_pages.get(command.get('page'))
+            if page is not None:
+                page()
+            if command.get('add'):
+                exam, *scores = command['add']
+                self.quick_add(exam, scores)
+            if command.get('import'):
+                self.start_import(command['import'])
+        except Exception as e:
+            logger.error(f"Error running command {command}: {e}", exc_info=True)
+
+    def quick_add(self, exam: str, scores: list) -> None:
+        """
+        Queues an exam given as item scores, dated now, without touching the exam pages.
+
+        Args:
+            exam (str): 'beck' or 'altman'.
+            scores (list): The item scores in column order.
+
+        Returns:
+            None
+        """
+        table = f"{exam}_table"
+        columns = TABLE_COLUMNS[table]
+        items = columns[2:-1]
+        if len(scores) != len(items):
+            logger.error(f"Quick-add {exam} takes {len(items)} scores, got {len(scores)}")
+            return
+        now = datetime.datetime.now()
+        record = dict(zip(items, scores))
+        record[columns[0]] = now.strftime('%Y-%m-%d')
+        record[columns[1]] = now.strftime('%H:%M:%S')
+        try:
+            _, row = validate_record(table, record)
+        except ImportRowError as e:
+            logger.error(f"Quick-add {exam} rejected: {e}")
+            return
+        insert = self.db_writer.insert_beck if table == 'beck_table' else self.db_writer.insert_altman
+        insert(*row)
+
+    def patient_group(self) -> None:
+        """
+        Adds the Patient menu with the 'Switch Patient…' and 'New Patient…' actions.
+
+        Returns:
+            None
+        """
+        self.menuPatient = QtWidgets.QMenu("Patient", parent=self.menubar)
+        self.menuPatient.setObjectName("menuPatient")
+        self.actionSwitchPatient = QAction("Switch Patient…", self)
+        self.actionSwitchPatient.setObjectName("actionSwitchPatient")
+        self.actionSwitchPatient.setShortcut("Ctrl+Shift+P")
+        self.actionSwitchPatient.triggered.connect(self.choose_patient)
+        self.actionNewPatient = QAction("New Patient…", self)
+        self.actionNewPatient.setObjectName("actionNewPatient")
+        self.actionNewPatient.triggered.connect(self.new_patient)
+        self.menuPatient.addAction(self.actionSwitchPatient)
+        self.menuPatient.addAction(self.actionNewPatient)
+        self.menubar.addAction(self.menuPatient.menuAction())
+
+    def restore_patient(self) -> Patient:
+        """
+        Returns the patient that was open when the app last closed.
+
+        Falls back to the most recently opened patient in the registry, and to the
+        pre-registry database if the registry cannot be read.
+
+        Returns:
+            Patient: The patient to open.
+        """
+        try:
+            stored = self.settings.value("patient")
+            patient = self.patient_registry.get(int(stored)) if stored is not None else None
+            if patient is None:
+                patients = self.patient_registry.patients()
+                patient = patients[0] if patients else None
+            if patient is not None:
+                return patient
+        except Exception as e:
+            logger.error(f"Error restoring the open patient: {e}", exc_info=True)
+        return Patient(0, tkc.DEFAULT_PATIENT_NAME, target_db_path)
+
+    def open_patient(self, patient: Patient) -> None:
+        """
+        Opens a patient's shard: migrates it and starts its background writer.
+
+        Every patient gets a fresh DataNotifier, so change notifications still queued
+        from the previous patient's writer never reach the new patient's models.
+
+        Args:
+            patient (Patient): The patient to open.
+
+        Returns:
+            None
+        """
+        self.patient = patient
+        self.db_manager = DataManager(patient.shard)
+        self.db_manager.notifier.rowsDeleted.connect(self.remember_deleted)
+        self.db_writer = DatabaseWriter(patient.shard, notifier=self.db_manager.notifier)
+        self.db_writer.start()
+        if patient.id:
+            self.patient_registry.touch(patient.id)
+            self.settings.setValue("patient", patient.id)
+        self.setWindowTitle(f"{tkc.APPLICATION_NAME} - {patient.name}")
+
+    def close_patient(self) -> None:
+        """
+        Finishes with the open patient: stops a running import, drains the background
+        writer, checkpoints the shard and drops the table models reading it.
+
+        Returns:
+            None
+        """
+        try:
+            if self.import_worker is not None:
+                self.import_worker.requestInterruption()
+                self.import_worker.wait()
+        except Exception as e:
+            logger.error(f"error stopping import: {e}", exc_info=True)
+        try:
+            self.db_writer.stop()
+        except Exception as e:
+            logger.error(f"error stopping database writer: {e}", exc_info=True)
+        try:
+            self.db_manager.checkpoint()
+        except Exception as e:
+            logger.error(f"error checkpointing database: {e}", exc_info=True)
+        self.drop_page_models()
+        self.analytics = None
+        self.db_manager.close()
+        self.last_deleted.clear()
+        self.actionUndoDelete.setEnabled(False)
+
+    def switch_patient(self, patient: Optional[Patient]) -> None:
+        """
+        Closes the open patient and shows another one's history, without a restart.
+
+        Args:
+            patient (Optional[Patient]): The patient to show; None or the open patient
+                leaves everything as it is.
+
+        Returns:
+            None
+        """
+        if patient is None or patient.shard == self.patient.shard:
+            return
+        try:
+            self.close_patient()
+            self.open_patient(patient)
+            self.load_page_models()
+        except Exception as e:
+            logger.error(f"Error switching to patient {patient.name}: {e}", exc_info=True)
+
+    def choose_patient(self) -> None:
+        """
+        Asks which registered patient to show and switches to them.
+
+        Returns:
+            None
+        """
+        try:
+            names = [patient.name for patient in self.patient_registry.patients()]
+            current = names.index(self.patient.name) if self.patient.name in names else 0
+            name, ok = QtWidgets.QInputDialog.getItem(self, "Switch Patient", "Patient:", names, current, False)
+            if ok:
+                self.switch_patient(self.patient_registry.find(name))
+        except Exception as e:
+            logger.error(f"Error choosing a patient: {e}", exc_info=True)
+
+    def new_patient(self) -> None:
+        """
+        Asks for a name, registers the patient with a new shard and switches to them.
+
+        An existing name switches to that patient instead.
+
+        Returns:
+            None
+        """
+        try:
+            name, ok = QtWidgets.QInputDialog.getText(self, "New Patient", "Name:")
+            if not ok or not name.strip():
+                return
+            patient = self.patient_registry.find(name.strip()) or self.patient_registry.add(name)
+            if patient is None:
+                logger.error(f"Error registering patient {name}")
+                return
+            self.switch_patient(patient)
+        except Exception as e:
+            logger.error(f"Error adding a patient: {e}", exc_info=True)
+
     def setup_models(self) -> None:
         """
         Set up the models for the main window.
 
-        This method creates and sets the becks_model using the altman_table.
+        The becks_model reads the beck_table and the altmans_model the altman_table, both
+        following the db_manager's change notifications. With tkc.LAZY_DATA_PAGES each
+        model is only created, and its first page selected, when its data page is first
+        shown; otherwise both are created here.
 
         Returns:
             None
         """
-        self.becks_model = create_and_set_model(
-            "beck_table",
-            self.beck_tableview
-        )
-        self.altmans_model = create_and_set_model(
-            "altman_table",
-            self.altmans_manic_rating_table
-        )
-        
+        self.data_page_models = {
+            self.beckDataPage: ('becks_model', 'beck_table', self.beck_tableview),
+            self.altmanDataPage: ('altmans_model', 'altman_table', self.altmans_manic_rating_table),
+        }
+        if tkc.LAZY_DATA_PAGES:
+            self.stackedWidget.currentChanged.connect(self.ensure_page_model)
+        else:
+            self.load_page_models()
+
+    def load_page_models(self) -> None:
+        """
+        Creates the models that should exist now: the showing data page's with
+        tkc.LAZY_DATA_PAGES, both otherwise.
+
+        Returns:
+            None
+        """
+        pages = [self.stackedWidget.currentWidget()] if tkc.LAZY_DATA_PAGES else list(self.data_page_models)
+        for page in pages:
+            self.ensure_page_model(self.stackedWidget.indexOf(page))
+
+    def drop_page_models(self) -> None:
+        """
+        Detaches and drops both table models, e.g. before the patient changes.
+
+        Returns:
+            None
+        """
+        for attribute, _, view in self.data_page_models.values():
+            if getattr(self, attribute) is not None:
+                view.setModel(None)
+                setattr(self, attribute, None)
+
+    def ensure_page_model(self, index: int) -> None:
+        """
+        Creates the model of a data page if the page has none yet.
+
+        Args:
+            index (int): The index of the page in the stackedWidget.
+
+        Returns:
+            None
+        """
+        entry = self.data_page_models.get(self.stackedWidget.widget(index))
+        if entry is None or getattr(self, entry[0]) is not None:
+            return
+        attribute, table, view = entry
+        try:
+            setattr(self, attribute, create_and_set_model(table, view, notifier=self.db_manager.notifier,
+                                                          db_name=self.patient.shard))
+        except Exception as e:
+            logger.error(f"Error creating the {table} model: {e}", exc_info=True)
+
     def save_state(self):
             """
             Saves the window geometry state and window state.
@@ -479,7 +1050,8 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
             """
             Event handler for the close event of the window.
 
-            Saves the state before closing the window.
+            Saves the state, cancels a running export, drains the background writer and checkpoints the
+            patient's database before closing the window.
 
             Args:
                 event (QCloseEvent): The close event object.
@@ -491,3 +1063,13 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
                 self.save_state()
             except Exception as e:
                 logger.error(f"error saving state during closure: {e}", exc_info=True)
+            try:
+                if self.export_worker is not None:
+                    self.export_worker.requestInterruption()
+                    self.export_worker.wait()
+            except Exception as e:
+                logger.error(f"error stopping export during closure: {e}", exc_info=True)
+            try:
+                self.close_patient()
+            except Exception as e:
+                logger.error(f"error closing the patient during closure: {e}", exc_info=True)
@@ -0,0 +1,166 @@
+import argparse
+import hashlib
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtNetwork import QAbstractSocket, QLocalServer, QLocalSocket
+
+import tracker_config as tkc
+from logger_setup import logger
+
+PAGES = ('beck', 'altman', 'beck-data', 'altman-data')
+EXAMS = ('beck', 'altman')
+
+
+def server_name() -> str:
+    """
+    Returns the local socket name of the running instance of this user's app.
+
+    The name is derived from the home directory, so every user (and every HOME the
+    app is started with) gets its own instance.
+
+    Returns:
+        str: The QLocalServer name.
+    """
+    home = os.path.abspath(os.path.expanduser('~')).encode('utf-8')
+    return f"{tkc.APPLICATION_NAME}-{hashlib.sha1(home).hexdigest()[:12]}"
+
+
+def parse_command(argv: List[str]) -> Dict[str, Any]:
+    """
+    Reads the command a launch was given from its arguments.
+
+    Arguments Qt understands (e.g. -style) are left alone.
+
+    Args:
+        argv (List[str]): The arguments, without the program name.
+
+    Returns:
+        Dict[str, Any]: The command: 'page', 'add' ([exam, score, ...]) and 'import'
+            keys for the options given; empty for a plain launch.
+    """
+    parser = argparse.ArgumentParser(prog='main.py', description="Beck and Altman exams.")
+    parser.add_argument('--page', choices=PAGES, help="page to show")
+    parser.add_argument('--add', nargs='+', metavar='ARG',
+                        help="quick-add an exam: beck|altman followed by the item scores in column order")
+    parser.add_argument('--import', dest='import_path', metavar='PATH', help="import exams from a file")
+    args, _ = parser.parse_known_args(argv)
+    if args.add is not None and args.add[0] not in EXAMS:
+        parser.error(f"--add takes {' or '.join(EXAMS)} first, got {args.add[0]}")
+    command: Dict[str, Any] = {}
+    if args.page is not None:
+        command['page'] = args.page
+    if args.add is not None:
+        command['add'] = args.add
+    if args.import_path is not None:
+        command['import'] = os.path.abspath(args.import_path)
+    return command
+
+
+def forward_command(command: Dict[str, Any], timeout: int = tkc.INSTANCE_TIMEOUT_MS) -> bool:
+    """
+    Hands a command to the running instance, if there is one.
+
+    Only QtCore and QtNetwork are needed, so a second launch exits without building
+    a QApplication or any window.
+
+    Args:
+        command (Dict[str, Any]): The command from parse_command().
+        timeout (int): Milliseconds to wait for each step of the exchange.
+
+    Returns:
+        bool: True if an instance is running and acknowledged the command.
+    """
+    socket = QLocalSocket()
+    socket.connectToServer(server_name())
+    if not socket.waitForConnected(timeout):
+        return False
+    socket.write(json.dumps(command).encode('utf-8') + b'\n')
+    acknowledged = socket.waitForBytesWritten(timeout) and socket.waitForReadyRead(timeout)
+    socket.disconnectFromServer()
+    return acknowledged
+
+
+class InstanceServer(QObject):
+    """
+    Listens for commands from later launches and hands them to the running window.
+
+    Each launch connects, sends its command as one JSON line and waits for an
+    acknowledgement before exiting. The socket only accepts connections from the
+    same user.
+
+    Signals:
+        commandReceived (dict): A command forwarded by another launch.
+    """
+    commandReceived = pyqtSignal(dict)
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self.server = QLocalServer(self)
+        self.server.setSocketOptions(QLocalServer.SocketOption.UserAccessOption)
+        self.server.newConnection.connect(self.accept)
+
+    def listen(self, name: Optional[str] = None) -> bool:
+        """
+        Starts listening under the instance name.
+
+        A socket file left behind by an instance that crashed is removed first; one
+        that still answers belongs to another instance and is left alone.
+
+        Args:
+            name (Optional[str]): The server name; server_name() if omitted.
+
+        Returns:
+            bool: True if this process is now the instance later launches talk to.
+        """
+        name = name or server_name()
+        if self.server.listen(name):
+            return True
+        if self.server.serverError() == QAbstractSocket.SocketError.AddressInUseError:
+            probe = QLocalSocket()
+            probe.connectToServer(name)
+            if not probe.waitForConnected(tkc.INSTANCE_TIMEOUT_MS):
+                QLocalServer.removeServer(name)
+                if self.server.listen(name):
+                    return True
+            probe.abort()
+        logger.error(f"Error listening for other launches on {name}: {self.server.errorString()}")
+        return False
+
+    def accept(self) -> None:
+        """
+        Reads the pending connections.
+
+        Returns:
+            None
+        """
+        while self.server.hasPendingConnections():
+            socket = self.server.nextPendingConnection()
+            socket.readyRead.connect(lambda connection=socket: self.read(connection))
+            socket.disconnected.connect(socket.deleteLater)
+
+    def read(self, socket: QLocalSocket) -> None:
+        """
+        Acknowledges a complete command line and emits it.
+
+        Args:
+            socket (QLocalSocket): The connection of the launch.
+
+        Returns:
+            None
+        """
+        if not socket.canReadLine():
+            return
+        line = bytes(socket.readLine()).decode('utf-8', errors='replace')
+        socket.write(b'ok\n')
+        socket.flush()
+        try:
+            command = json.loads(line)
+            if not isinstance(command, dict):
+                raise ValueError("not an object")
+        except ValueError as e:
+            logger.error(f"Error reading forwarded command {line!r}: {e}")
+            return
+        self.commandReceived.emit(command)
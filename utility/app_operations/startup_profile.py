@@ -0,0 +1,69 @@
+import logging
+import time
+from typing import List, Tuple
+
+import tracker_config as tkc
+from logger_setup import logger
+
+# A child of the app logger with its own level, so the timings reach the log file
+# even though the app logger only passes errors.
+startup_logger: logging.Logger = logger.getChild('startup')
+startup_logger.setLevel(logging.INFO if tkc.STARTUP_PROFILE else logging.ERROR)
+
+
+class StartupProfiler:
+    """
+    Records how long each phase of the application start takes.
+
+    Phases are closed with mark(); each one lasts from the previous mark (or the
+    profiler's creation) to the call. finish() writes every phase and the total to
+    the log once.
+
+    Attributes:
+        started (float): The perf_counter value the profiler was created at.
+        phases (List[Tuple[str, float]]): The closed phases and their durations in seconds.
+    """
+
+    def __init__(self) -> None:
+        self.started: float = time.perf_counter()
+        self.last: float = self.started
+        self.phases: List[Tuple[str, float]] = []
+        self.finished: bool = False
+
+    def mark(self, phase: str) -> None:
+        """
+        Closes the current phase.
+
+        Args:
+            phase (str): The name of the phase that just ended.
+
+        Returns:
+            None
+        """
+        now = time.perf_counter()
+        self.phases.append((phase, now - self.last))
+        self.last = now
+
+    def finish(self, phase: str = 'first frame') -> None:
+        """
+        Closes the last phase and writes the timings to the log.
+
+        Later calls do nothing, so it is safe to call from a slot that can fire twice.
+
+        Args:
+            phase (str): The name of the last phase.
+
+        Returns:
+            None
+        """
+        if self.finished:
+            return
+        self.finished = True
+        self.mark(phase)
+        for name, seconds in self.phases:
+            startup_logger.info(f"startup {name}: {seconds * 1000:.1f} ms")
+        startup_logger.info(f"startup total: {(self.last - self.started) * 1000:.1f} ms")
+
+
+# Created when this module is first imported, which main.py does before anything heavy.
+startup_profiler: StartupProfiler = StartupProfiler()
@@ -0,0 +1,79 @@
+from typing import Dict, Iterable
+
+from PyQt6.QtCore import QObject, QTimer
+from PyQt6.QtWidgets import QAbstractSlider
+
+from logger_setup import logger
+
+
+class SliderSummary(QObject):
+    """
+    Keeps a summary widget at the sum of a group of sliders, repainting it at most once per event-loop pass.
+
+    The running total is updated by the delta of the slider that changed instead of
+    re-reading every slider. Publishing the total to the summary widget goes through
+    a zero-delay single-shot timer, so a drag or a programmatic reset that moves many
+    sliders in one pass coalesces into a single setValue() on the summary.
+
+    Attributes:
+        target (QAbstractSlider): The widget showing the summary.
+        total (int): The current sum of the slider values.
+    """
+
+    def __init__(self, sliders: Iterable[QAbstractSlider], target: QAbstractSlider, parent: QObject = None) -> None:
+        super().__init__(parent)
+        self.target: QAbstractSlider = target
+        self._values: Dict[QAbstractSlider, int] = {}
+        self.total: int = 0
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self.flush)
+        for slider in sliders:
+            self._values[slider] = slider.value()
+            slider.valueChanged.connect(lambda value, changed=slider: self.on_value_changed(changed, value))
+        self.recompute()
+
+    def on_value_changed(self, slider: QAbstractSlider, value: int) -> None:
+        """
+        Applies one slider's change to the running total and schedules a publish.
+
+        Args:
+            slider (QAbstractSlider): The slider that moved.
+            value (int): Its new value.
+
+        Returns:
+            None
+        """
+        self.total += value - self._values[slider]
+        self._values[slider] = value
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def flush(self) -> None:
+        """
+        Publishes the running total now if it differs from the summary widget.
+
+        Called by the timer, and before anything reads the summary widget (e.g. a commit).
+
+        Returns:
+            None
+        """
+        self._timer.stop()
+        try:
+            if self.target.value() != self.total:
+                self.target.setValue(self.total)
+        except Exception as e:
+            logger.error(f"Error updating summary {self.target.objectName()}: {e}", exc_info=True)
+
+    def recompute(self) -> None:
+        """
+        Re-reads every slider, rebuilds the total and publishes it immediately.
+
+        Returns:
+            None
+        """
+        for slider in self._values:
+            self._values[slider] = slider.value()
+        self.total = sum(self._values.values())
+        self.flush()